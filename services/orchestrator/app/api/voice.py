@@ -5,13 +5,15 @@ Simplified endpoints for voice connector integration
 
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any, List
 from datetime import datetime
+import asyncio
 import uuid
 import logging
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, AsyncSessionLocal
 from app.core.redis_client import redis_client
 from app.services.session_manager import SessionManager
 from app.services.flow_executor import FlowExecutor
@@ -48,6 +50,24 @@ class ConversationResponse(BaseModel):
     metadata: Optional[Dict[str, Any]] = {}
 
 
+class ConversationBatchRequest(BaseModel):
+    """Conversation turns of several sessions, sent together"""
+    # Bounded: every turn holds its own database session while it runs
+    requests: List[ConversationRequest] = Field(max_length=settings.CONVERSATION_BATCH_MAX)
+
+
+class ConversationBatchItem(BaseModel):
+    """Outcome of one turn in a batch"""
+    status: int = 200
+    result: Optional[ConversationResponse] = None
+    detail: Optional[str] = None
+
+
+class ConversationBatchResponse(BaseModel):
+    """Outcomes in the order of the batch requests"""
+    responses: List[ConversationBatchItem]
+
+
 @router.post("/session", response_model=SessionCreateResponse)
 async def create_session(
     request: SessionCreateRequest,
@@ -96,6 +116,49 @@ async def process_conversation(
     - Takes session_id and user_message
     - Returns bot response text
     """
+    return await _run_turn(request, db)
+
+
+@router.post("/conversation:batch", response_model=ConversationBatchResponse)
+async def process_conversation_batch(request: ConversationBatchRequest):
+    """
+    Process conversation turns of several sessions in one request
+
+    Turns run concurrently, each with its own database session, and fail
+    independently: every item carries the status the single-turn
+    endpoint would have returned. Batches larger than
+    CONVERSATION_BATCH_MAX are rejected with 422.
+    """
+    results = await asyncio.gather(
+        *(_run_batch_item(item) for item in request.requests)
+    )
+    return ConversationBatchResponse(responses=list(results))
+
+
+async def _run_batch_item(request: ConversationRequest) -> ConversationBatchItem:
+    """Run one turn of a batch in its own transaction"""
+    async with AsyncSessionLocal() as db:
+        try:
+            result = await _run_turn(request, db)
+            await db.commit()
+            return ConversationBatchItem(result=result)
+        except HTTPException as e:
+            await db.rollback()
+            return ConversationBatchItem(status=e.status_code, detail=str(e.detail))
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Voice session {request.session_id}: Commit failed: {e}")
+            return ConversationBatchItem(
+                status=500,
+                detail=f"Failed to process message: {str(e)}"
+            )
+
+
+async def _run_turn(
+    request: ConversationRequest,
+    db: AsyncSession
+) -> ConversationResponse:
+    """Run NLU and the dialogue flow for one turn"""
     session_manager = SessionManager(db, redis_client)
     nlu_client = NLUClient()
     flow_executor = FlowExecutor(db, redis_client)
@@ -48,6 +48,8 @@ class Settings(BaseSettings):
     PLATFORM_SAMPLE_RATE: int = int(os.getenv("PLATFORM_SAMPLE_RATE", "16000"))  # 16kHz for platform
     CODEC_PREFERENCE: str = os.getenv("CODEC_PREFERENCE", "PCMU")  # G.711 μ-law
     AUDIO_CHUNK_SIZE: int = int(os.getenv("AUDIO_CHUNK_SIZE", "160"))  # 20ms at 8kHz
+    AUDIO_BATCH_MAX_SIZE: int = int(os.getenv("AUDIO_BATCH_MAX_SIZE", "64"))  # Frames per batched resample
+    AUDIO_BATCH_WINDOW_MS: int = int(os.getenv("AUDIO_BATCH_WINDOW_MS", "5"))  # Wait for more frames per batch
 
     # Call Management
     MAX_CONCURRENT_CALLS: int = int(os.getenv("MAX_CONCURRENT_CALLS", "50"))
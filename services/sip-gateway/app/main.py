@@ -3,6 +3,7 @@ SIP Gateway Service - Main Application
 FastAPI application for SIP-to-Voice Connector bridging
 """
 import asyncio
+
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import JSONResponse
@@ -226,5 +227,7 @@ if __name__ == "__main__":
         app,
         host=settings.HOST,
         port=settings.PORT,
+        # uvloop where installed (Linux images), the asyncio loop elsewhere
+        loop="auto",
         log_level=settings.LOG_LEVEL.lower()
     )
@@ -2,10 +2,104 @@
 Audio Converter Service
 Handles conversion between G.711 μ-law codec and PCM, and resampling between 8kHz and 16kHz
 """
-import audioop
 import numpy as np
 from scipy import signal
-from typing import Literal
+from typing import Any, Literal, Optional, Tuple
+
+# audioop was removed from the standard library in Python 3.13
+try:
+    import audioop
+except ImportError:
+    audioop = None
+
+# Numba is optional; without it the vectorized NumPy decoder is used as-is
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _mulaw_decode(codes: np.ndarray) -> np.ndarray:
+    """
+    Decode G.711 μ-law codes to 16-bit PCM with whole-array bit operations
+
+    All samples are processed as lanes of the same arithmetic (no table
+    lookup): invert, split into sign/exponent/mantissa bitfields, then
+    rebuild the magnitude as ((mantissa << 3) + bias) << exponent - bias.
+
+    Args:
+        codes: uint8 array of μ-law encoded samples
+
+    Returns:
+        int16 array of linear PCM samples
+    """
+    inverted = ~codes
+    sign = inverted & 0x80
+    exponent = (inverted >> 4) & 0x07
+    mantissa = (inverted & 0x0F).astype(np.int32)
+
+    magnitude = ((mantissa << 3) + 0x84) << exponent
+    return np.where(sign != 0, 0x84 - magnitude, magnitude - 0x84).astype(np.int16)
+
+
+# JIT-compile when Numba is installed so LLVM can unroll the lanes into SIMD
+mulaw_decode_batch = njit(cache=True)(_mulaw_decode) if njit is not None else _mulaw_decode
+
+
+def _build_lin_to_mulaw() -> np.ndarray:
+    """
+    Build the 16-bit PCM → μ-law table (same rounding and clipping as audioop.lin2ulaw)
+
+    Returns:
+        uint8 array of 65536 μ-law codes, indexed by the sample's unsigned 16-bit pattern
+    """
+    seg_end = np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF], dtype=np.int32)
+
+    pcm = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 2  # 14-bit
+    mask = np.where(pcm < 0, 0x7F, 0xFF)
+    magnitude = np.minimum(np.abs(pcm), 8159) + 0x21
+    segment = np.searchsorted(seg_end, magnitude, side='left')
+
+    code = np.where(segment >= 8, 0x7F, (segment << 4) | ((magnitude >> (segment + 1)) & 0x0F))
+    return (code ^ mask).astype(np.uint8)
+
+
+# Built once at import and shared by every call
+_LIN_TO_MULAW = _build_lin_to_mulaw()
+
+
+def ulaw_to_pcm16(audio_data: bytes) -> bytes:
+    """
+    Convert G.711 μ-law bytes to 16-bit PCM bytes
+
+    Uses audioop when available, otherwise the vectorized batch decoder.
+
+    Args:
+        audio_data: G.711 μ-law encoded audio bytes
+
+    Returns:
+        16-bit PCM audio bytes
+    """
+    if audioop is not None:
+        return audioop.ulaw2lin(audio_data, 2)
+    return mulaw_decode_batch(np.frombuffer(audio_data, dtype=np.uint8)).tobytes()
+
+
+def pcm16_to_ulaw(audio_data: bytes) -> bytes:
+    """
+    Convert 16-bit PCM bytes to G.711 μ-law bytes
+
+    Uses audioop when available, otherwise the module-level lookup table.
+
+    Args:
+        audio_data: 16-bit PCM audio bytes
+
+    Returns:
+        G.711 μ-law encoded audio bytes
+    """
+    if audioop is not None:
+        return audioop.lin2ulaw(audio_data, 2)
+    return _LIN_TO_MULAW[np.frombuffer(audio_data, dtype=np.uint16)].tobytes()
 
 
 class AudioConverter:
@@ -15,6 +109,10 @@ class AudioConverter:
     Supports:
     - G.711 μ-law/a-law <-> 16-bit PCM conversion
     - Sample rate conversion (8kHz <-> 16kHz)
+
+    All methods are static and all tables live at module scope, so a single
+    converter is shared by every call. Streaming conversions take their
+    per-call resampler state as an argument and return the updated state.
     """
 
     @staticmethod
@@ -35,7 +133,7 @@ class AudioConverter:
         try:
             if law == 'ulaw':
                 # Convert μ-law to linear PCM (16-bit)
-                pcm_data = audioop.ulaw2lin(audio_data, 2)  # 2 bytes = 16-bit
+                pcm_data = ulaw_to_pcm16(audio_data)
             elif law == 'alaw':
                 # Convert a-law to linear PCM (16-bit)
                 pcm_data = audioop.alaw2lin(audio_data, 2)
@@ -64,7 +162,7 @@ class AudioConverter:
         try:
             if law == 'ulaw':
                 # Convert linear PCM to μ-law
-                g711_data = audioop.lin2ulaw(audio_data, 2)  # 2 bytes = 16-bit
+                g711_data = pcm16_to_ulaw(audio_data)
             elif law == 'alaw':
                 # Convert linear PCM to a-law
                 g711_data = audioop.lin2alaw(audio_data, 2)
@@ -188,6 +286,72 @@ class AudioConverter:
 
         return sip_data
 
+    @staticmethod
+    def resample_stream(
+        audio_data: bytes,
+        from_rate: int,
+        to_rate: int,
+        state: Optional[Any] = None
+    ) -> Tuple[bytes, Optional[Any]]:
+        """
+        Resample one chunk of a continuous 16-bit mono PCM stream
+
+        Uses audioop.ratecv, carrying the filter state between chunks so
+        there are no discontinuities at chunk boundaries. Falls back to the
+        stateless resample() when audioop is unavailable.
+
+        Args:
+            audio_data: 16-bit PCM audio bytes
+            from_rate: Source sample rate (Hz)
+            to_rate: Target sample rate (Hz)
+            state: State returned by the previous call for this stream (None to start)
+
+        Returns:
+            Tuple of (resampled 16-bit PCM bytes, state for the next chunk)
+        """
+        if not audio_data or from_rate == to_rate:
+            return audio_data, state
+
+        if audioop is None:
+            return AudioConverter.resample(audio_data, from_rate, to_rate), None
+
+        try:
+            return audioop.ratecv(audio_data, 2, 1, from_rate, to_rate, state)
+        except Exception as e:
+            raise ValueError(f"Failed to resample audio: {str(e)}")
+
+    @staticmethod
+    def convert_platform_to_sip_stream(
+        audio_data: bytes,
+        platform_sample_rate: int = 16000,
+        state: Optional[Any] = None
+    ) -> Tuple[bytes, Optional[Any]]:
+        """
+        Convert one chunk of a platform audio stream to SIP format
+
+        Same as convert_platform_to_sip(), but resamples with carried-over
+        per-call state (see resample_stream()).
+
+        Args:
+            audio_data: 16-bit PCM audio bytes at 16kHz or 22.05kHz
+            platform_sample_rate: Platform audio sample rate (default: 16000 Hz)
+            state: Resampler state from the previous chunk (None to start)
+
+        Returns:
+            Tuple of (G.711 μ-law encoded audio bytes at 8kHz, state for the next chunk)
+        """
+        if not audio_data:
+            return b'', state
+
+        resampled_data, state = AudioConverter.resample_stream(
+            audio_data,
+            from_rate=platform_sample_rate,
+            to_rate=8000,
+            state=state
+        )
+
+        return AudioConverter.pcm16_to_g711(resampled_data, law='ulaw'), state
+
     @staticmethod
     def get_audio_duration(audio_data: bytes, sample_rate: int, sample_width: int = 2) -> float:
         """
@@ -0,0 +1,147 @@
+"""
+Audio Ring Buffer
+Single-producer/single-consumer circular buffer over shared memory for SIP audio frames
+"""
+import asyncio
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional
+from app.core.logging_config import get_logger
+from app.services.audio_converter import ulaw_to_pcm16
+
+logger = get_logger(__name__)
+
+
+class AudioRingBuffer:
+    """
+    Fixed-slot circular buffer backed by a SharedMemory segment
+
+    The SIP side (producer) decodes G.711 μ-law straight into the next free
+    slot and the WebSocket side (consumer) reads each slot back as a
+    memoryview, so frames are never wrapped in per-packet queue items.
+
+    Head and tail are plain integers: both ends run on the same event loop,
+    so no locking is required. One slot is always kept empty to tell a full
+    ring from an empty one, and the most recently read slot is never
+    overwritten so its view stays valid while the consumer awaits a send.
+    """
+
+    SIZE = 64 * 1024  # Shared memory segment size in bytes
+    SLOT_SIZE = 320  # 20ms of PCM 16-bit at 8kHz (decoded μ-law frame)
+
+    def __init__(self, size: int = SIZE, slot_size: int = SLOT_SIZE):
+        """
+        Initialize ring buffer
+
+        Args:
+            size: Shared memory segment size in bytes
+            slot_size: Size of one slot in bytes (must be even for 16-bit PCM)
+        """
+        self.slot_size = slot_size
+        self.num_slots = size // slot_size
+        self._shm: Optional[SharedMemory] = SharedMemory(create=True, size=self.num_slots * slot_size)
+        self._lengths: List[int] = [0] * self.num_slots
+
+        self._head = 0  # Next slot to write (producer)
+        self._tail = 0  # Next slot to read (consumer)
+        self._readable = asyncio.Event()
+
+        self.dropped_frames = 0
+
+    def __len__(self) -> int:
+        """Number of slots waiting to be read"""
+        return (self._head - self._tail) % self.num_slots
+
+    @property
+    def free_slots(self) -> int:
+        """Number of slots available for writing"""
+        return self.num_slots - 2 - len(self)
+
+    def write_ulaw(self, audio_data: bytes) -> bool:
+        """
+        Decode G.711 μ-law audio into the next free slots
+
+        Packets larger than one slot are split across consecutive slots.
+
+        Args:
+            audio_data: G.711 μ-law encoded audio bytes
+
+        Returns:
+            True if the packet was written, False if the ring was full and it was dropped
+        """
+        if not audio_data or self._shm is None:
+            return False
+
+        step = self.slot_size // 2  # μ-law bytes per slot (1 byte in -> 2 bytes out)
+        slots_needed = -(-len(audio_data) // step)
+        if slots_needed > self.free_slots:
+            self.dropped_frames += 1
+            return False
+
+        buf = self._shm.buf
+        for start in range(0, len(audio_data), step):
+            pcm_data = ulaw_to_pcm16(audio_data[start:start + step])
+            offset = self._head * self.slot_size
+            buf[offset:offset + len(pcm_data)] = pcm_data
+            self._lengths[self._head] = len(pcm_data)
+            self._head = (self._head + 1) % self.num_slots
+
+        self._readable.set()
+        return True
+
+    def read(self) -> Optional[memoryview]:
+        """
+        Get the oldest unread slot as a memoryview and advance the tail
+
+        The returned view aliases the shared memory segment and stays valid
+        until the next call to read(); release it (or use it as a context
+        manager) before closing the buffer.
+
+        Returns:
+            memoryview of the slot payload, or None if the ring is empty
+        """
+        if self._head == self._tail or self._shm is None:
+            self._readable.clear()
+            return None
+
+        offset = self._tail * self.slot_size
+        view = self._shm.buf[offset:offset + self._lengths[self._tail]]
+        self._tail = (self._tail + 1) % self.num_slots
+        return view
+
+    async def wait_readable(self, timeout: float) -> bool:
+        """
+        Wait until at least one slot is available
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if data is available, False on timeout
+        """
+        if self._head != self._tail:
+            return True
+
+        self._readable.clear()
+        try:
+            await asyncio.wait_for(self._readable.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def close(self) -> None:
+        """Release and unlink the shared memory segment"""
+        if self._shm is None:
+            return
+
+        try:
+            self._shm.close()
+        except BufferError as e:
+            # A slot view is still held; the mapping is freed once it is released
+            logger.warning(f"Error releasing audio ring buffer: {str(e)}")
+        finally:
+            # Unlink regardless, so the segment never outlives the call in /dev/shm
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            self._shm = None
@@ -0,0 +1,174 @@
+"""
+Audio Conversion Scheduler
+Batches SIP → platform resampling across all concurrent calls
+"""
+import asyncio
+from math import gcd
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+from scipy import signal
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.services.audio_converter import AudioConverter
+
+logger = get_logger(__name__)
+
+# (call_id, audio_data, out, future)
+BatchItem = Tuple[str, bytes, Optional[bytearray], asyncio.Future]
+
+
+class AudioConversionScheduler:
+    """
+    Process-wide dynamic batcher for audio resampling
+
+    Every active call submits its 20ms PCM frames here instead of resampling
+    them one by one. A single worker drains whatever arrived within a short
+    window, stacks equally sized frames into a 2-D array and resamples the
+    whole batch with one polyphase filter call, amortizing the Python and
+    NumPy dispatch overhead across calls.
+    """
+
+    def __init__(
+        self,
+        from_rate: int = settings.SIP_SAMPLE_RATE,
+        to_rate: int = settings.PLATFORM_SAMPLE_RATE,
+        max_batch: int = settings.AUDIO_BATCH_MAX_SIZE,
+        batch_window_ms: int = settings.AUDIO_BATCH_WINDOW_MS
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            from_rate: Source sample rate (Hz)
+            to_rate: Target sample rate (Hz)
+            max_batch: Maximum frames resampled in one batch
+            batch_window_ms: Time to wait for more frames after the first one (ms)
+        """
+        self.from_rate = from_rate
+        self.to_rate = to_rate
+        self.max_batch = max_batch
+        self.batch_window = batch_window_ms / 1000.0
+
+        factor = gcd(from_rate, to_rate)
+        self._up = to_rate // factor
+        self._down = from_rate // factor
+
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the batching worker is running"""
+        return self._worker_task is not None and not self._worker_task.done()
+
+    async def start(self) -> None:
+        """Start the batching worker"""
+        if not self.is_running:
+            self._worker_task = asyncio.create_task(self._run())
+            logger.info(
+                f"AudioConversionScheduler started "
+                f"({self.from_rate}Hz → {self.to_rate}Hz, max batch {self.max_batch})"
+            )
+
+    async def stop(self) -> None:
+        """Stop the batching worker and fail any pending requests"""
+        if self._worker_task and not self._worker_task.done():
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+        self._worker_task = None
+
+        while not self._queue.empty():
+            _, _, _, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+
+        logger.info("AudioConversionScheduler stopped")
+
+    async def resample(
+        self,
+        call_id: str,
+        audio_data: bytes,
+        out: Optional[bytearray] = None
+    ) -> Union[bytes, bytearray]:
+        """
+        Resample one frame as part of the next batch
+
+        Args:
+            call_id: Call the frame belongs to
+            audio_data: 16-bit PCM audio at from_rate
+            out: Optional preallocated buffer; used for the result when its size matches
+
+        Returns:
+            16-bit PCM audio at to_rate (`out` itself when it was filled in place)
+        """
+        if not audio_data:
+            return b''
+
+        if not self.is_running:
+            # Scheduler not started: convert inline
+            return AudioConverter.resample(audio_data, self.from_rate, self.to_rate)
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((call_id, audio_data, out, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect frames into batches and resample them"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            self._process_batch(batch)
+
+    def _process_batch(self, batch: List[BatchItem]) -> None:
+        """
+        Resample a batch of frames, one filter call per distinct frame length
+
+        Args:
+            batch: (call_id, audio_data, out, future) tuples
+        """
+        # Frames are stacked as rows, so only equally sized frames can share a call
+        groups: Dict[int, List[BatchItem]] = {}
+        for item in batch:
+            if not item[3].done():
+                groups.setdefault(len(item[1]), []).append(item)
+
+        for items in groups.values():
+            try:
+                frames = np.frombuffer(
+                    b"".join(audio_data for _, audio_data, _, _ in items),
+                    dtype=np.int16
+                ).reshape(len(items), -1)
+
+                # Rows are filtered independently, so calls do not bleed into each other
+                resampled = signal.resample_poly(frames, self._up, self._down, axis=1)
+                resampled = np.clip(resampled, -32768, 32767).astype(np.int16)
+
+                for row, (_, _, out, future) in zip(resampled, items):
+                    if future.done():
+                        continue
+                    if out is not None and len(out) == row.nbytes:
+                        np.frombuffer(out, dtype=np.int16)[:] = row
+                        future.set_result(out)
+                    else:
+                        future.set_result(row.tobytes())
+
+            except Exception as e:
+                logger.error(f"Batch resampling failed for {len(items)} frames: {str(e)}")
+                for call_id, _, _, future in items:
+                    if not future.done():
+                        future.set_exception(ValueError(f"Failed to resample audio for call {call_id}: {str(e)}"))
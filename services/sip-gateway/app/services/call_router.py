@@ -9,6 +9,7 @@ from app.core.config import settings
 from app.core.logging_config import get_logger
 from app.models.schemas import SIPCallInfo, ESLEvent, CallMetrics
 from app.services.esl_handler import ESLHandler
+from app.services.audio_scheduler import AudioConversionScheduler
 from app.services.sip_call_bridge import SIPCallBridge
 
 logger = get_logger(__name__)
@@ -28,6 +29,7 @@ class CallRouter:
     def __init__(self):
         """Initialize call router"""
         self.esl_handler = ESLHandler()
+        self.audio_scheduler = AudioConversionScheduler()
         self.active_bridges: Dict[str, SIPCallBridge] = {}
         self.call_metrics = CallMetrics()
         self.is_running = False
@@ -50,6 +52,9 @@ class CallRouter:
                 logger.error("Failed to connect to FreeSWITCH ESL")
                 return False
 
+            # Start batched audio conversion shared by all bridges
+            await self.audio_scheduler.start()
+
             # Register event callbacks
             self.esl_handler.register_event_callback(
                 "CHANNEL_CREATE",
@@ -83,6 +88,9 @@ class CallRouter:
         for unique_id in bridge_ids:
             await self._stop_bridge(unique_id)
 
+        # Stop batched audio conversion
+        await self.audio_scheduler.stop()
+
         # Disconnect from FreeSWITCH
         await self.esl_handler.disconnect()
 
@@ -110,7 +118,8 @@ class CallRouter:
                 unique_id=event.unique_id,
                 caller_number=event.caller_number or "Unknown",
                 callee_number=event.callee_number or "Unknown",
-                esl_handler=self.esl_handler
+                esl_handler=self.esl_handler,
+                audio_scheduler=self.audio_scheduler
             )
 
             self.active_bridges[event.unique_id] = bridge
@@ -3,6 +3,7 @@ SIP Call Bridge
 Bridges SIP calls (via FreeSWITCH) to Voice Connector (WebSocket)
 """
 import asyncio
+import time
 import uuid
 from datetime import datetime
 from typing import Optional
@@ -10,6 +11,8 @@ from app.core.config import settings
 from app.core.logging_config import get_logger
 from app.models.schemas import SIPCallInfo, CallState
 from app.services.audio_converter import AudioConverter
+from app.services.audio_ring_buffer import AudioRingBuffer
+from app.services.audio_scheduler import AudioConversionScheduler
 from app.services.voice_connector_client import VoiceConnectorClient
 from app.services.esl_handler import ESLHandler
 
@@ -27,13 +30,18 @@ class SIPCallBridge:
     - Coordinates FreeSWITCH and Voice Connector
     """
 
+    # Fixed 20ms frame geometry shared by every call
+    FRAME_IN = 160  # G.711 μ-law at 8kHz (1 byte/sample)
+    FRAME_OUT = 640  # PCM 16-bit at 16kHz (2 bytes/sample)
+
     def __init__(
         self,
         sip_call_id: str,
         unique_id: str,
         caller_number: str,
         callee_number: str,
-        esl_handler: ESLHandler
+        esl_handler: ESLHandler,
+        audio_scheduler: AudioConversionScheduler
     ):
         """
         Initialize SIP call bridge
@@ -44,6 +52,7 @@ class SIPCallBridge:
             caller_number: Caller phone number
             callee_number: Called phone number
             esl_handler: Shared ESL handler instance
+            audio_scheduler: Shared batched audio conversion scheduler
         """
         self.call_id = str(uuid.uuid4())
         self.sip_call_id = sip_call_id
@@ -53,8 +62,8 @@ class SIPCallBridge:
 
         # Services
         self.esl_handler = esl_handler
+        self.audio_scheduler = audio_scheduler
         self.voice_connector = VoiceConnectorClient()
-        self.audio_converter = AudioConverter()
 
         # Call info
         self.call_info = SIPCallInfo(
@@ -69,14 +78,27 @@ class SIPCallBridge:
         self.state = CallState.CONNECTING
         self.is_running = False
 
+        # Monotonic connect time for duration tracking (wall clock kept in call_info)
+        self._connected_at_ns: Optional[int] = None
+
         # Audio streaming tasks
         self.sip_to_ws_task: Optional[asyncio.Task] = None
         self.ws_to_sip_task: Optional[asyncio.Task] = None
 
-        # Audio queues for buffering
-        self.sip_audio_queue: asyncio.Queue = asyncio.Queue(maxsize=100)
+        # Audio buffering: shared-memory ring for SIP → WS, queue for WS → SIP
+        self.sip_audio_ring = AudioRingBuffer(slot_size=self.FRAME_IN * 2)
         self.ws_audio_queue: asyncio.Queue = asyncio.Queue(maxsize=100)
 
+        # Per-call resampler state for the WS → SIP stream (AudioConverter itself is stateless)
+        self._ratecv_state_out = None
+
+        # Preallocated output frame, reused for every SIP → WS frame
+        self._out_buf = bytearray(self.FRAME_OUT)
+
+        # WS → SIP frame counters (summarized once when the stream ends, not per frame)
+        self.sip_out_frames = 0
+        self.sip_out_bytes = 0
+
         logger.info(f"SIPCallBridge created (call_id: {self.call_id}, from: {caller_number})")
 
     async def start(self) -> bool:
@@ -90,7 +112,7 @@ class SIPCallBridge:
             logger.info(f"Starting SIP call bridge {self.call_id}")
 
             # Connect to Voice Connector
-            self.voice_connector.set_on_audio_callback(self._on_voice_connector_audio)
+            self.voice_connector.set_audio_sink(self.ws_audio_queue)
             self.voice_connector.set_on_message_callback(self._on_voice_connector_message)
 
             connected = await self.voice_connector.connect()
@@ -102,6 +124,7 @@ class SIPCallBridge:
             self.state = CallState.BRIDGED
             self.call_info.state = CallState.BRIDGED
             self.call_info.connected_at = datetime.utcnow()
+            self._connected_at_ns = time.monotonic_ns()
             self.is_running = True
 
             # Start bidirectional audio streaming
@@ -141,14 +164,16 @@ class SIPCallBridge:
         # Disconnect Voice Connector
         await self.voice_connector.disconnect()
 
+        # Release shared memory
+        self.sip_audio_ring.close()
+
         # Update call info
         self.state = CallState.DISCONNECTED
         self.call_info.state = CallState.DISCONNECTED
         self.call_info.disconnected_at = datetime.utcnow()
 
-        if self.call_info.connected_at:
-            duration = (self.call_info.disconnected_at - self.call_info.connected_at).total_seconds()
-            self.call_info.duration_seconds = duration
+        if self._connected_at_ns is not None:
+            self.call_info.duration_seconds = (time.monotonic_ns() - self._connected_at_ns) / 1e9
 
         logger.info(f"SIP call bridge {self.call_id} stopped (duration: {self.call_info.duration_seconds:.1f}s)")
 
@@ -157,13 +182,21 @@ class SIPCallBridge:
         Handle incoming audio from SIP (FreeSWITCH)
 
         Args:
-            audio_data: G.711 μ-law audio at 8kHz
+            audio_data: G.711 μ-law audio at 8kHz, a whole number of 20ms frames
         """
-        try:
-            # Queue audio for processing
-            await self.sip_audio_queue.put(audio_data)
-        except asyncio.QueueFull:
-            logger.warning(f"SIP audio queue full for call {self.call_id}, dropping packet")
+        if not audio_data:
+            return
+
+        if len(audio_data) % self.FRAME_IN:
+            logger.warning(
+                f"Dropping {len(audio_data)}-byte SIP packet for call {self.call_id} "
+                f"(not a multiple of {self.FRAME_IN}-byte frames)"
+            )
+            return
+
+        # Decode straight into the ring buffer (one 20ms frame per slot)
+        if not self.sip_audio_ring.write_ulaw(audio_data):
+            logger.warning(f"SIP audio ring full for call {self.call_id}, dropping packet")
 
     async def _stream_sip_to_websocket(self) -> None:
         """Stream audio from SIP to WebSocket (inbound)"""
@@ -172,24 +205,25 @@ class SIPCallBridge:
         try:
             while self.is_running:
                 try:
-                    # Get audio from queue (with timeout)
-                    sip_audio = await asyncio.wait_for(
-                        self.sip_audio_queue.get(),
-                        timeout=1.0
-                    )
+                    # Wait for decoded audio in the ring (with timeout)
+                    if not await self.sip_audio_ring.wait_readable(timeout=1.0):
+                        # No audio available, continue
+                        continue
+
+                    # Drain every ready slot; each is a view into shared memory
+                    while (pcm_frame := self.sip_audio_ring.read()) is not None:
+                        with pcm_frame:
+                            # Resample: PCM 8kHz → PCM 16kHz, batched with other calls
+                            # (μ-law already decoded by producer)
+                            platform_audio = await self.audio_scheduler.resample(
+                                self.call_id,
+                                pcm_frame,
+                                out=self._out_buf
+                            )
+
+                            # Send to Voice Connector
+                            await self.voice_connector.send_audio(platform_audio)
 
-                    # Convert: G.711 μ-law 8kHz → PCM 16kHz
-                    platform_audio = self.audio_converter.convert_sip_to_platform(
-                        sip_audio,
-                        sip_sample_rate=settings.SIP_SAMPLE_RATE
-                    )
-
-                    # Send to Voice Connector
-                    await self.voice_connector.send_audio(platform_audio)
-
-                except asyncio.TimeoutError:
-                    # No audio available, continue
-                    continue
                 except Exception as e:
                     logger.error(f"Error in SIP → WS stream: {str(e)}")
                     await asyncio.sleep(0.1)
@@ -215,9 +249,10 @@ class SIPCallBridge:
                     )
 
                     # Convert: PCM 16kHz → G.711 μ-law 8kHz
-                    sip_audio = self.audio_converter.convert_platform_to_sip(
+                    sip_audio, self._ratecv_state_out = AudioConverter.convert_platform_to_sip_stream(
                         platform_audio,
-                        platform_sample_rate=settings.PLATFORM_SAMPLE_RATE
+                        platform_sample_rate=settings.PLATFORM_SAMPLE_RATE,
+                        state=self._ratecv_state_out
                     )
 
                     # Send to FreeSWITCH (via ESL or other mechanism)
@@ -227,7 +262,8 @@ class SIPCallBridge:
 
                     # TODO: Implement actual audio output to FreeSWITCH
                     # For now, this is a stub
-                    logger.debug(f"Would send {len(sip_audio)} bytes to SIP")
+                    self.sip_out_frames += 1
+                    self.sip_out_bytes += len(sip_audio)
 
                 except asyncio.TimeoutError:
                     # No audio available, continue
@@ -241,20 +277,10 @@ class SIPCallBridge:
         except Exception as e:
             logger.error(f"Fatal error in WS → SIP stream: {str(e)}")
         finally:
-            logger.info(f"WebSocket → SIP audio stream ended for call {self.call_id}")
-
-    async def _on_voice_connector_audio(self, audio_data: bytes) -> None:
-        """
-        Callback for audio received from Voice Connector
-
-        Args:
-            audio_data: PCM 16-bit audio at 16kHz or 22.05kHz
-        """
-        try:
-            # Queue audio for processing
-            await self.ws_audio_queue.put(audio_data)
-        except asyncio.QueueFull:
-            logger.warning(f"WebSocket audio queue full for call {self.call_id}, dropping packet")
+            logger.info(
+                f"WebSocket → SIP audio stream ended for call {self.call_id} "
+                f"({self.sip_out_frames} frames, {self.sip_out_bytes} bytes)"
+            )
 
     async def _on_voice_connector_message(self, message: dict) -> None:
         """
@@ -282,8 +308,7 @@ class SIPCallBridge:
     def get_call_info(self) -> SIPCallInfo:
         """Get current call information"""
         # Update duration if still connected
-        if self.call_info.connected_at and not self.call_info.disconnected_at:
-            duration = (datetime.utcnow() - self.call_info.connected_at).total_seconds()
-            self.call_info.duration_seconds = duration
+        if self._connected_at_ns is not None and not self.call_info.disconnected_at:
+            self.call_info.duration_seconds = (time.monotonic_ns() - self._connected_at_ns) / 1e9
 
         return self.call_info
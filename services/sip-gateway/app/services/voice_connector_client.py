@@ -36,8 +36,11 @@ class VoiceConnectorClient:
         self.is_connected = False
         self.reconnect_delay = settings.WS_RECONNECT_DELAY
 
+        # Inbound audio is written straight into this queue (no per-frame callback)
+        self.audio_sink: Optional[asyncio.Queue] = None
+        self.dropped_audio_frames = 0
+
         # Callbacks
-        self.on_audio_callback: Optional[Callable] = None
         self.on_message_callback: Optional[Callable] = None
         self.on_connect_callback: Optional[Callable] = None
         self.on_disconnect_callback: Optional[Callable] = None
@@ -63,7 +66,12 @@ class VoiceConnectorClient:
                 ws_url,
                 ping_interval=settings.WS_HEARTBEAT_INTERVAL,
                 ping_timeout=settings.WS_TIMEOUT,
-                close_timeout=10
+                close_timeout=10,
+                max_size=1 << 20,  # 1 MiB per message
+                max_queue=256,  # Inbound frames buffered before backpressure
+                read_limit=1 << 20,  # Larger TCP read batches, fewer recv() calls
+                write_limit=1 << 20,
+                compression=None  # PCM is incompressible; skip permessage-deflate CPU cost
             )
 
             self.is_connected = True
@@ -119,6 +127,9 @@ class VoiceConnectorClient:
             except asyncio.CancelledError:
                 pass
 
+        if self.dropped_audio_frames:
+            logger.warning(f"Dropped {self.dropped_audio_frames} inbound audio frames (audio sink full)")
+
         # Close WebSocket
         if self.websocket:
             try:
@@ -186,8 +197,11 @@ class VoiceConnectorClient:
 
                     # Handle binary audio
                     if isinstance(message, bytes):
-                        if self.on_audio_callback:
-                            await self.on_audio_callback(message)
+                        if self.audio_sink is not None:
+                            try:
+                                self.audio_sink.put_nowait(message)
+                            except asyncio.QueueFull:
+                                self.dropped_audio_frames += 1
 
                     # Handle JSON messages
                     elif isinstance(message, str):
@@ -233,9 +247,9 @@ class VoiceConnectorClient:
         except Exception as e:
             logger.error(f"Heartbeat loop error: {str(e)}")
 
-    def set_on_audio_callback(self, callback: Callable) -> None:
-        """Set callback for received audio"""
-        self.on_audio_callback = callback
+    def set_audio_sink(self, queue: asyncio.Queue) -> None:
+        """Set queue that received audio frames are written to (dropped when full)"""
+        self.audio_sink = queue
 
     def set_on_message_callback(self, callback: Callable) -> None:
         """Set callback for received messages"""
@@ -0,0 +1,47 @@
+"""
+Tests for the G.711 μ-law conversion used when audioop is unavailable
+"""
+import numpy as np
+import pytest
+from app.services import audio_converter
+from app.services.audio_converter import AudioConverter, mulaw_decode_batch
+
+# Reference implementation; removed from the standard library in Python 3.13
+audioop = pytest.importorskip("audioop")
+
+ALL_CODES = bytes(range(256))
+
+
+def test_decoder_matches_audioop_for_every_code():
+    decoded = mulaw_decode_batch(np.frombuffer(ALL_CODES, dtype=np.uint8))
+
+    assert decoded.dtype == np.int16
+    assert decoded.tobytes() == audioop.ulaw2lin(ALL_CODES, 2)
+
+
+def test_ulaw_to_pcm16_falls_back_to_decoder(monkeypatch):
+    monkeypatch.setattr(audio_converter, "audioop", None)
+
+    assert audio_converter.ulaw_to_pcm16(ALL_CODES) == audioop.ulaw2lin(ALL_CODES, 2)
+
+
+def test_encoder_table_matches_audioop_for_every_sample(monkeypatch):
+    pcm = np.arange(-32768, 32768, dtype=np.int16).tobytes()
+    monkeypatch.setattr(audio_converter, "audioop", None)
+
+    assert audio_converter.pcm16_to_ulaw(pcm) == audioop.lin2ulaw(pcm, 2)
+
+
+def test_stream_conversion_carries_state_between_chunks():
+    """Chunked conversion through the shared converter equals converting the whole stream"""
+    t = np.arange(1600) / 16000
+    pcm = (np.sin(2 * np.pi * 440 * t) * 8000).astype(np.int16).tobytes()
+
+    state = None
+    chunked = b""
+    for start in range(0, len(pcm), 320):
+        ulaw, state = AudioConverter.convert_platform_to_sip_stream(pcm[start:start + 320], state=state)
+        chunked += ulaw
+
+    whole, _ = AudioConverter.convert_platform_to_sip_stream(pcm)
+    assert chunked == whole
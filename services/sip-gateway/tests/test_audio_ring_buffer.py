@@ -0,0 +1,72 @@
+"""
+Tests for the shared-memory audio ring buffer
+"""
+import asyncio
+from multiprocessing.shared_memory import SharedMemory
+import pytest
+from app.services.audio_converter import ulaw_to_pcm16
+from app.services.audio_ring_buffer import AudioRingBuffer
+
+
+@pytest.fixture
+def ring():
+    """Ring with 4 slots of 8 bytes (4 μ-law bytes each)"""
+    buffer = AudioRingBuffer(size=32, slot_size=8)
+    yield buffer
+    buffer.close()
+
+
+def test_read_returns_decoded_frames_in_order(ring):
+    assert ring.write_ulaw(b"\x00\x10\x20\x30")
+    assert ring.write_ulaw(b"\x40\x50")
+
+    assert bytes(ring.read()) == ulaw_to_pcm16(b"\x00\x10\x20\x30")
+    assert bytes(ring.read()) == ulaw_to_pcm16(b"\x40\x50")
+    assert ring.read() is None
+
+
+def test_large_packet_is_split_across_slots(ring):
+    assert ring.write_ulaw(b"\x01" * 6)
+    assert len(ring) == 2
+    assert len(ring.read()) == 8
+    assert len(ring.read()) == 4
+
+
+def test_full_ring_drops_packets(ring):
+    # One slot stays empty and one is kept for the last read view
+    assert ring.free_slots == 2
+    assert ring.write_ulaw(b"\x01" * 8)
+    assert not ring.write_ulaw(b"\x02")
+    assert ring.dropped_frames == 1
+
+
+def test_wraps_around(ring):
+    for value in range(10):
+        assert ring.write_ulaw(bytes([value]))
+        assert bytes(ring.read()) == ulaw_to_pcm16(bytes([value]))
+    assert len(ring) == 0
+
+
+def test_wait_readable(ring):
+    async def main():
+        assert not await ring.wait_readable(timeout=0.01)
+        asyncio.get_running_loop().call_later(0.01, ring.write_ulaw, b"\x01")
+        assert await ring.wait_readable(timeout=1.0)
+
+    asyncio.run(main())
+
+
+def test_close_unlinks_segment_while_view_is_held():
+    ring = AudioRingBuffer(size=32, slot_size=8)
+    ring.write_ulaw(b"\x01")
+    view = ring.read()
+    shm = ring._shm
+
+    ring.close()
+
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=shm.name)
+    assert not ring.write_ulaw(b"\x01")
+
+    view.release()
+    shm.close()
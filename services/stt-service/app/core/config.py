@@ -1,5 +1,6 @@
 """Configuration settings for STT service."""
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Literal
 import os
@@ -22,17 +23,19 @@ class Settings(BaseSettings):
     # Whisper Model Configuration
     WHISPER_MODEL: Literal["tiny", "base", "small", "medium", "large"] = "base"
     DEVICE: Literal["auto", "cpu", "cuda"] = "auto"
-    COMPUTE_TYPE: Literal["auto", "int8", "float16", "float32"] = "auto"
+    # auto -> int8_float16 on CUDA, int8 on CPU (see README for accuracy notes)
+    COMPUTE_TYPE: Literal["auto", "int8", "int8_float16", "int8_bfloat16", "float16", "float32"] = "auto"
 
     # Audio Processing
     SAMPLE_RATE: int = 16000
     MAX_FILE_SIZE_MB: int = 25
-    SUPPORTED_FORMATS: list[str] = ["wav", "mp3", "m4a", "flac", "ogg", "webm"]
+    SUPPORTED_FORMATS: frozenset[str] = frozenset({"wav", "mp3", "m4a", "flac", "ogg", "webm"})
 
-    # Transcription Parameters
-    BEAM_SIZE: int = 5
-    BEST_OF: int = 5
-    TEMPERATURE: float = 0.0
+    # Transcription Parameters (greedy decoding by default: O(seq) instead of O(beam*seq))
+    BEAM_SIZE: int = 1
+    BEST_OF: int = 5  # Only used when beam_size > 1
+    TEMPERATURE: float = 0.0  # A single temperature disables fallback re-decoding
+    CONDITION_ON_PREVIOUS_TEXT: bool = False  # Avoids prompt growth across 30s windows
     VAD_FILTER: bool = True
     VAD_THRESHOLD: float = 0.5
 
@@ -45,16 +48,33 @@ class Settings(BaseSettings):
     DOWNLOAD_ROOT: str = "/models/stt"
 
     # Performance
+    # NUM_WORKERS x CPU_THREADS should not exceed the number of physical cores
     NUM_WORKERS: int = 1
     CPU_THREADS: int = 4
 
+    # Batched inference
+    INFERENCE_BATCH_SIZE: int = 8  # 30s windows per CTranslate2 call on CUDA (1 = disabled, needs VAD_FILTER)
+
     class Config:
         env_file = ".env"
         case_sensitive = True
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance (environment is read only once)."""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
+
+# OpenMP/MKL/OpenBLAS size their thread pools when first loaded, so pin them
+# before numpy or CTranslate2 are imported to avoid oversubscribing cores.
+# CTranslate2 already parallelizes with CPU_THREADS; BLAS calls stay single-threaded.
+os.environ.setdefault("OMP_NUM_THREADS", str(settings.CPU_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(settings.CPU_THREADS))
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
 
 # Create temp directory if it doesn't exist
 os.makedirs(settings.TEMP_DIR, exist_ok=True)
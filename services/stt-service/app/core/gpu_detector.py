@@ -1,9 +1,14 @@
 """GPU detection utility for automatic device selection."""
 
 import logging
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Results are computed once per process; each query goes through the CUDA runtime
+_DEVICE: Optional[tuple[str, str]] = None
+_INFO: Optional[dict] = None
+
 
 def detect_device() -> tuple[str, str]:
     """
@@ -12,16 +17,25 @@ def detect_device() -> tuple[str, str]:
     Returns:
         tuple: (device, compute_type)
             - device: "cuda" if GPU available, "cpu" otherwise
-            - compute_type: "float16" for GPU, "int8" for CPU
+            - compute_type: "int8_float16" for GPU, "int8" for CPU
     """
+    global _DEVICE
+
+    if _DEVICE is None:
+        _DEVICE = _detect_device()
+    return _DEVICE
+
+
+def _detect_device() -> tuple[str, str]:
+    """Probe CUDA availability (uncached)."""
     try:
         import torch
 
         if torch.cuda.is_available():
             gpu_name = torch.cuda.get_device_name(0)
             logger.info(f"GPU detected: {gpu_name}")
-            logger.info("Using CUDA device with float16 precision")
-            return "cuda", "float16"
+            logger.info("Using CUDA device with int8_float16 precision")
+            return "cuda", "int8_float16"
         else:
             logger.info("No GPU detected, using CPU")
             logger.info("Using CPU device with int8 precision")
@@ -42,6 +56,15 @@ def get_device_info() -> dict:
     Returns:
         dict: Device information including name, type, memory, etc.
     """
+    global _INFO
+
+    if _INFO is None:
+        _INFO = _get_device_info()
+    return _INFO
+
+
+def _get_device_info() -> dict:
+    """Query device properties (uncached)."""
     try:
         import torch
 
@@ -52,7 +75,7 @@ def get_device_info() -> dict:
                 "device_count": torch.cuda.device_count(),
                 "memory_total_gb": round(torch.cuda.get_device_properties(0).total_memory / 1024**3, 2),
                 "cuda_version": torch.version.cuda,
-                "compute_type": "float16"
+                "compute_type": "int8_float16"
             }
         else:
             return {
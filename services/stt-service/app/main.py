@@ -1,8 +1,9 @@
 """FastAPI application for STT (Speech-to-Text) service."""
 
 import logging
+
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional
 
@@ -118,11 +119,13 @@ async def health_check():
     tags=["Transcription"]
 )
 async def transcribe_audio(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="Audio file to transcribe"),
     language: Optional[str] = Form(default=None, description="Language code (e.g., 'en', 'es', 'fr')"),
     task: str = Form(default="transcribe", description="Task: 'transcribe' or 'translate'"),
-    beam_size: int = Form(default=5, description="Beam size for decoding (1-10)"),
-    temperature: float = Form(default=0.0, description="Temperature for sampling (0.0-1.0)")
+    beam_size: int = Form(default=settings.BEAM_SIZE, description="Beam size for decoding (1-10, 1 = greedy)"),
+    temperature: float = Form(default=0.0, description="Temperature for sampling (0.0-1.0)"),
+    return_segments: bool = Form(default=True, description="Include segments with timestamps in the response")
 ):
     """
     Transcribe audio file to text.
@@ -160,7 +163,9 @@ async def transcribe_audio(
             language=language,
             task=task,
             beam_size=beam_size,
-            temperature=temperature
+            temperature=temperature,
+            return_segments=return_segments,
+            background_tasks=background_tasks
         )
 
         return result
@@ -200,6 +205,8 @@ if __name__ == "__main__":
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
+        # uvloop where installed (Linux images), the asyncio loop elsewhere
+        loop="auto",
         reload=settings.RELOAD,
         log_level=settings.LOG_LEVEL.lower()
     )
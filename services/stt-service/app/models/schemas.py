@@ -8,7 +8,7 @@ class TranscribeRequest(BaseModel):
     """Request model for transcription (form data)."""
     language: Optional[str] = Field(default="en", description="Language code (e.g., 'en', 'es', 'fr')")
     task: Optional[str] = Field(default="transcribe", description="Task: 'transcribe' or 'translate'")
-    beam_size: Optional[int] = Field(default=5, description="Beam size for decoding")
+    beam_size: Optional[int] = Field(default=1, description="Beam size for decoding (1 = greedy)")
     temperature: Optional[float] = Field(default=0.0, description="Temperature for sampling")
 
 
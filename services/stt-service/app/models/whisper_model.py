@@ -1,13 +1,24 @@
 """Whisper model loader and manager (Singleton)."""
 
 import logging
-from typing import Optional
-from faster_whisper import WhisperModel
+from typing import Optional, Union
+import numpy as np
 from app.core.config import settings
+from faster_whisper import WhisperModel
 from app.core.gpu_detector import detect_device
 
+# Batched pipeline is only available in faster-whisper >= 1.1
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:
+    BatchedInferencePipeline = None
+
 logger = logging.getLogger(__name__)
 
+# faster-whisper treats ndarray input as mono float32 at this rate and feeds it to
+# the feature extractor as-is (no decode_audio/resample pass)
+WHISPER_SAMPLE_RATE = 16000
+
 
 class WhisperModelManager:
     """
@@ -17,6 +28,7 @@ class WhisperModelManager:
 
     _instance: Optional["WhisperModelManager"] = None
     _model: Optional[WhisperModel] = None
+    _batched_model = None
     _device: Optional[str] = None
     _compute_type: Optional[str] = None
 
@@ -41,7 +53,7 @@ class WhisperModelManager:
                 self._device = settings.DEVICE
                 self._compute_type = (
                     settings.COMPUTE_TYPE if settings.COMPUTE_TYPE != "auto"
-                    else ("float16" if settings.DEVICE == "cuda" else "int8")
+                    else ("int8_float16" if settings.DEVICE == "cuda" else "int8")
                 )
 
             logger.info(f"Loading Whisper model: {settings.WHISPER_MODEL}")
@@ -59,10 +71,44 @@ class WhisperModelManager:
 
             logger.info(f"Whisper model '{settings.WHISPER_MODEL}' loaded successfully")
 
+            # Batch the 30s windows of one request per decoder call on GPU (requests are
+            # not batched together); on CPU it only adds latency.
+            # The pipeline splits audio into windows with VAD, so it needs VAD_FILTER
+            if (
+                BatchedInferencePipeline is not None
+                and self._device == "cuda"
+                and settings.INFERENCE_BATCH_SIZE > 1
+                and settings.VAD_FILTER
+            ):
+                self._batched_model = BatchedInferencePipeline(model=self._model)
+                logger.info(f"Batched inference enabled (batch size {settings.INFERENCE_BATCH_SIZE})")
+
+            self.warmup()
+
         except Exception as e:
             logger.error(f"Failed to load Whisper model: {e}")
             raise RuntimeError(f"Failed to load Whisper model: {e}")
 
+    def warmup(self) -> None:
+        """
+        Run one inference on 1 second of silence.
+
+        CTranslate2 defers kernel selection and workspace/cuBLAS allocation
+        to the first transcription; doing it here keeps that cost out of
+        the first real request.
+        """
+        if self._model is None:
+            return
+
+        try:
+            silence = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32)
+            segments, _ = self._model.transcribe(silence, beam_size=1, vad_filter=False)
+            # Segments are generated lazily; consume them so decoding actually runs
+            list(segments)
+            logger.info("Whisper model warmed up")
+        except Exception as e:
+            logger.warning(f"Whisper model warmup failed: {e}")
+
     def get_model(self) -> WhisperModel:
         """
         Get the loaded Whisper model instance.
@@ -87,21 +133,21 @@ class WhisperModelManager:
 
     def transcribe(
         self,
-        audio_path: str,
+        audio: Union[str, np.ndarray],
         language: Optional[str] = None,
         task: str = "transcribe",
-        beam_size: int = 5,
+        beam_size: int = settings.BEAM_SIZE,
         temperature: float = 0.0
     ) -> tuple:
         """
-        Transcribe audio file using the loaded Whisper model.
+        Transcribe audio using the loaded Whisper model.
 
         Args:
-            audio_path: Path to audio file
+            audio: Path to audio file, or mono float32 samples at 16kHz
             language: Language code (auto-detect if None)
             task: "transcribe" or "translate"
-            beam_size: Beam size for decoding
-            temperature: Temperature for sampling
+            beam_size: Beam size for decoding (1 = greedy)
+            temperature: Temperature for sampling (single value, no fallback temperatures)
 
         Returns:
             tuple: (segments, info) from faster-whisper
@@ -109,16 +155,43 @@ class WhisperModelManager:
         if self._model is None:
             raise RuntimeError("Whisper model not loaded")
 
-        logger.info(f"Transcribing audio: {audio_path}")
-        logger.info(f"Parameters: language={language}, task={task}, beam_size={beam_size}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Transcribing audio: %s (language=%s, task=%s, beam_size=%d)",
+                f"{len(audio)} samples" if isinstance(audio, np.ndarray) else audio,
+                language, task, beam_size
+            )
+
+        if isinstance(audio, np.ndarray):
+            # No-op for decoder output; only copies if a caller passed another layout
+            audio = np.ascontiguousarray(audio, dtype=np.float32)
 
         try:
+            if self._batched_model is not None and isinstance(audio, np.ndarray):
+                segments, info = self._batched_model.transcribe(
+                    audio,
+                    language=language,
+                    task=task,
+                    beam_size=beam_size,
+                    best_of=1 if beam_size == 1 else settings.BEST_OF,
+                    temperature=temperature,
+                    condition_on_previous_text=settings.CONDITION_ON_PREVIOUS_TEXT,
+                    vad_filter=True,  # Only built with VAD_FILTER on (see load_model)
+                    vad_parameters={
+                        "threshold": settings.VAD_THRESHOLD
+                    },
+                    batch_size=settings.INFERENCE_BATCH_SIZE
+                )
+                return segments, info
+
             segments, info = self._model.transcribe(
-                audio_path,
+                audio,
                 language=language,
                 task=task,
                 beam_size=beam_size,
+                best_of=1 if beam_size == 1 else settings.BEST_OF,
                 temperature=temperature,
+                condition_on_previous_text=settings.CONDITION_ON_PREVIOUS_TEXT,
                 vad_filter=settings.VAD_FILTER,
                 vad_parameters={
                     "threshold": settings.VAD_THRESHOLD
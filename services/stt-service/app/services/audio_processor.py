@@ -1,16 +1,35 @@
-"""Audio file processing utilities using FFmpeg."""
+"""Audio file processing utilities using PyAV (in-process FFmpeg) and the FFmpeg CLI."""
 
+import asyncio
 import os
 import logging
-import uuid
-import subprocess
-from pathlib import Path
+import secrets
+import shutil
 from typing import Optional
+import aiofiles
+import av
+import numpy as np
 from fastapi import UploadFile, HTTPException
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Upload read size: bounds peak memory per request regardless of file size
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Hot-path settings bound once; settings do not change at runtime and plain
+# module globals avoid the pydantic model attribute lookup on every request
+_TEMP_DIR = os.fspath(settings.TEMP_DIR)
+_SAMPLE_RATE = settings.SAMPLE_RATE
+_MAX_FILE_SIZE_MB = settings.MAX_FILE_SIZE_MB
+_MAX_FILE_SIZE = _MAX_FILE_SIZE_MB * 1024 * 1024
+_SUPPORTED_FORMATS = frozenset(settings.SUPPORTED_FORMATS)
+
+# Linux only: uploads that are deleted after transcription are staged in an
+# unnamed inode (no directory entry to create/remove) and addressed by fd path
+_O_TMPFILE = getattr(os, "O_TMPFILE", None)
+_FD_PATH_PREFIX = "/proc/self/fd/"
+
 
 class AudioProcessor:
     """Handles audio file upload, conversion, and processing."""
@@ -25,43 +44,125 @@ class AudioProcessor:
             max_size_mb: Maximum file size in MB (uses settings default if None)
 
         Returns:
-            str: Path to saved file
+            str: Path to saved file (a /proc/self/fd path for anonymous uploads;
+                release it with cleanup_file)
 
         Raises:
             HTTPException: If file is too large or save fails
         """
-        max_size = (max_size_mb or settings.MAX_FILE_SIZE_MB) * 1024 * 1024
+        max_size = max_size_mb * 1024 * 1024 if max_size_mb else _MAX_FILE_SIZE
+        file_path = None
 
         try:
-            # Generate unique filename
-            file_ext = Path(file.filename).suffix if file.filename else ".wav"
-            unique_filename = f"{uuid.uuid4()}{file_ext}"
-            file_path = os.path.join(settings.TEMP_DIR, unique_filename)
-
-            # Read and save file
-            content = await file.read()
+            # Anonymous temp file when the upload will not outlive the request
+            fd = AudioProcessor._open_anonymous_file() if settings.CLEANUP_AFTER_TRANSCRIBE else None
+
+            if fd is not None:
+                file_path = f"{_FD_PATH_PREFIX}{fd}"
+                target = fd
+            else:
+                # Generate unique filename
+                file_ext = os.path.splitext(file.filename)[1] if file.filename else ".wav"
+                unique_filename = f"{secrets.token_hex(12)}{file_ext}"
+                file_path = target = os.path.join(_TEMP_DIR, unique_filename)
+
+            # Stream to disk in fixed-size chunks, aborting as soon as the size limit is exceeded
+            total_size = 0
+            # The anonymous fd stays open: it is the only reference to the data
+            async with aiofiles.open(target, "wb", closefd=fd is None) as f:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    total_size += len(chunk)
+                    if total_size > max_size:
+                        break
+                    await f.write(chunk)
 
             # Check file size
-            if len(content) > max_size:
+            if total_size > max_size:
+                AudioProcessor.cleanup_file(file_path)
                 raise HTTPException(
                     status_code=413,
-                    detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE_MB}MB"
+                    detail=f"File too large. Maximum size: {max_size_mb or _MAX_FILE_SIZE_MB}MB"
                 )
 
-            with open(file_path, "wb") as f:
-                f.write(content)
-
-            logger.info(f"Saved uploaded file to: {file_path} ({len(content)} bytes)")
+            logger.debug("Saved uploaded file to: %s (%d bytes)", file_path, total_size)
             return file_path
 
         except HTTPException:
             raise
         except Exception as e:
+            if file_path:
+                AudioProcessor.cleanup_file(file_path)
             logger.error(f"Failed to save uploaded file: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
+        except BaseException:
+            # Cancelled (client disconnect): an anonymous upload's fd would leak
+            if file_path:
+                AudioProcessor.cleanup_file(file_path)
+            raise
+
+    @staticmethod
+    def _open_anonymous_file() -> Optional[int]:
+        """
+        Open an unnamed, writable file in the temp directory (Linux O_TMPFILE).
+
+        Returns:
+            Optional[int]: File descriptor, or None if unsupported by the OS or filesystem
+        """
+        if _O_TMPFILE is None:
+            return None
+
+        try:
+            return os.open(_TEMP_DIR, _O_TMPFILE | os.O_RDWR, 0o600)
+        except OSError:
+            return None
 
     @staticmethod
-    def convert_to_wav(
+    def decode_to_ndarray(file_path: str, sample_rate: Optional[int] = None) -> np.ndarray:
+        """
+        Decode an audio file in-process to a mono float32 array using PyAV.
+
+        Avoids spawning ffmpeg/ffprobe and writing an intermediate WAV file;
+        the result can be passed straight to the Whisper model.
+
+        Args:
+            file_path: Path to audio file
+            sample_rate: Target sample rate (uses settings default if None)
+
+        Returns:
+            np.ndarray: Mono float32 samples in [-1.0, 1.0] at the target sample rate
+
+        Raises:
+            RuntimeError: If decoding fails
+        """
+        sample_rate = sample_rate or _SAMPLE_RATE
+
+        try:
+            resampler = av.AudioResampler(format="flt", layout="mono", rate=sample_rate)
+            chunks = []
+
+            with av.open(file_path, metadata_errors="ignore") as container:
+                stream = container.streams.audio[0]
+                for frame in container.decode(stream):
+                    for resampled in resampler.resample(frame):
+                        chunks.append(resampled.to_ndarray())
+
+                # Flush samples buffered inside the resampler
+                for resampled in resampler.resample(None):
+                    chunks.append(resampled.to_ndarray())
+
+            if not chunks:
+                return np.zeros(0, dtype=np.float32)
+
+            # Packed mono frames are shaped (1, n_samples); concatenate yields a
+            # fresh C-contiguous float32 buffer CTranslate2 can use without copying
+            return np.concatenate(chunks, axis=1, dtype=np.float32).reshape(-1)
+
+        except Exception as e:
+            logger.error(f"PyAV decoding failed: {e}")
+            raise RuntimeError(f"Audio decoding failed: {str(e)}")
+
+    @staticmethod
+    async def convert_to_wav(
         input_path: str,
         sample_rate: Optional[int] = None,
         channels: int = 1
@@ -80,11 +181,20 @@ class AudioProcessor:
         Raises:
             RuntimeError: If conversion fails
         """
-        sample_rate = sample_rate or settings.SAMPLE_RATE
+        sample_rate = sample_rate or _SAMPLE_RATE
+        staged_path = None
 
         try:
+            # ffmpeg runs in a child process and cannot see our fds: copy an
+            # anonymous upload to a named file for the duration of the conversion
+            # (linkat() through /proc is not permitted on every kernel/sandbox)
+            if input_path.startswith(_FD_PATH_PREFIX):
+                staged_path = os.path.join(_TEMP_DIR, secrets.token_hex(12))
+                await asyncio.to_thread(shutil.copyfile, input_path, staged_path)
+                input_path = staged_path
+
             # Generate output path
-            output_path = input_path.rsplit(".", 1)[0] + "_converted.wav"
+            output_path = os.path.splitext(input_path)[0] + "_converted.wav"
 
             # FFmpeg command
             cmd = [
@@ -96,28 +206,35 @@ class AudioProcessor:
                 output_path
             ]
 
-            logger.info(f"Converting audio with FFmpeg: {' '.join(cmd)}")
+            logger.debug("Converting audio with FFmpeg: %s", cmd)
 
-            # Run FFmpeg
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
+            # Run FFmpeg without blocking the event loop
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
+            _, stderr = await proc.communicate()
+
+            if proc.returncode:
+                error = stderr.decode(errors="replace")
+                logger.error(f"FFmpeg conversion failed: {error}")
+                raise RuntimeError(f"Audio conversion failed: {error}")
 
-            logger.info(f"Audio converted successfully to: {output_path}")
+            logger.debug("Audio converted successfully to: %s", output_path)
             return output_path
 
-        except subprocess.CalledProcessError as e:
-            logger.error(f"FFmpeg conversion failed: {e.stderr}")
-            raise RuntimeError(f"Audio conversion failed: {e.stderr}")
+        except RuntimeError:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error during conversion: {e}")
             raise RuntimeError(f"Audio conversion failed: {str(e)}")
+        finally:
+            if staged_path:
+                AudioProcessor.cleanup_file(staged_path)
 
     @staticmethod
-    def get_audio_duration(file_path: str) -> float:
+    async def get_audio_duration(file_path: str) -> float:
         """
         Get audio file duration using FFprobe.
 
@@ -139,15 +256,18 @@ class AudioProcessor:
                 file_path
             ]
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
+            stdout, stderr = await proc.communicate()
+
+            if proc.returncode:
+                raise RuntimeError(stderr.decode(errors="replace"))
 
-            duration = float(result.stdout.strip())
-            logger.info(f"Audio duration: {duration:.2f} seconds")
+            duration = float(stdout.strip())
+            logger.debug("Audio duration: %.2f seconds", duration)
             return duration
 
         except Exception as e:
@@ -161,12 +281,16 @@ class AudioProcessor:
         Delete a file from filesystem.
 
         Args:
-            file_path: Path to file to delete
+            file_path: Path to file to delete (for an anonymous upload, its fd is closed)
         """
         try:
-            if os.path.exists(file_path):
+            if file_path.startswith(_FD_PATH_PREFIX):
+                # Closing the last reference frees the unnamed inode
+                os.close(int(file_path[len(_FD_PATH_PREFIX):]))
+                logger.debug("Closed anonymous file: %s", file_path)
+            elif os.path.exists(file_path):
                 os.remove(file_path)
-                logger.info(f"Cleaned up file: {file_path}")
+                logger.debug("Cleaned up file: %s", file_path)
         except Exception as e:
             logger.warning(f"Failed to cleanup file {file_path}: {e}")
 
@@ -176,10 +300,11 @@ class AudioProcessor:
         Delete multiple files from filesystem.
 
         Args:
-            *file_paths: Variable number of file paths to delete
+            *file_paths: Variable number of file paths to delete (None entries are skipped)
         """
         for file_path in file_paths:
-            AudioProcessor.cleanup_file(file_path)
+            if file_path:
+                AudioProcessor.cleanup_file(file_path)
 
     @staticmethod
     def validate_audio_format(filename: str) -> bool:
@@ -195,5 +320,5 @@ class AudioProcessor:
         if not filename:
             return False
 
-        file_ext = Path(filename).suffix.lower().lstrip(".")
-        return file_ext in settings.SUPPORTED_FORMATS
+        _, dot, file_ext = filename.rpartition(".")
+        return bool(dot) and file_ext.lower() in _SUPPORTED_FORMATS
@@ -1,10 +1,11 @@
 """Core transcription service logic."""
 
+import asyncio
 import time
 import logging
 from typing import Optional, List
-from fastapi import UploadFile
-from app.models.whisper_model import model_manager
+from fastapi import BackgroundTasks, UploadFile
+from app.models.whisper_model import model_manager, WHISPER_SAMPLE_RATE
 from app.services.audio_processor import AudioProcessor
 from app.models.schemas import TranscribeResponse, Segment
 from app.core.config import settings
@@ -20,8 +21,10 @@ class TranscriptionService:
         file: UploadFile,
         language: Optional[str] = None,
         task: str = "transcribe",
-        beam_size: int = 5,
-        temperature: float = 0.0
+        beam_size: int = settings.BEAM_SIZE,
+        temperature: float = 0.0,
+        return_segments: bool = True,
+        background_tasks: Optional[BackgroundTasks] = None
     ) -> TranscribeResponse:
         """
         Transcribe an uploaded audio file.
@@ -32,6 +35,8 @@ class TranscriptionService:
             task: "transcribe" or "translate"
             beam_size: Beam size for decoding
             temperature: Temperature for sampling
+            return_segments: Include per-segment timestamps in the response
+            background_tasks: If given, temporary files are removed after the response is sent
 
         Returns:
             TranscribeResponse: Transcription result with metadata
@@ -48,62 +53,78 @@ class TranscriptionService:
             # Validate file format
             if not AudioProcessor.validate_audio_format(file.filename):
                 raise ValueError(
-                    f"Unsupported audio format. Supported formats: {', '.join(settings.SUPPORTED_FORMATS)}"
+                    f"Unsupported audio format. Supported formats: {', '.join(sorted(settings.SUPPORTED_FORMATS))}"
                 )
 
             # Step 1: Save uploaded file
-            logger.info(f"Processing file: {file.filename}")
+            logger.debug("Processing file: %s", file.filename)
             audio_path = await AudioProcessor.save_upload(file)
 
-            # Step 2: Convert to WAV if needed
-            if not audio_path.lower().endswith(".wav"):
-                logger.info("Converting audio to WAV format")
-                converted_path = AudioProcessor.convert_to_wav(audio_path)
-                transcribe_path = converted_path
-            else:
-                transcribe_path = audio_path
-
-            # Step 3: Get audio duration
-            duration = AudioProcessor.get_audio_duration(transcribe_path)
-
-            # Step 4: Transcribe using Whisper
-            logger.info("Starting transcription...")
-            segments, info = model_manager.transcribe(
-                transcribe_path,
+            # Step 2: Decode in-process to 16kHz mono float32 (no ffmpeg subprocess or temp WAV);
+            # resampling happens once here, never again inside faster-whisper.
+            # PyAV decodes synchronously, so it runs in a worker thread
+            try:
+                audio = await asyncio.to_thread(
+                    AudioProcessor.decode_to_ndarray, audio_path, WHISPER_SAMPLE_RATE
+                )
+                duration = len(audio) / WHISPER_SAMPLE_RATE
+
+                # Samples are in memory now; the upload is no longer needed
+                if settings.CLEANUP_AFTER_TRANSCRIBE:
+                    AudioProcessor.cleanup_file(audio_path)
+                    audio_path = None
+            except RuntimeError:
+                # Fall back to the FFmpeg CLI for inputs PyAV cannot decode
+                logger.debug("Converting audio to WAV format with FFmpeg")
+                converted_path = await AudioProcessor.convert_to_wav(audio_path)
+                audio = converted_path
+                duration = await AudioProcessor.get_audio_duration(converted_path)
+
+            # Step 3: Transcribe using Whisper in a worker thread; concurrent
+            # requests run in parallel on the model's NUM_WORKERS workers
+            logger.debug("Starting transcription...")
+            segments, info = await asyncio.to_thread(
+                TranscriptionService._run_model,
+                audio,
                 language=language,
                 task=task,
                 beam_size=beam_size,
                 temperature=temperature
             )
 
-            # Step 5: Process segments
-            full_text = ""
-            segment_list: List[Segment] = []
-
-            for i, segment in enumerate(segments):
-                full_text += segment.text
-                segment_list.append(
-                    Segment(
-                        id=i,
-                        start=segment.start,
-                        end=segment.end,
-                        text=segment.text.strip()
-                    )
+            # Step 4: Process segments
+            full_text = "".join(segment.text for segment in segments).strip()
+
+            # Values come from our own decoder output, so skip Pydantic validation
+            segment_list: List[Segment] = [
+                Segment.model_construct(
+                    id=i,
+                    start=segment.start,
+                    end=segment.end,
+                    text=segment.text.strip()
                 )
+                for i, segment in enumerate(segments)
+            ] if return_segments else []
 
             # Calculate processing time
             processing_time_ms = int((time.time() - start_time) * 1000)
 
-            logger.info(f"Transcription completed in {processing_time_ms}ms")
-            logger.info(f"Detected language: {info.language}")
-            logger.info(f"Text: {full_text.strip()[:100]}...")
+            # One INFO summary per request; details only at DEBUG
+            logger.info(
+                "Transcription completed in %dms (language=%s, audio=%.2fs, segments=%d)",
+                processing_time_ms, info.language, duration, len(segments)
+            )
+            logger.debug("Text: %.100s...", full_text)
 
-            # Step 6: Cleanup temporary files
+            # Step 5: Cleanup temporary files
             if settings.CLEANUP_AFTER_TRANSCRIBE:
-                AudioProcessor.cleanup_files(audio_path, converted_path)
+                if background_tasks is not None:
+                    background_tasks.add_task(AudioProcessor.cleanup_files, audio_path, converted_path)
+                else:
+                    AudioProcessor.cleanup_files(audio_path, converted_path)
 
-            return TranscribeResponse(
-                text=full_text.strip(),
+            return TranscribeResponse.model_construct(
+                text=full_text,
                 language=info.language,
                 duration=duration,
                 segments=segment_list if segment_list else None,
@@ -117,6 +138,27 @@ class TranscriptionService:
 
             logger.error(f"Transcription failed: {e}")
             raise
+        except BaseException:
+            # Cancelled (client disconnect): the upload's fd must still be closed
+            if audio_path:
+                AudioProcessor.cleanup_files(audio_path, converted_path)
+            raise
+
+    @staticmethod
+    def _run_model(audio, **options) -> tuple:
+        """
+        Transcribe and run decoding to completion (blocking).
+
+        Args:
+            audio: Path to audio file, or mono float32 samples at 16kHz
+            **options: Keyword arguments for model_manager.transcribe
+
+        Returns:
+            tuple: (list of segments, info)
+        """
+        segments, info = model_manager.transcribe(audio, **options)
+        # Segments are generated lazily; decode them here, in the worker thread
+        return list(segments), info
 
     @staticmethod
     def get_service_health() -> dict:
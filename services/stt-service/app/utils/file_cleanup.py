@@ -27,23 +27,25 @@ def cleanup_old_files(directory: str, max_age_hours: int = 1) -> int:
         current_time = time.time()
         max_age_seconds = max_age_hours * 3600
         deleted_count = 0
+        failed_count = 0
 
-        for filename in os.listdir(directory):
-            file_path = os.path.join(directory, filename)
+        # scandir caches the entry type and needs a single stat() per file for mtime
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # Skip directories
+                if entry.is_dir(follow_symlinks=False):
+                    continue
 
-            # Skip directories
-            if os.path.isdir(file_path):
-                continue
-
-            # Check file age
-            file_age = current_time - os.path.getmtime(file_path)
-            if file_age > max_age_seconds:
                 try:
-                    os.remove(file_path)
-                    deleted_count += 1
-                    logger.debug(f"Deleted old file: {file_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete {file_path}: {e}")
+                    # Check file age
+                    if current_time - entry.stat().st_mtime > max_age_seconds:
+                        os.unlink(entry.path)
+                        deleted_count += 1
+                except OSError:
+                    failed_count += 1
+
+        if failed_count > 0:
+            logger.warning(f"Failed to delete {failed_count} old files from {directory}")
 
         if deleted_count > 0:
             logger.info(f"Cleaned up {deleted_count} old files from {directory}")
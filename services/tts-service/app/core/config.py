@@ -18,9 +18,14 @@ class Settings(BaseSettings):
     PORT: int = 8003
     RELOAD: bool = True
     LOG_LEVEL: str = "INFO"
+    # Ignored when RELOAD is on; each worker runs NUM_THREADS intra-op threads, so default to cores / NUM_THREADS
+    WORKERS: int = int(os.getenv(
+        "WEB_CONCURRENCY", max(1, (os.cpu_count() or 1) // int(os.getenv("NUM_THREADS", "4")))
+    ))
 
     # TTS Model Configuration
-    TTS_MODEL: str = "tts_models/en/ljspeech/tacotron2-DDC"
+    TTS_MODEL: str = "tts_models/en/ljspeech/tacotron2-DDC"  # "piper:<voice>" loads MODEL_DIR/<voice>.onnx locally
+    TTS_DTYPE: Literal["auto", "int8", "float16", "float32"] = "auto"  # Piper weights; auto = int8 on CPU, float16 on CUDA
     DEVICE: Literal["auto", "cpu", "cuda"] = "auto"
     VOCODER_MODEL: str = ""  # Optional vocoder, empty uses default
 
@@ -46,11 +51,19 @@ class Settings(BaseSettings):
     MINIO_BUCKET: str = "tts-audio"
     MINIO_SECURE: bool = False
     AUDIO_URL_EXPIRY_HOURS: int = 24
+    UPLOAD_URL_EXPIRY_MINUTES: int = 5  # Presigned PUT URLs handed to clients that store audio themselves
 
     # File Management
     TEMP_DIR: str = "/tmp/tts-output"
     CLEANUP_AFTER_UPLOAD: bool = True
 
+    # Synthesized audio cache (identical text/voice/speed served from MinIO)
+    AUDIO_CACHE_ENABLED: bool = True
+    AUDIO_CACHE_PREFIX: str = "tts-cache/"
+    AUDIO_CACHE_MAX_ENTRIES: int = 1024  # Keys remembered in process (skips the MinIO stat)
+    PREFIX_CACHE_MAX_ENTRIES: int = 256  # Static template prefixes ("Your order number is {{...}}") kept in memory
+    TEMPLATE_CROSSFADE_MS: int = 20
+
     # Model Storage
     MODEL_DIR: str = "/models/tts"
     MODELS_PATH: str = "/models/tts"
@@ -58,6 +71,14 @@ class Settings(BaseSettings):
     # Performance
     USE_CUDA: bool = True
     NUM_THREADS: int = 4
+    MAX_CONCURRENT_CALLS: int = 16  # Worker threads for blocking synthesis/storage work
+
+    # gTTS connection reuse
+    GTTS_POOL_SIZE: int = 50  # Keep-alive connections to Google shared by all gTTS requests
+
+    # Dynamic batching of local (Piper) inference: one forward pass per batch
+    INFERENCE_MAX_BATCH: int = 8
+    INFERENCE_BATCH_WINDOW_MS: int = 15
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,40 @@
+"""Thread pool for blocking work (gTTS HTTP calls, pydub, file and MinIO I/O)."""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Shared by all requests so concurrent syntheses do not stall the event loop
+_tts_pool = ThreadPoolExecutor(
+    max_workers=settings.MAX_CONCURRENT_CALLS,
+    thread_name_prefix="tts-worker"
+)
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking function in the TTS thread pool.
+
+    Args:
+        func: Function to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The function's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_tts_pool, functools.partial(func, *args, **kwargs))
+
+
+def shutdown_pool() -> None:
+    """Wait for running jobs and release the worker threads."""
+    _tts_pool.shutdown(wait=True)
+    logger.info("TTS worker pool shut down")
@@ -1,9 +1,14 @@
 """GPU detection utility for automatic device selection."""
 
 import logging
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Results are computed once per process; each query goes through the CUDA runtime
+_DEVICE: Optional[str] = None
+_INFO: Optional[dict] = None
+
 
 def detect_device() -> str:
     """
@@ -12,6 +17,15 @@ def detect_device() -> str:
     Returns:
         str: "cuda" if GPU available, "cpu" otherwise
     """
+    global _DEVICE
+
+    if _DEVICE is None:
+        _DEVICE = _detect_device()
+    return _DEVICE
+
+
+def _detect_device() -> str:
+    """Probe CUDA availability (uncached)."""
     try:
         import torch
 
@@ -39,6 +53,15 @@ def get_device_info() -> dict:
     Returns:
         dict: Device information including name, type, memory, etc.
     """
+    global _INFO
+
+    if _INFO is None:
+        _INFO = _get_device_info()
+    return _INFO
+
+
+def _get_device_info() -> dict:
+    """Query device properties (uncached)."""
     try:
         import torch
 
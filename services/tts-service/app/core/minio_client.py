@@ -1,22 +1,76 @@
 """MinIO client for audio file storage."""
 
+import io
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import timedelta
+from typing import Dict, Optional, Tuple
+import certifi
+import urllib3
+from urllib3.util.retry import Retry
 from minio import Minio
 from minio.error import S3Error
 from app.core.config import settings
+from app.core.executor import run_blocking
+
+# Native asyncio client (aiohttp); without it the async methods use the worker pool
+try:
+    from miniopy_async import Minio as AsyncMinio
+    from miniopy_async.error import S3Error as AsyncS3Error
+except ImportError:
+    AsyncMinio = None
+    AsyncS3Error = S3Error
 
 logger = logging.getLogger(__name__)
 
+# Presigned URL cache limits
+URL_CACHE_MAX_SIZE = 4096
+URL_CACHE_TTL_FRACTION = 0.5  # Serve a cached URL for half its lifetime, so clients always get ample validity
+URL_CACHE_MIN_TTL_SECONDS = 60
+
+# Per-request settings bound once (settings do not change at runtime)
+_BUCKET = settings.MINIO_BUCKET
+_URL_EXPIRY_HOURS = settings.AUDIO_URL_EXPIRY_HOURS
+_UPLOAD_URL_EXPIRY_MINUTES = settings.UPLOAD_URL_EXPIRY_MINUTES
+
+
+def _create_http_pool() -> urllib3.PoolManager:
+    """Create the shared HTTP connection pool used for all MinIO requests."""
+    retries = Retry(
+        total=3,
+        backoff_factor=0.1,
+        status_forcelist=[500, 502, 503, 504]
+    )
+
+    if settings.MINIO_SECURE:
+        return urllib3.PoolManager(
+            num_pools=4,
+            maxsize=64,
+            block=False,
+            retries=retries,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=certifi.where()
+        )
+
+    return urllib3.PoolManager(num_pools=4, maxsize=64, block=False, retries=retries)
+
 
 class MinIOClient:
     """
     MinIO S3-compatible storage client for TTS audio files.
     Singleton pattern to reuse connection.
+
+    The connection is opened by connect() from the application lifespan,
+    so every server worker process builds its own connection pool.
     """
 
     _instance = None
     _client = None
+    _async_client = None
+    _url_cache: "OrderedDict[Tuple[str, int], Tuple[str, float]]" = OrderedDict()
+    _url_cache_lock = threading.Lock()
 
     def __new__(cls):
         """Singleton pattern - only one instance allowed."""
@@ -24,8 +78,8 @@ class MinIOClient:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self):
-        """Initialize MinIO client (only once)."""
+    def connect(self) -> None:
+        """Initialize MinIO client (only once per process)."""
         if self._client is None:
             self._initialize_client()
 
@@ -34,13 +88,23 @@ class MinIOClient:
         try:
             logger.info(f"Connecting to MinIO at {settings.MINIO_ENDPOINT}")
 
+            # One pool per client keeps keep-alive connections warm across requests
             self._client = Minio(
                 settings.MINIO_ENDPOINT,
                 access_key=settings.MINIO_ACCESS_KEY,
                 secret_key=settings.MINIO_SECRET_KEY,
-                secure=settings.MINIO_SECURE
+                secure=settings.MINIO_SECURE,
+                http_client=_create_http_pool()
             )
 
+            if AsyncMinio is not None:
+                self._async_client = AsyncMinio(
+                    settings.MINIO_ENDPOINT,
+                    access_key=settings.MINIO_ACCESS_KEY,
+                    secret_key=settings.MINIO_SECRET_KEY,
+                    secure=settings.MINIO_SECURE
+                )
+
             # Ensure bucket exists
             self._ensure_bucket()
 
@@ -53,14 +117,14 @@ class MinIOClient:
     def _ensure_bucket(self) -> None:
         """Create bucket if it doesn't exist."""
         try:
-            bucket_exists = self._client.bucket_exists(settings.MINIO_BUCKET)
+            bucket_exists = self._client.bucket_exists(_BUCKET)
 
             if not bucket_exists:
-                logger.info(f"Creating bucket: {settings.MINIO_BUCKET}")
-                self._client.make_bucket(settings.MINIO_BUCKET)
-                logger.info(f"Bucket '{settings.MINIO_BUCKET}' created successfully")
+                logger.info(f"Creating bucket: {_BUCKET}")
+                self._client.make_bucket(_BUCKET)
+                logger.info(f"Bucket '{_BUCKET}' created successfully")
             else:
-                logger.info(f"Bucket '{settings.MINIO_BUCKET}' already exists")
+                logger.info(f"Bucket '{_BUCKET}' already exists")
 
         except S3Error as e:
             logger.error(f"Error ensuring bucket exists: {e}")
@@ -81,22 +145,95 @@ class MinIOClient:
             Exception: If upload fails
         """
         try:
-            logger.info(f"Uploading {file_path} to MinIO as {object_name}")
+            logger.debug("Uploading %s to MinIO as %s", file_path, object_name)
 
             self._client.fput_object(
-                settings.MINIO_BUCKET,
+                _BUCKET,
                 object_name,
                 file_path,
                 content_type="audio/wav"
             )
 
-            logger.info(f"File uploaded successfully: {object_name}")
+            self._evict_urls(object_name)
+
+            logger.debug("File uploaded successfully: %s", object_name)
             return object_name
 
         except S3Error as e:
             logger.error(f"Failed to upload file to MinIO: {e}")
             raise Exception(f"MinIO upload failed: {e}")
 
+    def upload_bytes(
+        self,
+        data: bytes,
+        object_name: str,
+        content_type: str = "audio/wav",
+        metadata: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        Upload in-memory data to MinIO without a local file.
+
+        Args:
+            data: File content
+            object_name: Object name in bucket (e.g., 'tts/uuid.wav')
+            content_type: MIME type stored with the object
+            metadata: Optional user metadata stored with the object
+
+        Returns:
+            str: Object name in bucket
+
+        Raises:
+            Exception: If upload fails
+        """
+        try:
+            logger.debug("Uploading %d bytes to MinIO as %s", len(data), object_name)
+
+            self._client.put_object(
+                _BUCKET,
+                object_name,
+                io.BytesIO(data),
+                length=len(data),
+                content_type=content_type,
+                metadata=metadata
+            )
+
+            self._evict_urls(object_name)
+
+            logger.debug("Data uploaded successfully: %s", object_name)
+            return object_name
+
+        except S3Error as e:
+            logger.error(f"Failed to upload data to MinIO: {e}")
+            raise Exception(f"MinIO upload failed: {e}")
+
+    def stat_metadata(self, object_name: str) -> Optional[Dict[str, str]]:
+        """
+        Get user metadata of an object, or None if it does not exist.
+
+        Args:
+            object_name: Object name in bucket
+
+        Returns:
+            Optional[dict]: User metadata (lower-case keys without the x-amz-meta- prefix)
+
+        Raises:
+            Exception: If the lookup fails for another reason
+        """
+        try:
+            stat = self._client.stat_object(_BUCKET, object_name)
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchObject", "ResourceNotFound"):
+                return None
+            logger.error(f"Failed to stat object {object_name}: {e}")
+            raise Exception(f"MinIO stat failed: {e}")
+
+        prefix = "x-amz-meta-"
+        return {
+            key.lower()[len(prefix):]: value
+            for key, value in (stat.metadata or {}).items()
+            if key.lower().startswith(prefix)
+        }
+
     def get_presigned_url(self, object_name: str, expiry_hours: int = None) -> str:
         """
         Generate a presigned URL for downloading the file.
@@ -111,22 +248,210 @@ class MinIOClient:
         Raises:
             Exception: If URL generation fails
         """
+        hours = expiry_hours or _URL_EXPIRY_HOURS
+        cache_key = (object_name, hours)
+
+        url = self._get_cached_url(cache_key)
+        if url is not None:
+            return url
+
         try:
-            expiry = timedelta(hours=expiry_hours or settings.AUDIO_URL_EXPIRY_HOURS)
+            expiry = timedelta(hours=hours)
 
             url = self._client.presigned_get_object(
-                settings.MINIO_BUCKET,
+                _BUCKET,
                 object_name,
                 expires=expiry
             )
 
-            logger.info(f"Generated presigned URL for {object_name} (expires in {expiry.total_seconds()/3600}h)")
+            self._cache_url(cache_key, url, expiry)
+
+            logger.debug("Generated presigned URL for %s (expires in %dh)", object_name, hours)
             return url
 
         except S3Error as e:
             logger.error(f"Failed to generate presigned URL: {e}")
             raise Exception(f"Presigned URL generation failed: {e}")
 
+    def _get_cached_url(self, cache_key: Tuple[str, int]) -> Optional[str]:
+        """Return a previously signed URL while it is still comfortably valid."""
+        with self._url_cache_lock:
+            cached = self._url_cache.get(cache_key)
+            if cached is not None:
+                url, valid_until = cached
+                if time.monotonic() < valid_until:
+                    self._url_cache.move_to_end(cache_key)
+                    return url
+                del self._url_cache[cache_key]
+        return None
+
+    def _cache_url(self, cache_key: Tuple[str, int], url: str, expiry: timedelta) -> None:
+        """Remember a signed URL for part of its lifetime."""
+        ttl = max(URL_CACHE_MIN_TTL_SECONDS, expiry.total_seconds() * URL_CACHE_TTL_FRACTION)
+        with self._url_cache_lock:
+            self._url_cache[cache_key] = (url, time.monotonic() + ttl)
+            if len(self._url_cache) > URL_CACHE_MAX_SIZE:
+                self._url_cache.popitem(last=False)
+
+    def _evict_urls(self, object_name: str) -> None:
+        """Drop cached URLs for an object that was replaced or deleted."""
+        with self._url_cache_lock:
+            for key in [key for key in self._url_cache if key[0] == object_name]:
+                del self._url_cache[key]
+
+    async def upload_file_async(self, file_path: str, object_name: str) -> str:
+        """
+        Upload a file to MinIO without blocking the event loop.
+
+        Args:
+            file_path: Local path to file
+            object_name: Object name in bucket (e.g., 'tts/uuid.wav')
+
+        Returns:
+            str: Object name in bucket
+
+        Raises:
+            Exception: If upload fails
+        """
+        if self._async_client is None:
+            return await run_blocking(self.upload_file, file_path, object_name)
+
+        try:
+            logger.debug("Uploading %s to MinIO as %s", file_path, object_name)
+
+            await self._async_client.fput_object(
+                _BUCKET,
+                object_name,
+                file_path,
+                content_type="audio/wav"
+            )
+
+            self._evict_urls(object_name)
+
+            logger.debug("File uploaded successfully: %s", object_name)
+            return object_name
+
+        except AsyncS3Error as e:
+            logger.error(f"Failed to upload file to MinIO: {e}")
+            raise Exception(f"MinIO upload failed: {e}")
+
+    async def upload_bytes_async(
+        self,
+        data: bytes,
+        object_name: str,
+        content_type: str = "audio/wav",
+        metadata: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        Upload in-memory data to MinIO without blocking the event loop.
+
+        Args:
+            data: File content
+            object_name: Object name in bucket (e.g., 'tts/uuid.wav')
+            content_type: MIME type stored with the object
+            metadata: Optional user metadata stored with the object
+
+        Returns:
+            str: Object name in bucket
+
+        Raises:
+            Exception: If upload fails
+        """
+        if self._async_client is None:
+            return await run_blocking(self.upload_bytes, data, object_name, content_type, metadata)
+
+        try:
+            logger.debug("Uploading %d bytes to MinIO as %s", len(data), object_name)
+
+            await self._async_client.put_object(
+                _BUCKET,
+                object_name,
+                io.BytesIO(data),
+                length=len(data),
+                content_type=content_type,
+                metadata=metadata
+            )
+
+            self._evict_urls(object_name)
+
+            logger.debug("Data uploaded successfully: %s", object_name)
+            return object_name
+
+        except AsyncS3Error as e:
+            logger.error(f"Failed to upload data to MinIO: {e}")
+            raise Exception(f"MinIO upload failed: {e}")
+
+    async def get_presigned_put_url_async(self, object_name: str, expiry_minutes: int = None) -> str:
+        """
+        Generate a presigned URL that lets a client upload the object itself.
+
+        Args:
+            object_name: Object name in bucket
+            expiry_minutes: URL expiry time in minutes (uses settings default if None)
+
+        Returns:
+            str: Presigned PUT URL
+
+        Raises:
+            Exception: If URL generation fails
+        """
+        expiry = timedelta(minutes=expiry_minutes or _UPLOAD_URL_EXPIRY_MINUTES)
+
+        try:
+            if self._async_client is None:
+                return await run_blocking(
+                    self._client.presigned_put_object, _BUCKET, object_name, expires=expiry
+                )
+            return await self._async_client.presigned_put_object(_BUCKET, object_name, expires=expiry)
+
+        except (S3Error, AsyncS3Error) as e:
+            logger.error(f"Failed to generate presigned upload URL: {e}")
+            raise Exception(f"Presigned URL generation failed: {e}")
+
+    async def get_presigned_url_async(self, object_name: str, expiry_hours: int = None) -> str:
+        """
+        Generate a presigned URL without blocking the event loop.
+
+        Shares the URL cache with get_presigned_url.
+
+        Args:
+            object_name: Object name in bucket
+            expiry_hours: URL expiry time in hours (uses settings default if None)
+
+        Returns:
+            str: Presigned URL
+
+        Raises:
+            Exception: If URL generation fails
+        """
+        if self._async_client is None:
+            return await run_blocking(self.get_presigned_url, object_name, expiry_hours)
+
+        hours = expiry_hours or _URL_EXPIRY_HOURS
+        cache_key = (object_name, hours)
+
+        url = self._get_cached_url(cache_key)
+        if url is not None:
+            return url
+
+        try:
+            expiry = timedelta(hours=hours)
+
+            url = await self._async_client.presigned_get_object(
+                _BUCKET,
+                object_name,
+                expires=expiry
+            )
+
+            self._cache_url(cache_key, url, expiry)
+
+            logger.debug("Generated presigned URL for %s (expires in %dh)", object_name, hours)
+            return url
+
+        except AsyncS3Error as e:
+            logger.error(f"Failed to generate presigned URL: {e}")
+            raise Exception(f"Presigned URL generation failed: {e}")
+
     def delete_file(self, object_name: str) -> None:
         """
         Delete a file from MinIO.
@@ -135,8 +460,12 @@ class MinIOClient:
             object_name: Object name in bucket
         """
         try:
-            self._client.remove_object(settings.MINIO_BUCKET, object_name)
-            logger.info(f"Deleted file from MinIO: {object_name}")
+            self._client.remove_object(_BUCKET, object_name)
+
+            # Drop cached URLs pointing at the deleted object
+            self._evict_urls(object_name)
+
+            logger.debug("Deleted file from MinIO: %s", object_name)
         except S3Error as e:
             logger.warning(f"Failed to delete file {object_name}: {e}")
 
@@ -152,7 +481,7 @@ class MinIOClient:
         """
         try:
             objects = self._client.list_objects(
-                settings.MINIO_BUCKET,
+                _BUCKET,
                 prefix=prefix,
                 recursive=True
             )
@@ -4,6 +4,7 @@ import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from app.core.config import settings
 from app.models.schemas import SynthesizeRequest, SynthesizeResponse, HealthResponse, ErrorResponse
@@ -39,20 +40,26 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to load model: {e}")
         raise
 
-    # Initialize MinIO client
+    # Initialize MinIO client (per worker process)
     from app.core.minio_client import minio_client
     try:
         logger.info("Initializing MinIO client...")
-        # Client is initialized in constructor
+        minio_client.connect()
         logger.info("MinIO client ready")
     except Exception as e:
         logger.error(f"Failed to initialize MinIO: {e}")
         raise
 
+    # Start batching of local inference
+    await model_manager.start_batching()
+
     yield
 
     # Shutdown
     logger.info("Shutting down TTS service...")
+    await model_manager.stop_batching()
+    from app.core.executor import shutdown_pool
+    shutdown_pool()
 
 
 # Create FastAPI app
@@ -60,6 +67,7 @@ app = FastAPI(
     title=settings.SERVICE_NAME,
     description=settings.DESCRIPTION,
     version=settings.VERSION,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -83,6 +91,7 @@ async def root():
         "model": settings.TTS_MODEL,
         "endpoints": {
             "synthesize": "POST /synthesize",
+            "synthesize_stream": "POST /synthesize/stream",
             "health": "GET /health",
             "voices": "GET /voices",
             "docs": "GET /docs"
@@ -173,8 +182,7 @@ async def synthesize_speech(request: SynthesizeRequest):
         SynthesizeResponse: Response with audio URL and metadata
     """
     try:
-        logger.info(f"Received synthesis request")
-        logger.info(f"Text length: {len(request.text)} characters")
+        logger.debug("Received synthesis request (%d characters)", len(request.text))
 
         # Perform synthesis
         result = await SynthesisService.synthesize_speech(request)
@@ -189,13 +197,76 @@ async def synthesize_speech(request: SynthesizeRequest):
         raise HTTPException(status_code=500, detail=f"Synthesis failed: {str(e)}")
 
 
+@app.post(
+    "/synthesize/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"audio/mpeg": {}}, "description": "MP3 audio stream"},
+        400: {"model": ErrorResponse, "description": "Invalid input"}
+    },
+    tags=["Synthesis"]
+)
+async def synthesize_speech_stream(request: SynthesizeRequest):
+    """
+    Synthesize speech and stream the MP3 audio back directly.
+
+    Audio bytes are sent as they are produced instead of returning a
+    presigned URL, saving the upload and the extra download round-trip.
+    The audio is still stored in MinIO afterwards under the object name
+    returned in the `X-Audio-Object` header.
+
+    With `client_upload` the service does not upload the audio at all:
+    `X-Audio-Upload-Url` carries a presigned PUT URL the client uses to
+    store the bytes it received, and `X-Audio-Url` the presigned GET URL
+    that serves them once the PUT has completed.
+
+    Example:
+        ```bash
+        curl -X POST "http://localhost:8003/synthesize/stream" \\
+          -H "Content-Type: application/json" \\
+          -d '{"text": "Hello, how can I help you today?"}' \\
+          --output speech.mp3
+        ```
+
+    Args:
+        request: Synthesis request containing text and optional parameters
+
+    Returns:
+        StreamingResponse: MP3 audio stream
+    """
+    from app.services.audio_storage import AudioStorageService
+
+    logger.debug("Received streaming synthesis request (%d characters)", len(request.text))
+
+    _, object_name = AudioStorageService.generate_unique_filename("mp3")
+    headers = {"X-Audio-Object": object_name}
+
+    if request.client_upload:
+        from app.core.minio_client import minio_client
+
+        try:
+            headers["X-Audio-Upload-Url"] = await minio_client.get_presigned_put_url_async(object_name)
+            headers["X-Audio-Url"] = await minio_client.get_presigned_url_async(object_name)
+        except Exception as e:
+            logger.error(f"Failed to sign client upload: {e}")
+            raise HTTPException(status_code=500, detail="Failed to sign client upload")
+
+    return StreamingResponse(
+        SynthesisService.stream_speech(request, object_name, store=not request.client_upload),
+        media_type="audio/mpeg",
+        headers=headers
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
 
+    # Reload mode only supports a single worker
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.RELOAD,
+        workers=1 if settings.RELOAD else settings.WORKERS,
         log_level=settings.LOG_LEVEL.lower()
     )
@@ -4,6 +4,9 @@ from pydantic import BaseModel, Field, validator
 from typing import Optional
 from app.core.config import settings
 
+# Read by the text validator on every request body
+_MAX_TEXT_LENGTH = settings.MAX_TEXT_LENGTH
+
 
 class SynthesizeRequest(BaseModel):
     """Request model for speech synthesis."""
@@ -11,14 +14,18 @@ class SynthesizeRequest(BaseModel):
     voice: Optional[str] = Field(default="default", description="Voice ID to use")
     speed: Optional[float] = Field(default=1.0, description="Speech speed multiplier (0.5-2.0)", ge=0.5, le=2.0)
     language: Optional[str] = Field(default="en", description="Language code")
+    client_upload: Optional[bool] = Field(
+        default=False,
+        description="Streaming only: skip the server-side upload and return a presigned PUT URL for the client to store the audio"
+    )
 
     @validator('text')
     def validate_text(cls, v):
         """Validate text is not empty after stripping."""
         if not v.strip():
             raise ValueError("Text cannot be empty")
-        if len(v) > settings.MAX_TEXT_LENGTH:
-            raise ValueError(f"Text exceeds maximum length of {settings.MAX_TEXT_LENGTH} characters")
+        if len(v) > _MAX_TEXT_LENGTH:
+            raise ValueError(f"Text exceeds maximum length of {_MAX_TEXT_LENGTH} characters")
         return v.strip()
 
 
@@ -1,12 +1,288 @@
 """gTTS (Google Text-to-Speech) model manager - Lightweight TTS solution."""
 
+import io
+import json
 import logging
-from typing import Optional
+import os
+import tempfile
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from gtts import gTTS
+from pydub import AudioSegment
 from app.core.config import settings
+from app.core.executor import run_blocking
+from app.services.batcher import BatchScheduler, install_shared_session
+
+# Local Piper (VITS/ONNX) synthesis is optional; gTTS is used without it
+try:
+    import numpy as np
+    import onnxruntime
+    from piper.config import PiperConfig
+    from piper.util import audio_float_to_int16
+    from piper.voice import PiperVoice
+except ImportError:
+    onnxruntime = None
 
 logger = logging.getLogger(__name__)
 
+# TTS_MODEL prefix selecting the local Piper backend (e.g. "piper:en_US-lessac-medium")
+PIPER_MODEL_PREFIX = "piper"
+
+# Samples below this level at the end of a padded batch row are cut off
+_PADDING_SILENCE_LEVEL = 1e-3
+
+
+class PiperTTSBackend:
+    """
+    Local Piper voice running on ONNX Runtime.
+
+    Synthesis happens in process, so there is no network round-trip per
+    request. Output is encoded to MP3 to match gTTS, so the rest of the
+    service handles both backends the same way.
+    """
+
+    def __init__(self, voice_name: str):
+        """
+        Load the Piper voice from MODEL_DIR.
+
+        Args:
+            voice_name: Voice file name without extension (e.g. en_US-lessac-medium)
+
+        Raises:
+            RuntimeError: If onnxruntime/piper-tts are missing or the model cannot be loaded
+        """
+        if onnxruntime is None:
+            raise RuntimeError("Piper backend requires onnxruntime and piper-tts")
+
+        model_path = os.path.join(settings.MODEL_DIR, f"{voice_name}.onnx")
+        config_path = f"{model_path}.json"
+
+        with open(config_path, "r", encoding="utf-8") as f:
+            config: Dict[str, Any] = json.load(f)
+
+        self.voice_name = voice_name
+        self.device = self._resolve_device()
+        self.dtype = self._resolve_dtype(self.device)
+        model_path = self._convert_weights(model_path, self.dtype)
+
+        so = onnxruntime.SessionOptions()
+        so.intra_op_num_threads = settings.NUM_THREADS
+        so.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+        providers = ["CUDAExecutionProvider", "CPUExecutionProvider"] if self.device == "cuda" else ["CPUExecutionProvider"]
+        session = onnxruntime.InferenceSession(
+            model_path,
+            sess_options=so,
+            providers=providers
+        )
+
+        self.voice = PiperVoice(session=session, config=PiperConfig.from_dict(config))
+        self.sample_rate = self.voice.config.sample_rate
+        self.speakers: Dict[str, int] = config.get("speaker_id_map", {})
+
+        logger.info(
+            f"Piper voice loaded: {model_path} on {self.device} ({self.dtype}, "
+            f"{self.sample_rate}Hz, {len(self.speakers) or 1} speaker(s))"
+        )
+
+    @staticmethod
+    def _resolve_device() -> str:
+        """
+        Pick the ONNX Runtime device from the DEVICE setting.
+
+        Returns:
+            str: 'cuda' or 'cpu'
+        """
+        if settings.DEVICE == "cpu":
+            return "cpu"
+
+        has_cuda = "CUDAExecutionProvider" in onnxruntime.get_available_providers()
+        if settings.DEVICE == "cuda" and not has_cuda:
+            logger.warning("DEVICE=cuda but onnxruntime has no CUDA provider, using CPU")
+        return "cuda" if has_cuda else "cpu"
+
+    @staticmethod
+    def _resolve_dtype(device: str) -> str:
+        """
+        Pick the weight type from the TTS_DTYPE setting.
+
+        Args:
+            device: 'cuda' or 'cpu'
+
+        Returns:
+            str: 'int8', 'float16' or 'float32'
+        """
+        if settings.TTS_DTYPE != "auto":
+            return settings.TTS_DTYPE
+        # int8 kernels are CPU-only in ONNX Runtime; half precision on GPU
+        return "float16" if device == "cuda" else "int8"
+
+    @staticmethod
+    def _convert_weights(model_path: str, dtype: str) -> str:
+        """
+        Get a copy of the model with the requested weight type, creating it once.
+
+        Converted models are cached next to the original (<voice>.int8.onnx,
+        <voice>.float16.onnx) so the conversion only runs on first start.
+        Every gunicorn worker may convert concurrently on that start, so the
+        model is written to a temporary file and renamed into place: a
+        worker never loads a partially written file.
+
+        Args:
+            model_path: Path to the float32 ONNX model
+            dtype: 'int8', 'float16' or 'float32'
+
+        Returns:
+            str: Path to the model to load
+        """
+        if dtype == "float32":
+            return model_path
+
+        converted_path = model_path.replace(".onnx", f".{dtype}.onnx")
+        if os.path.exists(converted_path):
+            return converted_path
+
+        logger.info(f"Converting {model_path} to {dtype}...")
+        fd, temp_path = tempfile.mkstemp(
+            suffix=".onnx", prefix=".converting-", dir=os.path.dirname(converted_path)
+        )
+        os.close(fd)
+        try:
+            if dtype == "int8":
+                from onnxruntime.quantization import QuantType, quantize_dynamic
+
+                quantize_dynamic(model_path, temp_path, weight_type=QuantType.QInt8)
+            else:
+                import onnx
+                from onnxconverter_common import float16
+
+                model = float16.convert_float_to_float16(onnx.load(model_path), keep_io_types=True)
+                onnx.save(model, temp_path)
+            # Atomic on the same filesystem; a concurrent worker's identical result is simply replaced
+            os.replace(temp_path, converted_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return converted_path
+
+    def synthesize_to_bytes(self, text: str, voice: Optional[str] = None, speed: float = 1.0) -> bytes:
+        """
+        Synthesize speech to MP3.
+
+        Args:
+            text: Text to synthesize
+            voice: Speaker name for multi-speaker voices (other values use the default speaker)
+            speed: Speech speed, applied through the model's length scale
+
+        Returns:
+            bytes: MP3 audio
+        """
+        result = self.synthesize_batch([(text, voice, speed)])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def synthesize_batch(self, requests: List[Tuple[str, Optional[str], float]]) -> List[Union[bytes, Exception]]:
+        """
+        Synthesize several requests with batched model calls.
+
+        Every request is split into sentences; sentences of all requests are
+        grouped by speed (the length scale is one input per forward pass),
+        sorted by length (to keep padding small) and run INFERENCE_MAX_BATCH
+        at a time through the model.
+
+        Args:
+            requests: (text, voice, speed) per request
+
+        Returns:
+            list: MP3 audio, or the raised exception, per request
+        """
+        results: List[Union[bytes, Exception, None]] = [None] * len(requests)
+        sentences: Dict[float, list] = {}  # speed -> (request index, sentence index, phoneme ids, speaker id)
+
+        for i, (text, voice, speed) in enumerate(requests):
+            try:
+                for j, phonemes in enumerate(self.voice.phonemize(text)):
+                    sentences.setdefault(speed, []).append(
+                        (i, j, self.voice.phonemes_to_ids(phonemes), self.speakers.get(voice, 0))
+                    )
+            except Exception as e:
+                results[i] = e
+
+        pcm: List[Dict[int, "np.ndarray"]] = [{} for _ in requests]
+
+        for speed, group in sentences.items():
+            group.sort(key=lambda sentence: len(sentence[2]))
+            for start in range(0, len(group), settings.INFERENCE_MAX_BATCH):
+                chunk = group[start:start + settings.INFERENCE_MAX_BATCH]
+                try:
+                    audios = self._infer(chunk, speed)
+                except Exception as e:
+                    for i, _, _, _ in chunk:
+                        results[i] = e
+                    continue
+                for (i, j, _, _), audio in zip(chunk, audios):
+                    pcm[i][j] = audio
+
+        for i, parts in enumerate(pcm):
+            if results[i] is None:
+                samples = np.concatenate([parts[j] for j in sorted(parts)]) if parts else np.zeros(0, dtype=np.int16)
+                results[i] = self._encode_mp3(samples)
+
+        return results
+
+    def _infer(self, chunk: List[Tuple[int, int, List[int], int]], speed: float = 1.0) -> List["np.ndarray"]:
+        """
+        Run one padded batch of sentences through the model.
+
+        Args:
+            chunk: (request index, sentence index, phoneme ids, speaker id) tuples
+            speed: Speech speed; the length scale (phoneme duration) is divided by it
+
+        Returns:
+            list: int16 samples per sentence
+        """
+        config = self.voice.config
+        lengths = np.array([len(ids) for _, _, ids, _ in chunk], dtype=np.int64)
+
+        # Pad id is 0 ("_") in every Piper phoneme map
+        inputs = np.zeros((len(chunk), int(lengths.max())), dtype=np.int64)
+        for row, (_, _, ids, _) in enumerate(chunk):
+            inputs[row, :len(ids)] = ids
+
+        args = {
+            "input": inputs,
+            "input_lengths": lengths,
+            "scales": np.array([config.noise_scale, config.length_scale / speed, config.noise_w], dtype=np.float32)
+        }
+        if config.num_speakers > 1:
+            args["sid"] = np.array([sid for _, _, _, sid in chunk], dtype=np.int64)
+
+        # (batch, 1, samples); shorter rows are padded with near-silence
+        outputs = self.voice.session.run(None, args)[0]
+
+        audios = []
+        for audio in outputs:
+            audio = audio.squeeze()
+            voiced = np.flatnonzero(np.abs(audio) > _PADDING_SILENCE_LEVEL)
+            audio = audio[:voiced[-1] + 1] if voiced.size else audio[:0]
+            audios.append(audio_float_to_int16(audio))
+        return audios
+
+    def _encode_mp3(self, samples: "np.ndarray") -> bytes:
+        """
+        Encode int16 mono samples to MP3.
+
+        Args:
+            samples: int16 samples at the model sample rate
+
+        Returns:
+            bytes: MP3 audio
+        """
+        audio = AudioSegment(data=samples.tobytes(), sample_width=2, frame_rate=self.sample_rate, channels=1)
+        buffer = io.BytesIO()
+        audio.export(buffer, format="mp3")
+        return buffer.getvalue()
+
 
 class TTSModelManager:
     """
@@ -17,6 +293,18 @@ class TTSModelManager:
     _instance: Optional["TTSModelManager"] = None
     _available_voices: list = ["default", "en-US", "en-GB", "en-AU", "en-IN"]
     _available_languages: list = ["en", "es", "fr", "de", "it", "pt", "zh", "ja", "ko"]
+    # Voice/accent -> (lang, tld); the top-level domain selects the accent
+    _VOICE_MAP: Dict[str, Tuple[str, str]] = {
+        "default": ("en", "com"),
+        "en-US": ("en", "com"),
+        "en-GB": ("en", "co.uk"),
+        "en-AU": ("en", "com.au"),
+        "en-IN": ("en", "co.in"),
+    }
+    # Plain language codes ("es", "fr", ...) use the default domain
+    _LANG_MAP: Dict[str, Tuple[str, str]] = {lang: (lang, "com") for lang in _available_languages}
+    _piper: Optional[PiperTTSBackend] = None
+    _scheduler: Optional[BatchScheduler] = None
 
     def __new__(cls):
         """Singleton pattern - only one instance allowed."""
@@ -30,18 +318,95 @@ class TTSModelManager:
         logger.info(f"Available languages: {', '.join(self._available_languages)}")
 
     def load_model(self) -> None:
-        """Load model (no-op for gTTS, but kept for compatibility)."""
-        logger.info("Using gTTS (Google Text-to-Speech) - no model loading needed")
-        logger.info("gTTS is ready for synthesis")
+        """
+        Load the local Piper model if configured, and set up gTTS.
+
+        gTTS stays available as the fallback when the Piper model is not
+        configured or fails to load.
+        """
+        if settings.TTS_MODEL.startswith(PIPER_MODEL_PREFIX) and self._piper is None:
+            voice_name = settings.TTS_MODEL.partition(":")[2]
+            try:
+                self._piper = PiperTTSBackend(voice_name)
+                self._scheduler = BatchScheduler(self._piper.synthesize_batch)
+            except Exception as e:
+                logger.warning(f"Failed to load Piper model '{voice_name}', falling back to gTTS: {e}")
+
+        install_shared_session()
+        if self._piper is not None:
+            logger.info(f"Using Piper voice '{self._piper.voice_name}' ({self._piper.device}, {self._piper.dtype})")
+        else:
+            logger.info("Using gTTS (Google Text-to-Speech) - no model loading needed")
+            logger.info("gTTS is ready for synthesis")
+
+    async def start_batching(self) -> None:
+        """Start the inference batch scheduler (local model only)."""
+        if self._scheduler is not None:
+            await self._scheduler.start()
+
+    async def stop_batching(self) -> None:
+        """Stop the inference batch scheduler."""
+        if self._scheduler is not None:
+            await self._scheduler.stop()
 
     def get_device(self) -> str:
         """Get device (always CPU for gTTS)."""
+        if self._piper is not None:
+            return self._piper.device
         return "cpu"
 
+    def backend_id(self) -> str:
+        """
+        Identify the backend producing the audio, for cache keys.
+
+        Returns:
+            str: 'piper:<voice>:<dtype>' for the local model, 'gtts' otherwise
+        """
+        if self._piper is not None:
+            return f"{PIPER_MODEL_PREFIX}:{self._piper.voice_name}:{self._piper.dtype}"
+        return "gtts"
+
     def get_available_voices(self) -> list:
         """Get list of available voice IDs."""
+        if self._piper is not None:
+            return ["default"] + list(self._piper.speakers)
         return self._available_voices
 
+    def _build_tts(self, text: str, voice: Optional[str], speed: float) -> gTTS:
+        """
+        Create a gTTS instance for the requested voice and speed.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice/accent (e.g., en-US, en-GB, default)
+            speed: Speech speed (gTTS has limited speed support)
+
+        Returns:
+            gTTS: Configured gTTS instance
+        """
+        # Parse voice/language from voice parameter
+        if not voice:
+            lang, tld = self._VOICE_MAP["default"]
+        elif voice in self._VOICE_MAP:
+            lang, tld = self._VOICE_MAP[voice]
+        elif len(voice) == 2:
+            # Any two-letter language code ("es", "nl", ...) goes to gTTS as is
+            lang, tld = self._LANG_MAP.get(voice, (voice, "com"))
+        else:
+            lang, tld = self._VOICE_MAP["default"]
+
+        # Create gTTS instance
+        # Note: gTTS doesn't support speed adjustment directly
+        # We use 'slow' parameter for slower speech
+        slow = (speed < 0.9)
+
+        return gTTS(
+            text=text,
+            lang=lang,
+            tld=tld,
+            slow=slow
+        )
+
     def synthesize(
         self,
         text: str,
@@ -56,55 +421,158 @@ class TTSModelManager:
             text: Text to synthesize
             output_path: Path to save output audio file
             voice: Voice/accent (e.g., en-US, en-GB, default)
-            speed: Speech speed (gTTS has limited speed support)
+            speed: Speech speed (Piper applies it exactly; gTTS only has a slow mode)
 
         Raises:
             RuntimeError: If synthesis fails
         """
-        logger.info(f"Synthesizing text: {text[:50]}...")
-        logger.info(f"Output path: {output_path}")
-        logger.info(f"Voice: {voice or 'default'}, Speed: {speed}")
+        logger.debug("Synthesizing text: %.50s... -> %s (voice=%s, speed=%s)", text, output_path, voice or "default", speed)
 
         try:
-            # Parse voice/language from voice parameter
-            lang = "en"
-            tld = "com"  # Top-level domain for accent
-
-            if voice and voice != "default":
-                if voice == "en-US":
-                    lang, tld = "en", "com"
-                elif voice == "en-GB":
-                    lang, tld = "en", "co.uk"
-                elif voice == "en-AU":
-                    lang, tld = "en", "com.au"
-                elif voice == "en-IN":
-                    lang, tld = "en", "co.in"
-                elif len(voice) == 2:  # Language code like "es", "fr"
-                    lang = voice
-
-            # Create gTTS instance
-            # Note: gTTS doesn't support speed adjustment directly
-            # We use 'slow' parameter for slower speech
-            slow = (speed < 0.9)
-
-            tts = gTTS(
-                text=text,
-                lang=lang,
-                tld=tld,
-                slow=slow
-            )
+            if self._piper is not None:
+                self._write_file(output_path, self._piper.synthesize_to_bytes(text, voice, speed))
+                logger.debug("Synthesis completed successfully")
+                return
+
+            tts = self._build_tts(text, voice, speed)
 
             # Save to file
             tts.save(output_path)
 
-            logger.info(f"Synthesis completed successfully")
+            logger.debug("Synthesis completed successfully")
 
         except Exception as e:
             logger.error(f"Synthesis failed: {e}")
             raise RuntimeError(f"Synthesis failed: {e}")
 
+    async def synthesize_async(
+        self,
+        text: str,
+        output_path: str,
+        voice: Optional[str] = None,
+        speed: float = 1.0
+    ) -> None:
+        """
+        Synthesize speech to a file without blocking the event loop.
+
+        gTTS performs synchronous HTTPS requests, so the call runs in the
+        shared worker pool.
+
+        Args:
+            text: Text to synthesize
+            output_path: Path to save output audio file
+            voice: Voice/accent (e.g., en-US, en-GB, default)
+            speed: Speech speed (Piper applies it exactly; gTTS only has a slow mode)
+
+        Raises:
+            RuntimeError: If synthesis fails
+        """
+        if self._piper is not None:
+            # Local inference: batched with concurrent requests
+            data = await self._scheduler.submit((text, voice, speed))
+            await run_blocking(self._write_file, output_path, data)
+            return
+        await run_blocking(self.synthesize, text, output_path, voice, speed)
+
+    async def synthesize_to_bytes_async(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        speed: float = 1.0
+    ) -> bytes:
+        """
+        Synthesize speech in memory without blocking the event loop.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice/accent (e.g., en-US, en-GB, default)
+            speed: Speech speed (Piper applies it exactly; gTTS only has a slow mode)
+
+        Returns:
+            bytes: Encoded audio
+
+        Raises:
+            RuntimeError: If synthesis fails
+        """
+        if self._piper is not None:
+            return await self._scheduler.submit((text, voice, speed))
+        return await run_blocking(self.synthesize_to_bytes, text, voice, speed)
+
+    def stream(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        speed: float = 1.0
+    ) -> Iterator[bytes]:
+        """
+        Synthesize speech from text, yielding MP3 fragments as gTTS receives them.
+
+        The generator blocks on network I/O; iterate it off the event loop.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice/accent (e.g., en-US, en-GB, default)
+            speed: Speech speed (Piper applies it exactly; gTTS only has a slow mode)
+
+        Yields:
+            bytes: MP3 audio fragments
+        """
+        logger.debug("Streaming synthesis: %.50s...", text)
+        if self._piper is not None:
+            yield self._piper.synthesize_to_bytes(text, voice, speed)
+            return
+        yield from self._build_tts(text, voice, speed).stream()
+
+    def synthesize_to_bytes(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        speed: float = 1.0
+    ) -> bytes:
+        """
+        Synthesize speech from text using gTTS, keeping the audio in memory.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice/accent (e.g., en-US, en-GB, default)
+            speed: Speech speed (Piper applies it exactly; gTTS only has a slow mode)
+
+        Returns:
+            bytes: Encoded audio
+
+        Raises:
+            RuntimeError: If synthesis fails
+        """
+        logger.debug("Synthesizing text: %.50s... (voice=%s, speed=%s)", text, voice or "default", speed)
+
+        try:
+            if self._piper is not None:
+                audio = self._piper.synthesize_to_bytes(text, voice, speed)
+                logger.debug("Synthesis completed successfully")
+                return audio
+
+            tts = self._build_tts(text, voice, speed)
+
+            buffer = io.BytesIO()
+            tts.write_to_fp(buffer)
+
+            logger.debug("Synthesis completed successfully")
+            return buffer.getvalue()
+
+        except Exception as e:
+            logger.error(f"Synthesis failed: {e}")
+            raise RuntimeError(f"Synthesis failed: {e}")
+
+    @staticmethod
+    def _write_file(output_path: str, data: bytes) -> None:
+        """Write synthesized audio to a file."""
+        with open(output_path, "wb") as f:
+            f.write(data)
+
     def is_multi_speaker(self) -> bool:
         """Check if model supports multiple speakers."""
+        if self._piper is not None:
+            return len(self._piper.speakers) > 1
         return True  # gTTS supports multiple accents
 
 
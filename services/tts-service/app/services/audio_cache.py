@@ -0,0 +1,174 @@
+"""Content-addressed cache of synthesized audio stored in MinIO."""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+from app.core.config import settings
+from app.core.executor import run_blocking
+from app.core.minio_client import minio_client
+
+# blake3 is SIMD-accelerated; blake2b from hashlib is the stdlib fallback
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    from hashlib import blake2b as _hasher
+
+logger = logging.getLogger(__name__)
+
+# Object metadata keys holding the audio duration and sample rate
+DURATION_METADATA_KEY = "duration-ms"
+SAMPLE_RATE_METADATA_KEY = "sample-rate"
+
+# Bound once instead of a settings lookup per request
+_CACHE_PREFIX = settings.AUDIO_CACHE_PREFIX
+
+# Bump when the audio produced for identical parameters changes (encoding, post-processing)
+_KEY_VERSION = 3
+
+
+class AudioCache:
+    """
+    Cache of synthesized audio keyed by a hash of the synthesis parameters.
+
+    Audio is uploaded under a deterministic object name, so identical
+    requests (greetings, prompts, confirmations) are served from MinIO
+    without calling gTTS again. Recently seen keys are remembered in
+    process to skip the MinIO stat as well.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = settings.AUDIO_CACHE_MAX_ENTRIES,
+        max_prefixes: int = settings.PREFIX_CACHE_MAX_ENTRIES
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of keys remembered in process
+            max_prefixes: Maximum number of template prefix clips kept in memory
+        """
+        self.max_entries = max_entries
+        self.max_prefixes = max_prefixes
+        self._known: "OrderedDict[str, Tuple[int, int]]" = OrderedDict()  # object name -> (duration_ms, sample_rate)
+        self._prefixes: "OrderedDict[str, bytes]" = OrderedDict()  # cache key -> MP3 audio
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(text: str, voice: str, speed: float, backend: str) -> str:
+        """
+        Build the cache key for a synthesis request.
+
+        Entries persist in MinIO across deployments, so the key includes
+        the backend that produced the audio: switching TTS_MODEL or
+        TTS_DTYPE must not serve audio synthesized by the previous one.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice/accent (also selects the language)
+            speed: Speech speed
+            backend: Synthesis backend, model and weight type (from model_manager.backend_id())
+
+        Returns:
+            str: Hex digest identifying the audio
+        """
+        return _hasher(
+            f"{_KEY_VERSION}\x00{backend}\x00{voice}\x00{speed!r}\x00{text}".encode("utf-8")
+        ).hexdigest()
+
+    @staticmethod
+    def object_name(key: str, extension: str) -> str:
+        """
+        Get the MinIO object name for a cache key.
+
+        Args:
+            key: Cache key from make_key
+            extension: File extension without dot
+
+        Returns:
+            str: Object name in bucket
+        """
+        return f"{_CACHE_PREFIX}{key}.{extension}"
+
+    async def lookup(self, object_name: str) -> Optional[Tuple[str, int, int]]:
+        """
+        Return a presigned URL, duration and sample rate for cached audio.
+
+        Args:
+            object_name: Object name from object_name()
+
+        Returns:
+            Optional[tuple]: (audio_url, duration_ms, sample_rate), or None on a miss
+        """
+        with self._lock:
+            info = self._known.get(object_name)
+            if info is not None:
+                self._known.move_to_end(object_name)
+
+        if info is None:
+            try:
+                metadata = await run_blocking(minio_client.stat_metadata, object_name)
+            except Exception as e:
+                logger.warning(f"Audio cache lookup failed for {object_name}: {e}")
+                return None
+
+            if metadata is None:
+                return None
+
+            info = (
+                int(metadata.get(DURATION_METADATA_KEY, 0)),
+                int(metadata.get(SAMPLE_RATE_METADATA_KEY, 0))
+            )
+            self.remember(object_name, *info)
+
+        return (await minio_client.get_presigned_url_async(object_name), *info)
+
+    def remember(self, object_name: str, duration_ms: int, sample_rate: int) -> None:
+        """
+        Record that audio is stored under object_name.
+
+        Args:
+            object_name: Object name in bucket
+            duration_ms: Audio duration in milliseconds
+            sample_rate: Audio sample rate in Hz
+        """
+        with self._lock:
+            self._known[object_name] = (duration_ms, sample_rate)
+            self._known.move_to_end(object_name)
+            if len(self._known) > self.max_entries:
+                self._known.popitem(last=False)
+
+    def get_prefix(self, key: str) -> Optional[bytes]:
+        """
+        Get cached audio of a template prefix.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Optional[bytes]: MP3 audio, or None on a miss
+        """
+        with self._lock:
+            data = self._prefixes.get(key)
+            if data is not None:
+                self._prefixes.move_to_end(key)
+            return data
+
+    def put_prefix(self, key: str, data: bytes) -> None:
+        """
+        Store audio of a template prefix.
+
+        Args:
+            key: Cache key from make_key
+            data: MP3 audio
+        """
+        with self._lock:
+            self._prefixes[key] = data
+            self._prefixes.move_to_end(key)
+            if len(self._prefixes) > self.max_prefixes:
+                self._prefixes.popitem(last=False)
+
+
+# Global cache instance
+audio_cache = AudioCache()
@@ -1,14 +1,35 @@
 """Audio storage service for MinIO integration."""
 
+import io
 import os
+import shutil
 import uuid
+import wave
 import logging
+from fractions import Fraction
+from typing import BinaryIO, Dict, Optional, Tuple, Union
 from pydub import AudioSegment
+
+# MP3 duration from the Xing/VBRI/frame headers (optional, falls back to pydub)
+try:
+    from mutagen.mp3 import MP3
+except ImportError:
+    MP3 = None
+
+# Polyphase resampling of decoded audio for speed changes (optional, falls back to pydub)
+try:
+    import numpy as np
+    from scipy.signal import resample_poly
+except ImportError:
+    resample_poly = None
 from app.core.config import settings
 from app.core.minio_client import minio_client
 
 logger = logging.getLogger(__name__)
 
+# Used to build every local path; bound once instead of a settings lookup
+_TEMP_DIR = settings.TEMP_DIR
+
 
 class AudioStorageService:
     """Service for handling audio file storage and retrieval."""
@@ -41,7 +62,7 @@ class AudioStorageService:
         Returns:
             str: Full local path
         """
-        return os.path.join(settings.TEMP_DIR, filename)
+        return os.path.join(_TEMP_DIR, filename)
 
     @staticmethod
     def apply_speed_adjustment(
@@ -50,7 +71,7 @@ class AudioStorageService:
         speed: float = 1.0
     ) -> None:
         """
-        Apply speed adjustment to audio file using pydub.
+        Apply speed adjustment to audio file.
 
         Args:
             input_path: Path to input audio file
@@ -60,64 +81,198 @@ class AudioStorageService:
         Raises:
             RuntimeError: If speed adjustment fails
         """
+        if speed == 1.0:
+            # No adjustment needed, just copy
+            shutil.copy(input_path, output_path)
+            return
+
+        with open(input_path, "rb") as f:
+            data = f.read()
+
+        adjusted = AudioStorageService.adjust_speed_bytes(data, speed)
+
+        with open(output_path, "wb") as f:
+            f.write(adjusted)
+
+    @staticmethod
+    def adjust_speed_bytes(
+        data: bytes,
+        speed: float = 1.0
+    ) -> bytes:
+        """
+        Apply speed adjustment to in-memory audio.
+
+        The audio (MP3 from both gTTS and Piper) is decoded with pydub and
+        resampled with scipy's polyphase filter, so the WAV keeps the source
+        sample rate. Pitch moves with the speed.
+
+        Args:
+            data: Encoded audio (any format ffmpeg can decode)
+            speed: Speed multiplier (0.5 = half speed, 2.0 = double speed)
+
+        Returns:
+            bytes: Adjusted audio as WAV (input unchanged if speed is 1.0)
+
+        Raises:
+            RuntimeError: If speed adjustment fails
+        """
+        if speed == 1.0:
+            return data
+
         try:
-            if speed == 1.0:
-                # No adjustment needed, just copy
-                import shutil
-                shutil.copy(input_path, output_path)
-                return
+            logger.debug("Applying speed adjustment: %sx", speed)
 
-            logger.info(f"Applying speed adjustment: {speed}x")
+            # Load audio (any format ffmpeg can decode)
+            audio = AudioSegment.from_file(io.BytesIO(data))
 
-            # Load audio
-            audio = AudioSegment.from_wav(input_path)
+            if resample_poly is not None:
+                return AudioStorageService._resample_speed(audio, speed)
 
             # Apply speed change
             # Speed up = increase frame rate, slow down = decrease frame rate
             new_sample_rate = int(audio.frame_rate * speed)
 
             # Change frame rate (speed adjustment)
-            speed_audio = audio._spawn(
+            adjusted_audio = audio._spawn(
                 audio.raw_data,
                 overrides={'frame_rate': new_sample_rate}
             )
 
-            # Resample back to original rate to maintain pitch
-            adjusted_audio = speed_audio.set_frame_rate(audio.frame_rate)
-
             # Export
-            adjusted_audio.export(output_path, format="wav")
+            buffer = io.BytesIO()
+            adjusted_audio.export(buffer, format="wav")
 
-            logger.info(f"Speed adjustment applied successfully")
+            logger.debug("Speed adjustment applied successfully")
+            return buffer.getvalue()
 
         except Exception as e:
             logger.error(f"Speed adjustment failed: {e}")
             raise RuntimeError(f"Speed adjustment failed: {e}")
 
     @staticmethod
-    def get_audio_duration(file_path: str) -> int:
+    def _resample_speed(audio: AudioSegment, speed: float) -> bytes:
         """
-        Get audio file duration in milliseconds.
+        Change the speed of decoded audio at its own sample rate.
+
+        Playing the samples at rate * speed and resampling back to rate is a
+        single polyphase resample by 1 / speed, done in NumPy instead of an
+        ffmpeg process.
+
+        Args:
+            audio: Decoded audio
+            speed: Speed multiplier
+
+        Returns:
+            bytes: Adjusted audio as 16-bit PCM WAV at the source sample rate
+        """
+        audio = audio.set_sample_width(2)
+        samples = np.frombuffer(audio.raw_data, dtype="<i2").reshape(-1, audio.channels)
+
+        up, down = Fraction(speed).limit_denominator(100).as_integer_ratio()
+        resampled = resample_poly(samples.astype(np.float32), down, up, axis=0)
+        pcm = np.clip(np.rint(resampled), -32768, 32767).astype("<i2")
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(audio.channels)
+            wav.setsampwidth(2)
+            wav.setframerate(audio.frame_rate)
+            wav.writeframes(pcm.tobytes())
+
+        logger.debug("Speed adjustment applied via polyphase resampling (%d/%d)", down, up)
+        return buffer.getvalue()
+
+    @staticmethod
+    def concatenate_audio(first: bytes, second: bytes, crossfade_ms: int = 20) -> bytes:
+        """
+        Join two MP3 clips with a short crossfade.
 
         Args:
-            file_path: Path to audio file
+            first: MP3 audio played first
+            second: MP3 audio appended to it
+            crossfade_ms: Crossfade length in milliseconds
 
         Returns:
-            int: Duration in milliseconds
+            bytes: Joined audio as MP3
 
         Raises:
-            RuntimeError: If duration extraction fails
+            RuntimeError: If decoding or encoding fails
         """
         try:
-            audio = AudioSegment.from_wav(file_path)
-            duration_ms = len(audio)
-            logger.info(f"Audio duration: {duration_ms}ms ({duration_ms/1000:.2f}s)")
-            return duration_ms
+            head = AudioSegment.from_file(io.BytesIO(first), format="mp3")
+            tail = AudioSegment.from_file(io.BytesIO(second), format="mp3")
+
+            # pydub requires the crossfade to fit in both clips
+            crossfade = min(crossfade_ms, len(head), len(tail))
+            joined = head.append(tail, crossfade=crossfade)
+
+            buffer = io.BytesIO()
+            joined.export(buffer, format="mp3")
+            return buffer.getvalue()
+
+        except Exception as e:
+            logger.error(f"Audio concatenation failed: {e}")
+            raise RuntimeError(f"Audio concatenation failed: {e}")
+
+    @staticmethod
+    def get_audio_duration(file_path: Union[str, BinaryIO]) -> int:
+        """
+        Get audio file duration in milliseconds.
+
+        Args:
+            file_path: Path to audio file, or an in-memory file object
+
+        Returns:
+            int: Duration in milliseconds (0 if it cannot be determined)
+        """
+        return AudioStorageService.get_audio_info(file_path)[0]
+
+    @staticmethod
+    def get_audio_info(file_path: Union[str, BinaryIO]) -> Tuple[int, int]:
+        """
+        Get audio file duration and sample rate.
+
+        Reads the WAV or MP3 headers instead of decoding the audio. The
+        format is detected from the content, since gTTS output is MP3
+        regardless of the file name. The sample rate is the one the audio
+        is actually encoded at (gTTS MP3 is 24kHz; speed adjustment keeps
+        the source rate, or rate * speed without scipy).
+
+        Args:
+            file_path: Path to audio file, or an in-memory file object
+
+        Returns:
+            tuple: (duration_ms, sample_rate), 0 for values that cannot be determined
+        """
+        try:
+            if isinstance(file_path, str):
+                with open(file_path, "rb") as f:
+                    is_wav = f.read(4) == b"RIFF"
+            else:
+                position = file_path.tell()
+                is_wav = file_path.read(4) == b"RIFF"
+                file_path.seek(position)
+
+            if is_wav:
+                with wave.open(file_path, "rb") as wf:
+                    sample_rate = wf.getframerate()
+                    duration_ms = int(1000 * wf.getnframes() / sample_rate)
+            elif MP3 is not None:
+                info = MP3(file_path).info
+                duration_ms = int(info.length * 1000)
+                sample_rate = info.sample_rate
+            else:
+                audio = AudioSegment.from_file(file_path)
+                duration_ms = len(audio)
+                sample_rate = audio.frame_rate
+
+            logger.debug("Audio duration: %dms at %dHz", duration_ms, sample_rate)
+            return duration_ms, sample_rate
 
         except Exception as e:
             logger.error(f"Failed to get audio duration: {e}")
             # Return 0 if unable to determine duration
-            return 0
+            return 0, 0
 
     @staticmethod
     async def store_audio(local_path: str, object_name: str) -> str:
@@ -135,21 +290,75 @@ class AudioStorageService:
             Exception: If upload or URL generation fails
         """
         try:
-            logger.info(f"Storing audio to MinIO: {object_name}")
+            logger.debug("Storing audio to MinIO: %s", object_name)
 
             # Upload to MinIO
-            minio_client.upload_file(local_path, object_name)
+            await minio_client.upload_file_async(local_path, object_name)
 
             # Generate presigned URL
-            url = minio_client.get_presigned_url(object_name)
+            url = await minio_client.get_presigned_url_async(object_name)
 
-            logger.info(f"Audio stored successfully, URL generated")
+            logger.debug("Audio stored successfully, URL generated")
             return url
 
         except Exception as e:
             logger.error(f"Failed to store audio: {e}")
             raise
 
+    @staticmethod
+    async def store_audio_bytes(
+        data: bytes,
+        object_name: str,
+        content_type: str = "audio/wav",
+        metadata: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        Upload in-memory audio to MinIO and return presigned URL.
+
+        Args:
+            data: Audio file content
+            object_name: Object name in MinIO bucket
+            content_type: MIME type stored with the object
+            metadata: Optional user metadata stored with the object
+
+        Returns:
+            str: Presigned URL to download the audio
+
+        Raises:
+            Exception: If upload or URL generation fails
+        """
+        try:
+            logger.debug("Storing audio to MinIO: %s", object_name)
+
+            # Upload to MinIO straight from memory
+            await minio_client.upload_bytes_async(data, object_name, content_type, metadata)
+
+            # Generate presigned URL
+            url = await minio_client.get_presigned_url_async(object_name)
+
+            logger.debug("Audio stored successfully, URL generated")
+            return url
+
+        except Exception as e:
+            logger.error(f"Failed to store audio: {e}")
+            raise
+
+    @staticmethod
+    def save_local_copy(data: bytes, local_path: str) -> None:
+        """
+        Write audio to the local temp directory (kept when CLEANUP_AFTER_UPLOAD is off).
+
+        Args:
+            data: Audio file content
+            local_path: Destination path
+        """
+        try:
+            with open(local_path, "wb") as f:
+                f.write(data)
+            logger.debug("Saved local copy: %s", local_path)
+        except OSError as e:
+            logger.warning(f"Failed to save local copy {local_path}: {e}")
+
     @staticmethod
     def cleanup_local_file(file_path: str) -> None:
         """
@@ -161,7 +370,7 @@ class AudioStorageService:
         try:
             if os.path.exists(file_path):
                 os.remove(file_path)
-                logger.info(f"Cleaned up local file: {file_path}")
+                logger.debug("Cleaned up local file: %s", file_path)
         except Exception as e:
             logger.warning(f"Failed to cleanup file {file_path}: {e}")
 
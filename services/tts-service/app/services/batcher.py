@@ -0,0 +1,259 @@
+"""Shared gTTS HTTP session and micro-batching of local model inference."""
+
+import asyncio
+import logging
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from gtts import tts as gtts_tts
+from app.core.config import settings
+from app.core.executor import run_blocking
+
+# httpx with h2 multiplexes concurrent gTTS fetches over one connection
+try:
+    import h2  # noqa: F401
+    import httpx
+except ImportError:
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+# (request, future)
+BatchItem = Tuple[Any, asyncio.Future]
+
+
+class _SharedSession(requests.Session):
+    """
+    Process-wide requests session for gTTS.
+
+    gTTS opens a new Session (and a new TLS connection) for every request
+    it sends. This session is handed out instead; leaving the ``with``
+    block does not close it, so keep-alive connections are reused across
+    requests and threads.
+    """
+
+    def __init__(self, pool_size: int):
+        super().__init__()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def __exit__(self, *args: Any) -> None:
+        """Keep the session open for the next request."""
+
+
+class _HttpxResponse:
+    """The parts of a requests response that gTTS reads, backed by an httpx response."""
+
+    def __init__(self, response: "httpx.Response", request: requests.PreparedRequest):
+        self._response = response
+        self.request = request
+        self.status_code = response.status_code
+        self.reason = response.reason_phrase
+
+    def raise_for_status(self) -> None:
+        if self._response.is_error:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} {self.reason} for url: {self.request.url}",
+                response=self
+            )
+
+    def iter_lines(self, chunk_size: int = 512) -> Iterator[bytes]:
+        for line in self._response.iter_lines():
+            yield line.encode("utf-8")
+
+
+class _HttpxSession:
+    """
+    Process-wide HTTP/2 client for gTTS, exposed through the requests Session API.
+
+    gTTS only calls ``send()`` with a prepared request and reads the status
+    and body lines of the result; everything else stays on requests.
+    """
+
+    def __init__(self, pool_size: int):
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        )
+
+    def send(self, request: requests.PreparedRequest, timeout: Any = None, **kwargs: Any) -> _HttpxResponse:
+        """Send a prepared request (proxies come from the environment, as with requests)."""
+        try:
+            response = self._client.request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                content=request.body,
+                timeout=timeout
+            )
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+        return _HttpxResponse(response, request)
+
+    def __enter__(self) -> "_HttpxSession":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Keep the client open for the next request."""
+
+
+class _RequestsShim:
+    """Stand-in for the ``requests`` module inside gtts.tts that returns the shared session."""
+
+    def __init__(self, session: Any):
+        self._session = session
+
+    def Session(self) -> Any:
+        return self._session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(requests, name)
+
+
+def install_shared_session() -> None:
+    """
+    Route gTTS requests through one pooled keep-alive session.
+
+    gtts.tts calls requests.Session() for every request. Uses an HTTP/2
+    httpx client when httpx[http2] is installed, otherwise a requests
+    session with a larger connection pool. Safe to call more than once.
+    """
+    if isinstance(gtts_tts.requests, _RequestsShim):
+        return
+
+    pool_size = settings.GTTS_POOL_SIZE
+    if httpx is not None:
+        session = _HttpxSession(pool_size)
+        logger.info(f"gTTS requests use a shared HTTP/2 client (pool size {pool_size})")
+    else:
+        session = _SharedSession(pool_size)
+        logger.info(f"gTTS requests use a shared keep-alive session (pool size {pool_size})")
+
+    gtts_tts.requests = _RequestsShim(session)
+
+
+class BatchScheduler:
+    """
+    Dynamic batching for local model inference.
+
+    Requests arriving within the batch window are handed to the model as one
+    list, so a single forward pass serves all of them. The handler runs in
+    the worker pool and returns one result (or exception) per request.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], List[Any]],
+        max_batch: int = settings.INFERENCE_MAX_BATCH,
+        batch_window_ms: int = settings.INFERENCE_BATCH_WINDOW_MS
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            handler: Blocking function mapping a list of requests to a list of results
+            max_batch: Maximum number of requests per batch
+            batch_window_ms: Time to wait for more requests after the first one (ms)
+        """
+        self.handler = handler
+        self.max_batch = max_batch
+        self.batch_window = batch_window_ms / 1000.0
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the batching worker is running."""
+        return self._worker_task is not None and not self._worker_task.done()
+
+    async def start(self) -> None:
+        """Start the batching worker."""
+        if not self.is_running:
+            self._queue = asyncio.Queue()
+            self._worker_task = asyncio.create_task(self._run())
+            logger.info(
+                f"Inference batch scheduler started (max batch {self.max_batch}, "
+                f"window {self.batch_window * 1000:.0f}ms)"
+            )
+
+    async def stop(self) -> None:
+        """Stop the batching worker and cancel queued requests."""
+        if self._worker_task and not self._worker_task.done():
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+        self._worker_task = None
+
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+
+        logger.info("Inference batch scheduler stopped")
+
+    async def submit(self, request: Any) -> Any:
+        """
+        Run a request as part of the next batch.
+
+        Args:
+            request: Request passed to the handler
+
+        Returns:
+            The handler's result for this request
+        """
+        if not self.is_running:
+            # Scheduler not started: run as a batch of one
+            result = (await run_blocking(self.handler, [request]))[0]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((request, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect requests into batches and run them through the handler."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            batch = [item for item in batch if not item[1].done()]
+            if not batch:
+                continue
+
+            logger.debug("Running inference batch of %d request(s)", len(batch))
+            try:
+                results = await run_blocking(self.handler, [request for request, _ in batch])
+            except Exception as e:
+                results = [e] * len(batch)
+
+            # Futures are resolved here, on the event loop thread
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
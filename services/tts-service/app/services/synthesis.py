@@ -1,14 +1,31 @@
 """Core text-to-speech synthesis service logic."""
 
+import asyncio
+import io
+import re
 import time
 import logging
+from typing import AsyncIterator, Optional, Tuple
 from app.models.tts_model import model_manager
+from app.core.executor import run_blocking
 from app.services.audio_storage import AudioStorageService
+from app.services.audio_cache import audio_cache, DURATION_METADATA_KEY, SAMPLE_RATE_METADATA_KEY
 from app.models.schemas import SynthesizeRequest, SynthesizeResponse
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Settings read on every request, bound once at import
+_AUDIO_CACHE_ENABLED = settings.AUDIO_CACHE_ENABLED
+_CLEANUP_AFTER_UPLOAD = settings.CLEANUP_AFTER_UPLOAD
+_TEMPLATE_CROSSFADE_MS = settings.TEMPLATE_CROSSFADE_MS
+
+# Keeps background uploads referenced until they finish
+_background_uploads: set = set()
+
+# Dynamic part of a templated prompt: "Your order number is {{12345}}"
+_TEMPLATE_MARKER = re.compile(r"\{\{(.*?)\}\}")
+
 
 class SynthesisService:
     """Service for synthesizing speech from text."""
@@ -27,60 +44,92 @@ class SynthesisService:
         Raises:
             Exception: If synthesis or upload fails
         """
-        temp_path = None
-        adjusted_path = None
-
         try:
             start_time = time.time()
 
-            logger.info(f"Synthesizing text: '{request.text[:50]}...'")
-            logger.info(f"Voice: {request.voice}, Speed: {request.speed}")
+            logger.debug("Synthesizing text: '%.50s...' (voice=%s, speed=%s)", request.text, request.voice, request.speed)
 
-            # Step 1: Generate unique filename and paths
-            local_filename, minio_object_name = AudioStorageService.generate_unique_filename("wav")
-            temp_path = AudioStorageService.get_local_path(local_filename)
+            # gTTS returns MP3; speed adjustment produces WAV
+            audio_format, content_type = ("mp3", "audio/mpeg") if request.speed == 1.0 else ("wav", "audio/wav")
 
-            # Step 2: Synthesize speech using TTS model
-            logger.info("Running TTS synthesis...")
-            model_manager.synthesize(
-                text=request.text,
-                output_path=temp_path,
-                voice=request.voice if request.voice != "default" else None,
-                speed=1.0  # Apply speed adjustment separately
-            )
+            # Step 0: Serve identical earlier requests from the audio cache
+            cache_object_name = None
+            if _AUDIO_CACHE_ENABLED:
+                cache_key = audio_cache.make_key(request.text, request.voice, request.speed, model_manager.backend_id())
+                cache_object_name = audio_cache.object_name(cache_key, audio_format)
 
-            # Step 3: Apply speed adjustment if needed
-            if request.speed != 1.0:
-                adjusted_filename = f"adjusted_{local_filename}"
-                adjusted_path = AudioStorageService.get_local_path(adjusted_filename)
+                cached = await audio_cache.lookup(cache_object_name)
+                if cached is not None:
+                    audio_url, duration_ms, sample_rate = cached
+                    processing_time_ms = int((time.time() - start_time) * 1000)
+                    logger.info("Served from audio cache in %dms", processing_time_ms)
 
-                AudioStorageService.apply_speed_adjustment(
-                    input_path=temp_path,
-                    output_path=adjusted_path,
-                    speed=request.speed
-                )
+                    return SynthesizeResponse(
+                        audio_url=audio_url,
+                        duration_ms=duration_ms,
+                        processing_time_ms=processing_time_ms,
+                        text=request.text,
+                        voice=request.voice,
+                        format=audio_format,
+                        sample_rate=sample_rate
+                    )
 
-                # Use adjusted file for upload
-                final_path = adjusted_path
+            # Step 1: Synthesize speech in memory
+            logger.debug("Running TTS synthesis...")
+            prefix, tail = SynthesisService._split_template(request.text)
+            if prefix:
+                audio_data = await SynthesisService._synthesize_templated(prefix, tail, request.voice)
             else:
-                final_path = temp_path
+                audio_data = await model_manager.synthesize_to_bytes_async(
+                    text=tail,
+                    voice=request.voice if request.voice != "default" else None,
+                    speed=1.0  # Apply speed adjustment separately
+                )
+
+            # Step 2: Apply speed adjustment if needed
+            if request.speed != 1.0:
+                audio_data = await run_blocking(
+                    AudioStorageService.adjust_speed_bytes,
+                    audio_data,
+                    request.speed
+                )
 
-            # Step 4: Get audio duration
-            duration_ms = AudioStorageService.get_audio_duration(final_path)
+            # Step 3: Get duration and the actual sample rate from the headers
+            duration_ms, sample_rate = await run_blocking(AudioStorageService.get_audio_info, io.BytesIO(audio_data))
+
+            # Step 4: Upload to MinIO straight from memory and get presigned URL
+            local_filename, minio_object_name = AudioStorageService.generate_unique_filename(audio_format)
+            if cache_object_name:
+                # Deterministic name so the next identical request is a cache hit
+                minio_object_name = cache_object_name
+
+            logger.debug("Uploading to MinIO...")
+            audio_url = await AudioStorageService.store_audio_bytes(
+                audio_data,
+                minio_object_name,
+                content_type,
+                metadata={DURATION_METADATA_KEY: str(duration_ms), SAMPLE_RATE_METADATA_KEY: str(sample_rate)}
+            )
 
-            # Step 5: Upload to MinIO and get presigned URL
-            logger.info("Uploading to MinIO...")
-            audio_url = await AudioStorageService.store_audio(final_path, minio_object_name)
+            if cache_object_name:
+                audio_cache.remember(cache_object_name, duration_ms, sample_rate)
+
+            # Keep a local copy only when explicitly configured
+            if not _CLEANUP_AFTER_UPLOAD:
+                await run_blocking(
+                    AudioStorageService.save_local_copy,
+                    audio_data,
+                    AudioStorageService.get_local_path(local_filename)
+                )
 
             # Calculate processing time
             processing_time_ms = int((time.time() - start_time) * 1000)
 
-            logger.info(f"Synthesis completed in {processing_time_ms}ms")
-            logger.info(f"Audio URL: {audio_url[:80]}...")
-
-            # Step 6: Cleanup temporary files
-            if settings.CLEANUP_AFTER_UPLOAD:
-                AudioStorageService.cleanup_local_files(temp_path, adjusted_path)
+            logger.info(
+                "Synthesis completed in %dms (voice=%s, speed=%s, chars=%d, audio=%dms)",
+                processing_time_ms, request.voice, request.speed, len(request.text), duration_ms
+            )
+            logger.debug("Audio URL: %.80s...", audio_url)
 
             return SynthesizeResponse(
                 audio_url=audio_url,
@@ -88,18 +137,130 @@ class SynthesisService:
                 processing_time_ms=processing_time_ms,
                 text=request.text,
                 voice=request.voice,
-                format=settings.OUTPUT_FORMAT,
-                sample_rate=settings.SAMPLE_RATE
+                format=audio_format,
+                sample_rate=sample_rate
             )
 
         except Exception as e:
-            # Cleanup on error
-            if temp_path:
-                AudioStorageService.cleanup_local_files(temp_path, adjusted_path)
-
             logger.error(f"Synthesis failed: {e}")
             raise
 
+    @staticmethod
+    def _split_template(text: str) -> Tuple[Optional[str], str]:
+        """
+        Split a templated prompt into its static prefix and dynamic tail.
+
+        Everything before the first {{placeholder}} marker is the static
+        prefix; the markers themselves are removed from the tail.
+
+        Args:
+            text: Request text, optionally containing {{...}} markers
+
+        Returns:
+            tuple: (prefix or None, text to synthesize)
+        """
+        match = _TEMPLATE_MARKER.search(text)
+        if match is None:
+            return None, text
+
+        prefix = text[:match.start()].strip()
+        tail = _TEMPLATE_MARKER.sub(r"\1", text[match.start():]).strip()
+
+        if not prefix or not tail:
+            # Nothing to reuse: speak the text without markers in one call
+            return None, f"{prefix} {tail}".strip()
+
+        return prefix, tail
+
+    @staticmethod
+    async def _synthesize_templated(prefix: str, tail: str, voice: str) -> bytes:
+        """
+        Synthesize a templated prompt, reusing cached audio of its prefix.
+
+        Only the dynamic tail goes to gTTS when the prefix is cached. The
+        clips are joined with a short crossfade, which cannot fully hide the
+        prosody break between two separately synthesized utterances.
+
+        Args:
+            prefix: Static prefix text
+            tail: Dynamic tail text
+            voice: Voice ID
+
+        Returns:
+            bytes: MP3 audio
+        """
+        gtts_voice = voice if voice != "default" else None
+        prefix_key = audio_cache.make_key(prefix, voice, 1.0, model_manager.backend_id())
+        prefix_audio = audio_cache.get_prefix(prefix_key)
+
+        if prefix_audio is None:
+            prefix_audio, tail_audio = await asyncio.gather(
+                model_manager.synthesize_to_bytes_async(text=prefix, voice=gtts_voice),
+                model_manager.synthesize_to_bytes_async(text=tail, voice=gtts_voice)
+            )
+            audio_cache.put_prefix(prefix_key, prefix_audio)
+        else:
+            logger.debug("Template prefix served from cache")
+            tail_audio = await model_manager.synthesize_to_bytes_async(text=tail, voice=gtts_voice)
+
+        return await run_blocking(
+            AudioStorageService.concatenate_audio,
+            prefix_audio,
+            tail_audio,
+            _TEMPLATE_CROSSFADE_MS
+        )
+
+    @staticmethod
+    async def stream_speech(
+        request: SynthesizeRequest,
+        object_name: str,
+        store: bool = True
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize speech and yield MP3 fragments as soon as they arrive.
+
+        The complete audio is uploaded to MinIO in the background once the
+        stream ends, so the caller does not wait for the upload and presign.
+        With gTTS, speed is limited to its slow mode (speed < 0.9); a Piper
+        voice applies it through its length scale. No pydub post-processing
+        is applied.
+
+        Args:
+            request: Synthesis request with text, voice, and parameters
+            object_name: Object name the audio is stored under in MinIO
+            store: Upload the audio afterwards (False when the client uploads it)
+
+        Yields:
+            bytes: MP3 audio fragments
+        """
+        start_time = time.time()
+        prefix, tail = SynthesisService._split_template(request.text)
+        chunks = model_manager.stream(
+            text=f"{prefix} {tail}" if prefix else tail,
+            voice=request.voice if request.voice != "default" else None,
+            speed=request.speed
+        )
+        audio = bytearray()
+
+        try:
+            # gTTS fetches block, so pull each fragment through the worker pool
+            while (chunk := await run_blocking(next, chunks, None)) is not None:
+                audio += chunk
+                yield chunk
+        finally:
+            chunks.close()
+
+        logger.info("Streamed %d bytes in %dms", len(audio), int((time.time() - start_time) * 1000))
+
+        if not store:
+            return
+
+        task = asyncio.create_task(
+            AudioStorageService.store_audio_bytes(bytes(audio), object_name, content_type="audio/mpeg")
+        )
+        _background_uploads.add(task)
+        task.add_done_callback(_background_uploads.discard)
+
     @staticmethod
     def get_service_health() -> dict:
         """
@@ -0,0 +1,38 @@
+"""Tests for the synthesized audio cache."""
+
+from app.services.audio_cache import AudioCache
+
+
+def test_make_key_is_deterministic():
+    """Identical requests map to the same key."""
+    assert AudioCache.make_key("Hello", "en-US", 1.0, "gtts") == AudioCache.make_key("Hello", "en-US", 1.0, "gtts")
+
+
+def test_make_key_covers_request_parameters():
+    """Text, voice and speed each change the key."""
+    base = AudioCache.make_key("Hello", "en-US", 1.0, "gtts")
+    assert AudioCache.make_key("Hello!", "en-US", 1.0, "gtts") != base
+    assert AudioCache.make_key("Hello", "en-GB", 1.0, "gtts") != base
+    assert AudioCache.make_key("Hello", "en-US", 1.25, "gtts") != base
+
+
+def test_make_key_covers_backend():
+    """Audio from another backend, model or weight type is never served."""
+    keys = {
+        AudioCache.make_key("Hello", "default", 1.0, backend)
+        for backend in ("gtts", "piper:en_US-lessac-medium:int8", "piper:en_US-lessac-medium:float16")
+    }
+    assert len(keys) == 3
+
+
+def test_prefix_cache_evicts_least_recently_used():
+    """Template prefixes are bounded by max_prefixes."""
+    cache = AudioCache(max_entries=2, max_prefixes=2)
+    cache.put_prefix("a", b"A")
+    cache.put_prefix("b", b"B")
+    cache.get_prefix("a")
+    cache.put_prefix("c", b"C")
+
+    assert cache.get_prefix("a") == b"A"
+    assert cache.get_prefix("b") is None
+    assert cache.get_prefix("c") == b"C"
@@ -0,0 +1,37 @@
+"""Tests for speed adjustment of synthesized audio."""
+
+import io
+import wave
+
+import numpy as np
+from pydub import AudioSegment
+
+from app.services.audio_storage import AudioStorageService
+
+
+def tone(seconds: float, frequency: float = 440.0, sample_rate: int = 24000) -> AudioSegment:
+    """Mono 16-bit sine, standing in for decoded gTTS output."""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    samples = (np.sin(2 * np.pi * frequency * t) * 10000).astype("<i2")
+    return AudioSegment(samples.tobytes(), frame_rate=sample_rate, sample_width=2, channels=1)
+
+
+def read_wav(data: bytes):
+    with wave.open(io.BytesIO(data), "rb") as wav:
+        frames = wav.readframes(wav.getnframes())
+        return wav.getframerate(), np.frombuffer(frames, dtype="<i2")
+
+
+def test_resample_speed_keeps_sample_rate():
+    """Decoded audio gets 1 / speed of its length at the source rate."""
+    sample_rate, samples = read_wav(AudioStorageService._resample_speed(tone(1.0), 1.25))
+    assert sample_rate == 24000
+    assert len(samples) == 24000 * 4 // 5
+
+
+def test_resample_speed_scales_frequency():
+    """Like playback at rate * speed, the tone's frequency scales with speed."""
+    _, samples = read_wav(AudioStorageService._resample_speed(tone(1.0), 0.5))
+    spectrum = np.abs(np.fft.rfft(samples))
+    peak_hz = np.argmax(spectrum) * 24000 / len(samples)
+    assert abs(peak_hz - 220.0) < 2.0
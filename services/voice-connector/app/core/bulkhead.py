@@ -0,0 +1,71 @@
+"""
+Bulkhead for upstream services
+Caps the requests in flight to one upstream; callers beyond the cap wait
+briefly for a slot and are then rejected, so a burst sheds load instead
+of queueing on the connection pool
+"""
+import asyncio
+from typing import Awaitable, Callable, Optional, TypeVar
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class BulkheadFullError(Exception):
+    """Raised when no slot frees up within the queue wait"""
+
+
+class Bulkhead:
+    """Concurrency limit for one upstream, used as `async with bulkhead:`"""
+
+    def __init__(self, name: str, max_inflight: int, queue_wait_s: Optional[float] = None):
+        """
+        Initialize bulkhead
+
+        Args:
+            name: Upstream name for error messages
+            max_inflight: Maximum concurrent requests
+            queue_wait_s: Seconds to wait for a slot (default: BULKHEAD_QUEUE_WAIT_MS)
+        """
+        self.name = name
+        self.max_inflight = max_inflight
+        self.queue_wait_s = (
+            settings.BULKHEAD_QUEUE_WAIT_MS / 1000 if queue_wait_s is None else queue_wait_s
+        )
+        self._slots = asyncio.Semaphore(max_inflight)
+
+    async def __aenter__(self) -> "Bulkhead":
+        """Take a slot, waiting at most queue_wait_s"""
+        if not self._slots.locked():
+            # Free slot: acquire() returns without suspending, no timer needed
+            await self._slots.acquire()
+            return self
+
+        try:
+            async with asyncio.timeout(self.queue_wait_s):
+                await self._slots.acquire()
+        except TimeoutError:
+            raise BulkheadFullError(
+                f"{self.name} bulkhead full ({self.max_inflight} in flight)"
+            ) from None
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Release the slot"""
+        self._slots.release()
+
+    async def call(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run an upstream call in a slot
+
+        Args:
+            operation: Coroutine function performing the call
+
+        Returns:
+            Result of the operation
+
+        Raises:
+            BulkheadFullError: If no slot freed up within queue_wait_s
+        """
+        async with self:
+            return await operation()
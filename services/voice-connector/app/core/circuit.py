@@ -0,0 +1,132 @@
+"""
+Circuit breaker for upstream services
+After repeated failures, requests fail fast instead of queueing on a dead service
+"""
+import time
+from enum import Enum
+from typing import Awaitable, Callable, Optional, TypeVar
+from app.core.bulkhead import BulkheadFullError
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit is open"""
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    CLOSED -> OPEN -> HALF_OPEN circuit breaker for one upstream
+
+    Opens after failure_threshold consecutive failures (exceptions or 5xx
+    responses). While open, calls raise CircuitOpenError without touching the
+    network; after recovery_s a single probe call is let through, which
+    closes the circuit on success and reopens it on failure.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: Optional[int] = None,
+        recovery_s: Optional[float] = None,
+    ):
+        """
+        Initialize circuit breaker
+
+        Args:
+            name: Upstream name for logging
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_s: Seconds before an open circuit lets a probe through
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold or settings.CIRCUIT_FAILURE_THRESHOLD
+        self.recovery_s = settings.CIRCUIT_RECOVERY_S if recovery_s is None else recovery_s
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    async def call(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run an upstream call through the breaker
+
+        Args:
+            operation: Coroutine function performing the call; a result
+                with a `status` of 500 or more counts as a failure
+
+        Returns:
+            Result of the operation
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        probe = self._before_call()
+
+        try:
+            result = await operation()
+        except BulkheadFullError:
+            # Local overload, not an upstream failure
+            raise
+        except Exception:
+            self._on_failure()
+            raise
+        finally:
+            # Also frees the probe slot when the caller is cancelled
+            if probe:
+                self._probing = False
+
+        if getattr(result, "status", 200) >= 500:
+            self._on_failure()
+        else:
+            self._on_success()
+        return result
+
+    def _before_call(self) -> bool:
+        """Let the call through or fail fast; True if it is the half-open probe"""
+        if self.state is CircuitState.CLOSED:
+            return False
+
+        if self.state is CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self.recovery_s:
+                raise CircuitOpenError(f"{self.name} circuit is open")
+            self._transition(CircuitState.HALF_OPEN)
+
+        # Half-open: one probe at a time
+        if self._probing:
+            raise CircuitOpenError(f"{self.name} circuit is half-open")
+        self._probing = True
+        return True
+
+    def _on_success(self) -> None:
+        """Record a successful call"""
+        self._failures = 0
+        if self.state is not CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    def _on_failure(self) -> None:
+        """Record a failed call"""
+        self._failures += 1
+        if self.state is CircuitState.HALF_OPEN or (
+            self.state is CircuitState.CLOSED and self._failures >= self.failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        """Change state, logging each transition once"""
+        logger.warning(
+            f"{self.name} circuit {self.state.value} -> {state.value} "
+            f"(consecutive failures: {self._failures})"
+        )
+        self.state = state
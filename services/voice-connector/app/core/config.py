@@ -17,6 +17,11 @@ class Settings(BaseSettings):
     HOST: str = os.getenv("HOST", "0.0.0.0")
     PORT: int = int(os.getenv("PORT", "8005"))
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    RELOAD: bool = os.getenv("RELOAD", "false").lower() == "true"
+    WORKERS: int = int(os.getenv("WEB_CONCURRENCY", "1"))  # Ignored when RELOAD is on
+
+    # Shared call registry across workers (empty: per-worker state only)
+    REDIS_URL: str = os.getenv("REDIS_URL", "")
 
     # STT Service
     STT_SERVICE_URL: str = os.getenv("STT_SERVICE_URL", "http://localhost:8002")
@@ -47,6 +52,50 @@ class Settings(BaseSettings):
     MAX_CONCURRENT_CALLS: int = int(os.getenv("MAX_CONCURRENT_CALLS", "100"))
     AUDIO_TIMEOUT_SECONDS: int = int(os.getenv("AUDIO_TIMEOUT_SECONDS", "10"))
 
+    # Connection pool shared by the STT/TTS/Orchestrator clients
+    HTTP_POOL_SIZE: int = int(os.getenv("HTTP_POOL_SIZE", "256"))
+    HTTP_POOL_PER_HOST: int = int(os.getenv("HTTP_POOL_PER_HOST", "128"))
+    HTTP_KEEPALIVE_TIMEOUT: float = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "75"))  # matches nginx
+    HTTP_DNS_CACHE_TTL: int = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+    HTTP_WARMUP_TIMEOUT_S: float = float(os.getenv("HTTP_WARMUP_TIMEOUT_S", "2"))  # startup DNS/connection warm-up
+
+    # Retries of transient upstream failures (connect errors, timeouts, 429/502/503/504)
+    HTTP_RETRY_ATTEMPTS: int = int(os.getenv("HTTP_RETRY_ATTEMPTS", "3"))
+    HTTP_RETRY_BACKOFF_S: float = float(os.getenv("HTTP_RETRY_BACKOFF_S", "0.1"))
+    HTTP_RETRY_MAX_BACKOFF_S: float = float(os.getenv("HTTP_RETRY_MAX_BACKOFF_S", "2.0"))
+    HTTP_RETRY_BUDGET_S: float = float(os.getenv("HTTP_RETRY_BUDGET_S", "10"))  # no retry started after this
+
+    # Per-upstream circuit breaker: opens after this many consecutive failures
+    CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_RECOVERY_S: float = float(os.getenv("CIRCUIT_RECOVERY_S", "10"))
+
+    # Bulkheads: requests in flight per upstream (keep <= HTTP_POOL_PER_HOST)
+    STT_MAX_INFLIGHT: int = int(os.getenv("STT_MAX_INFLIGHT", "64"))
+    TTS_MAX_INFLIGHT: int = int(os.getenv("TTS_MAX_INFLIGHT", "64"))
+    ORCHESTRATOR_MAX_INFLIGHT: int = int(os.getenv("ORCHESTRATOR_MAX_INFLIGHT", "64"))
+    BULKHEAD_QUEUE_WAIT_MS: int = int(os.getenv("BULKHEAD_QUEUE_WAIT_MS", "200"))
+
+    # End-to-end deadline of one voice turn (STT + Orchestrator + TTS)
+    TURN_TIMEOUT_S: float = float(os.getenv("TURN_TIMEOUT_S", "30"))
+
+    # Orchestrator turns sent as one batch request (1 disables batching)
+    ORCHESTRATOR_BATCH_MAX: int = int(os.getenv("ORCHESTRATOR_BATCH_MAX", "16"))
+    ORCHESTRATOR_BATCH_MAX_WAIT_MS: int = int(os.getenv("ORCHESTRATOR_BATCH_MAX_WAIT_MS", "5"))
+
+    # Upstream health results are reused for this long
+    HEALTH_TTL_S: float = float(os.getenv("HEALTH_TTL_S", "3"))
+
+    # Synthesis results (presigned URLs) reused for identical requests;
+    # keep the TTL well below the TTS service's AUDIO_URL_EXPIRY_HOURS
+    TTS_CACHE_SIZE: int = int(os.getenv("TTS_CACHE_SIZE", "512"))
+    TTS_CACHE_TTL_S: float = float(os.getenv("TTS_CACHE_TTL_S", "600"))
+
+    # Serialize the voice/speed part of synthesis requests once per voice
+    TTS_PREBUILT_PAYLOAD: bool = os.getenv("TTS_PREBUILT_PAYLOAD", "true").lower() == "true"
+
+    # Audio of fixed phrases (welcome message etc.) kept in memory
+    PHRASE_CACHE_SIZE: int = int(os.getenv("PHRASE_CACHE_SIZE", "32"))
+
     class Config:
         env_file = ".env"
         case_sensitive = True
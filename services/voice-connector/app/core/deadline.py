@@ -0,0 +1,56 @@
+"""
+Per-turn deadlines
+A voice turn runs under one deadline; every upstream request made inside it
+(STT, Orchestrator, TTS, retries included) gets the time that is left
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
+
+# Event loop time by which the current turn must finish
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+@asynccontextmanager
+async def deadline(seconds: float) -> AsyncIterator[None]:
+    """
+    Run a block under a deadline, or under the enclosing one if it is sooner
+
+    Args:
+        seconds: Time allowed for the block
+
+    Raises:
+        TimeoutError: If the block is still running at the deadline
+    """
+    when = asyncio.get_running_loop().time() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        when = min(when, outer)
+
+    token = _deadline.set(when)
+    try:
+        async with asyncio.timeout_at(when):
+            yield
+    finally:
+        _deadline.reset(token)
+
+
+def time_left() -> Optional[float]:
+    """
+    Get the seconds left before the current deadline
+
+    Returns:
+        Seconds left, or None outside a deadline
+
+    Raises:
+        asyncio.TimeoutError: If the deadline has already passed
+    """
+    when = _deadline.get()
+    if when is None:
+        return None
+
+    left = when - asyncio.get_running_loop().time()
+    if left <= 0:
+        raise asyncio.TimeoutError("Deadline exceeded")
+    return left
@@ -0,0 +1,54 @@
+"""
+Cached upstream health status
+Concurrent callers share one probe, and its result is reused for HEALTH_TTL_S
+"""
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional, Tuple
+from app.core.config import settings
+
+
+class HealthCache:
+    """Health status of one upstream service, probed at most once per TTL"""
+
+    def __init__(
+        self,
+        probe: Callable[[], Awaitable[bool]],
+        ttl: Optional[float] = None,
+    ):
+        """
+        Initialize health cache
+
+        Args:
+            probe: Coroutine function performing the actual health check
+            ttl: Seconds a result is reused (default: HEALTH_TTL_S)
+        """
+        self.probe = probe
+        self.ttl = settings.HEALTH_TTL_S if ttl is None else ttl
+        self._cached: Optional[Tuple[float, bool]] = None  # (monotonic time, healthy)
+        self._lock = asyncio.Lock()
+
+    def _fresh(self) -> Optional[bool]:
+        """Get the cached result if it has not expired"""
+        if self._cached and time.monotonic() - self._cached[0] < self.ttl:
+            return self._cached[1]
+        return None
+
+    async def get(self) -> bool:
+        """
+        Get the health status, probing only when the cached one expired
+
+        Returns:
+            True if healthy, False otherwise
+        """
+        healthy = self._fresh()
+        if healthy is not None:
+            return healthy
+
+        async with self._lock:
+            # Another caller may have probed while we waited
+            healthy = self._fresh()
+            if healthy is None:
+                healthy = await self.probe()
+                self._cached = (time.monotonic(), healthy)
+            return healthy
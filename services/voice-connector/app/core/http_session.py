@@ -0,0 +1,84 @@
+"""
+Process-wide aiohttp session
+One keep-alive connection pool shared by the STT, TTS and Orchestrator clients
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+import aiohttp
+import orjson
+from multidict import CIMultiDict, CIMultiDictProxy
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_session: Optional[aiohttp.ClientSession] = None
+
+# Headers of JSON requests; a read-only proxy is passed to aiohttp as is, without normalization
+JSON_HEADERS = CIMultiDictProxy(CIMultiDict({"Content-Type": "application/json"}))
+
+
+def _json_serialize(obj: Any) -> str:
+    """Encode request bodies passed as json= with orjson"""
+    return orjson.dumps(obj).decode()
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared client session, creating it on first use
+
+    Returns:
+        Shared aiohttp session
+    """
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=settings.HTTP_POOL_SIZE,
+            limit_per_host=settings.HTTP_POOL_PER_HOST,
+            keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+            use_dns_cache=True,
+            ttl_dns_cache=settings.HTTP_DNS_CACHE_TTL,
+            enable_cleanup_closed=True,
+        )
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+            connector=connector,
+            json_serialize=_json_serialize,
+        )
+        logger.info(
+            f"HTTP session started (pool: {settings.HTTP_POOL_SIZE}, "
+            f"per host: {settings.HTTP_POOL_PER_HOST}, "
+            f"keep-alive: {settings.HTTP_KEEPALIVE_TIMEOUT}s)"
+        )
+    return _session
+
+
+async def warm_up(*probes: Callable[[], Awaitable[bool]]) -> None:
+    """
+    Run one request per upstream ahead of the first call
+
+    Fills the connector's DNS cache and leaves a keep-alive connection in
+    the pool for each upstream. Bounded by HTTP_WARMUP_TIMEOUT_S, so an
+    unreachable upstream does not hold up startup.
+
+    Args:
+        probes: Coroutine functions performing a cheap request (health checks)
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    try:
+        async with asyncio.timeout(settings.HTTP_WARMUP_TIMEOUT_S):
+            await asyncio.gather(*(probe() for probe in probes))
+    except TimeoutError:
+        logger.warning(f"Upstream warm-up timed out after {settings.HTTP_WARMUP_TIMEOUT_S}s")
+        return
+    logger.debug(f"Upstream warm-up took {(loop.time() - started) * 1000:.0f}ms")
+
+
+async def close_session() -> None:
+    """Close the shared client session"""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+        logger.info("HTTP session closed")
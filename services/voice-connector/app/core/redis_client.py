@@ -0,0 +1,127 @@
+"""
+Redis-backed registry of active calls
+Lets /calls and /health report calls across all worker processes
+"""
+import os
+from typing import Any, Dict, List, Optional
+import orjson
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+logger = get_logger(__name__)
+
+CALL_KEY_PREFIX = "voice:call:"
+
+
+class CallRegistry:
+    """
+    Shared registry of active calls
+
+    Each call is a Redis key with a TTL of a few heartbeat intervals,
+    refreshed by the heartbeat loop, so calls of a crashed worker
+    expire on their own. Disabled when REDIS_URL is empty or redis is not
+    installed; callers then fall back to their in-process state.
+    """
+
+    def __init__(self):
+        self.client: Optional["redis.Redis"] = None
+        self.ttl = settings.WS_HEARTBEAT_INTERVAL * 3
+
+    @property
+    def enabled(self) -> bool:
+        """Check if the registry is connected"""
+        return self.client is not None
+
+    async def connect(self) -> None:
+        """Initialize Redis connection"""
+        if self.client or not settings.REDIS_URL or redis is None:
+            return
+
+        try:
+            self.client = redis.from_url(settings.REDIS_URL)
+            await self.client.ping()
+            logger.info(f"Call registry connected to {settings.REDIS_URL}")
+        except Exception as e:
+            logger.warning(f"Call registry unavailable, using per-worker state: {e}")
+            self.client = None
+
+    async def close(self) -> None:
+        """Close Redis connection"""
+        if self.client:
+            await self.client.close()
+            self.client = None
+
+    async def put(self, call: Dict[str, Any]) -> None:
+        """
+        Register or refresh a call
+
+        Args:
+            call: Call summary (call_id, session_id, state, turns_count)
+        """
+        if not self.client:
+            return
+
+        try:
+            call = {**call, "worker_pid": os.getpid()}
+            await self.client.set(f"{CALL_KEY_PREFIX}{call['call_id']}", orjson.dumps(call), ex=self.ttl)
+        except Exception as e:
+            logger.warning(f"Failed to register call {call['call_id']}: {e}")
+
+    async def put_many(self, calls: List[Dict[str, Any]]) -> None:
+        """
+        Register or refresh several calls in one round trip
+
+        Args:
+            calls: Call summaries
+        """
+        if not self.client or not calls:
+            return
+
+        try:
+            worker_pid = os.getpid()
+            async with self.client.pipeline(transaction=False) as pipe:
+                for call in calls:
+                    pipe.set(
+                        f"{CALL_KEY_PREFIX}{call['call_id']}",
+                        orjson.dumps({**call, "worker_pid": worker_pid}),
+                        ex=self.ttl,
+                    )
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to refresh {len(calls)} calls: {e}")
+
+    async def remove(self, call_id: str) -> None:
+        """
+        Unregister a call
+
+        Args:
+            call_id: Call ID
+        """
+        if not self.client:
+            return
+
+        try:
+            await self.client.delete(f"{CALL_KEY_PREFIX}{call_id}")
+        except Exception as e:
+            logger.warning(f"Failed to unregister call {call_id}: {e}")
+
+    async def list_calls(self) -> List[Dict[str, Any]]:
+        """
+        Get all active calls across workers
+
+        Returns:
+            List of call summaries
+        """
+        keys = [key async for key in self.client.scan_iter(match=f"{CALL_KEY_PREFIX}*", count=500)]
+        if not keys:
+            return []
+        return [orjson.loads(value) for value in await self.client.mget(keys) if value is not None]
+
+
+# Global call registry instance
+call_registry = CallRegistry()
@@ -0,0 +1,142 @@
+"""
+Retries for upstream HTTP requests
+Only transient failures are retried (connection failures, timeouts,
+429/502/503/504), with full-jitter exponential backoff inside a time budget.
+Non-idempotent requests are retried only when the upstream cannot have
+processed them
+"""
+import asyncio
+import random
+from typing import Any, Awaitable, Callable, NamedTuple, TypeVar
+import aiohttp
+import orjson
+from app.core.config import settings
+from app.core.deadline import time_left
+from app.core.http_session import JSON_HEADERS
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+RETRY_EXCEPTIONS = (aiohttp.ClientConnectorError, asyncio.TimeoutError)
+
+# Failures after which a request was certainly not processed: the connection
+# was never made, or the upstream rejected it before doing any work
+UNSENT_STATUSES = frozenset({429})
+UNSENT_EXCEPTIONS = (aiohttp.ClientConnectorError,)
+
+T = TypeVar("T")
+
+
+class HTTPResult(NamedTuple):
+    """Completed request: status and body (decoded on 200, error text otherwise)"""
+    status: int
+    body: Any
+
+
+async def fetch(
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    read: str = "json",
+    **kwargs: Any,
+) -> HTTPResult:
+    """
+    Perform a request and read the whole response
+
+    Args:
+        session: Client session
+        method: HTTP method
+        url: Request URL
+        read: How to read a 200 body ("json" or "bytes")
+        **kwargs: Passed to session.request; a json= body is serialized
+            here with orjson and sent with the prebuilt JSON headers
+
+    Returns:
+        HTTPResult with the decoded body, or the error text for other statuses
+    """
+    body = kwargs.pop("json", None)
+    if body is not None:
+        kwargs["data"] = orjson.dumps(body)
+        kwargs.setdefault("headers", JSON_HEADERS)
+
+    # Within a turn deadline the request gets the time left, not the session's 30s
+    left = time_left()
+    if left is not None:
+        kwargs.setdefault("timeout", aiohttp.ClientTimeout(total=left))
+
+    async with session.request(method, url, **kwargs) as response:
+        if response.status != 200:
+            # Drained rather than skipped so the connection goes back to the
+            # pool; decoded as UTF-8 without text()'s charset detection
+            error = await response.read()
+            return HTTPResult(response.status, error.decode("utf-8", "replace"))
+        if read == "bytes":
+            return HTTPResult(200, await response.read())
+        return HTTPResult(200, orjson.loads(await response.read()))
+
+
+async def with_retry(
+    operation: Callable[[], Awaitable[T]],
+    description: str,
+    idempotent: bool = True,
+) -> T:
+    """
+    Run a request, retrying transient failures
+
+    The operation is called again for each attempt, so request bodies must
+    be built inside it. Its result needs a `status`; an open response that
+    is retried is released first.
+
+    Args:
+        operation: Coroutine function performing one attempt
+        description: Request description for logging
+        idempotent: False for requests that must not run twice (a
+            conversation turn, a session creation); those are retried only
+            on connection failures and 429, never after a timeout or a 5xx
+            the upstream may have produced after processing them
+
+    Returns:
+        Result of the last attempt
+
+    Raises:
+        Exception: The last transient error, once retries are exhausted
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + min(settings.HTTP_RETRY_BUDGET_S, time_left() or float("inf"))
+    retry_statuses = RETRY_STATUSES if idempotent else UNSENT_STATUSES
+    retry_exceptions = RETRY_EXCEPTIONS if idempotent else UNSENT_EXCEPTIONS
+    attempt = 1
+
+    while True:
+        error = None
+        try:
+            result = await operation()
+        except retry_exceptions as e:
+            error = e
+        else:
+            if result.status not in retry_statuses:
+                return result
+
+        # Full jitter: uniform in [0, min(max, base * 2^(attempt - 1))]
+        delay = random.uniform(
+            0, min(settings.HTTP_RETRY_MAX_BACKOFF_S, settings.HTTP_RETRY_BACKOFF_S * 2 ** (attempt - 1))
+        )
+        if attempt >= settings.HTTP_RETRY_ATTEMPTS or loop.time() + delay > deadline:
+            if error is not None:
+                raise error
+            return result
+
+        if error is None:
+            reason = f"status {result.status}"
+            if hasattr(result, "release"):
+                result.release()
+        else:
+            reason = str(error) or type(error).__name__
+
+        logger.warning(
+            f"{description} failed ({reason}), "
+            f"retry {attempt} in {delay * 1000:.0f}ms"
+        )
+        await asyncio.sleep(delay)
+        attempt += 1
@@ -4,23 +4,46 @@ WebSocket-based voice call handling
 """
 import time
 import asyncio
-from typing import Dict, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.core.config import settings
 from app.core.logging_config import setup_logging, get_logger
-from app.services.call_manager import VoiceCallManager
+from app.core.http_session import close_session, warm_up
+from app.core.redis_client import call_registry
+from app.services.call_manager import VoiceCallManager, WELCOME_TEXT
+from app.services._vad import compile_kernels
+from app.services.stt_client import stt_client
+from app.services.tts_client import tts_client
+from app.services.orchestrator_client import orchestrator_client
 from app.models.schemas import HealthResponse
+from app.utils.messages import HEARTBEAT_MESSAGE, PONG_MESSAGE, parse_message, send_json
 
 # Setup logging
 setup_logging()
 logger = get_logger(__name__)
 
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run startup, then shutdown when the server stops (also after a failed startup)"""
+    try:
+        await startup_event()
+        yield
+    finally:
+        await shutdown_event()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.SERVICE_NAME,
     version=settings.VERSION,
     description="WebSocket-based voice connector for OCP Platform",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -32,12 +55,45 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Settings read per call or per frame, bound once at import
+_MAX_CONCURRENT_CALLS = settings.MAX_CONCURRENT_CALLS
+_WS_TIMEOUT = settings.WS_TIMEOUT
+_WS_HEARTBEAT_INTERVAL = settings.WS_HEARTBEAT_INTERVAL
+
 # Global state
 active_calls: Dict[str, VoiceCallManager] = {}
 start_time = time.time()
 
+# Admission control: one slot per call, released when the call ends
+call_slots = asyncio.Semaphore(_MAX_CONCURRENT_CALLS)
+
+# One heartbeat timer for all calls of this worker
+heartbeat_task: Optional[asyncio.Task] = None
+
+
+async def _heartbeat_loop() -> None:
+    """Send heartbeats to all active calls and refresh them in the registry"""
+    while True:
+        await asyncio.sleep(_WS_HEARTBEAT_INTERVAL)
+        calls = [call for call in active_calls.values() if call.running]
+        if not calls:
+            continue
+
+        try:
+            results = await asyncio.gather(
+                *(call.websocket.send(HEARTBEAT_MESSAGE) for call in calls),
+                return_exceptions=True,
+            )
+            for call, result in zip(calls, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Heartbeat error: {result} (call: {call.call_id})")
+
+            await call_registry.put_many([call.get_call_summary() for call in calls])
+            logger.debug(f"Sent heartbeat to {len(calls)} calls")
+        except Exception as e:
+            logger.error(f"Heartbeat error: {e}")
+
 
-@app.on_event("startup")
 async def startup_event():
     """Application startup"""
     logger.info(f"Starting {settings.SERVICE_NAME} v{settings.VERSION}")
@@ -46,12 +102,40 @@ async def startup_event():
     logger.info(f"Orchestrator: {settings.ORCHESTRATOR_URL}")
     logger.info(f"Max concurrent calls: {settings.MAX_CONCURRENT_CALLS}")
 
+    await call_registry.connect()
+
+    # JIT-compile the VAD kernel now rather than on the first audio chunk
+    compile_kernels()
+
+    # Shared service clients (one connection pool for all clients and calls)
+    await stt_client.start()
+    await tts_client.start()
+    await orchestrator_client.start()
+
+    # Resolve the upstream hosts and open pooled connections before the first call
+    await warm_up(
+        stt_client.health_check,
+        tts_client.health_check,
+        orchestrator_client.health_check,
+    )
+
+    global heartbeat_task
+    heartbeat_task = asyncio.create_task(_heartbeat_loop())
+
+    # Synthesize the welcome message once instead of on every call
+    if await tts_client.synthesize_phrase(WELCOME_TEXT):
+        logger.info("Welcome message audio cached")
+    else:
+        logger.warning("Could not prewarm welcome message, will synthesize on first call")
+
 
-@app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown"""
     logger.info("Shutting down Voice Connector")
 
+    if heartbeat_task:
+        heartbeat_task.cancel()
+
     # Stop all active calls
     if active_calls:
         logger.info(f"Stopping {len(active_calls)} active calls")
@@ -60,45 +144,57 @@ async def shutdown_event():
                 await call_manager.stop()
             except Exception as e:
                 logger.error(f"Error stopping call {call_id}: {e}")
+            await call_registry.remove(call_id)
+
+    await stt_client.stop()
+    await tts_client.stop()
+    await orchestrator_client.stop()
+    await close_session()
 
+    await call_registry.close()
     logger.info("Shutdown complete")
 
 
-@app.get("/health", response_model=HealthResponse)
+# Returned as ORJSONResponse directly: no response_model validation and
+# jsonable_encoder pass per probe; HealthResponse only documents the schema
+@app.get("/health", responses={200: {"model": HealthResponse}})
 async def health_check():
     """Health check endpoint"""
     uptime = int(time.time() - start_time)
 
-    return HealthResponse(
-        status="healthy",
-        service=settings.SERVICE_NAME,
-        version=settings.VERSION,
-        active_calls=len(active_calls),
-        uptime_seconds=uptime,
-        stt_service=settings.STT_SERVICE_URL,
-        tts_service=settings.TTS_SERVICE_URL,
-        orchestrator_service=settings.ORCHESTRATOR_URL,
-    )
+    return ORJSONResponse({
+        "status": "healthy",
+        "service": settings.SERVICE_NAME,
+        "version": settings.VERSION,
+        "active_calls": len(await _list_calls()),
+        "uptime_seconds": uptime,
+        "stt_service": settings.STT_SERVICE_URL,
+        "tts_service": settings.TTS_SERVICE_URL,
+        "orchestrator_service": settings.ORCHESTRATOR_URL,
+    })
+
+
+async def _list_calls() -> list:
+    """Get active calls of all workers (this worker only without the registry)"""
+    if call_registry.enabled:
+        try:
+            return await call_registry.list_calls()
+        except Exception as e:
+            logger.warning(f"Call registry lookup failed: {e}")
+
+    return [call_manager.get_call_summary() for call_manager in active_calls.values()]
 
 
 @app.get("/calls")
 async def get_active_calls():
     """Get active calls"""
-    calls = []
-    for call_id, call_manager in active_calls.items():
-        call_info = call_manager.get_call_info()
-        calls.append({
-            "call_id": call_info.call_id,
-            "session_id": call_info.session_id,
-            "state": call_info.state,
-            "turns_count": call_info.turns_count,
-        })
+    calls = await _list_calls()
 
-    return {
+    return ORJSONResponse({
         "active_calls": len(calls),
-        "max_calls": settings.MAX_CONCURRENT_CALLS,
+        "max_calls": _MAX_CONCURRENT_CALLS,
         "calls": calls,
-    }
+    })
 
 
 @app.websocket("/ws/voice")
@@ -113,19 +209,22 @@ async def voice_websocket(websocket: WebSocket):
     - Heartbeat messages sent periodically (JSON frames)
     """
     call_manager: Optional[VoiceCallManager] = None
+    slot_acquired = False
 
     try:
         # Accept connection
         await websocket.accept()
         logger.info("WebSocket connection accepted")
 
-        # Check concurrent call limit
-        if len(active_calls) >= settings.MAX_CONCURRENT_CALLS:
+        # Check concurrent call limit (acquiring a free slot never waits)
+        if call_slots.locked():
             logger.warning(
-                f"Max concurrent calls reached ({settings.MAX_CONCURRENT_CALLS})"
+                f"Max concurrent calls reached ({_MAX_CONCURRENT_CALLS})"
             )
             await websocket.close(code=1008, reason="Max concurrent calls reached")
             return
+        await call_slots.acquire()
+        slot_acquired = True
 
         # Create call manager
         call_manager = VoiceCallManager(websocket=websocket)
@@ -136,55 +235,62 @@ async def voice_websocket(websocket: WebSocket):
 
         logger.info(
             f"New call {call_id} "
-            f"(active: {len(active_calls)}/{settings.MAX_CONCURRENT_CALLS})"
+            f"(active: {len(active_calls)}/{_MAX_CONCURRENT_CALLS})"
         )
 
         # Start call
         await call_manager.start()
+        await call_registry.put(call_manager.get_call_summary())
 
         # Send initial status
-        await websocket.send_json({
+        await send_json(websocket, {
             "type": "status",
             "call_id": call_id,
             "session_id": call_manager.session_id,
             "state": "connected",
         })
 
-        # Main message loop
-        while True:
-            # Receive message
-            try:
-                # Try to receive binary data (audio)
-                data = await asyncio.wait_for(
-                    websocket.receive(),
-                    timeout=settings.WS_TIMEOUT,
-                )
-
-                # Handle different message types
-                if "bytes" in data:
-                    # Audio chunk
-                    audio_data = data["bytes"]
-                    await call_manager.handle_audio_chunk(audio_data)
-
-                elif "text" in data:
-                    # Control message (JSON)
-                    import json
-                    message = json.loads(data["text"])
-                    message_type = message.get("type")
-
-                    if message_type == "ping":
-                        await websocket.send_json({"type": "pong"})
-
-                    elif message_type == "end_call":
-                        logger.info(f"Client requested call end (call: {call_id})")
-                        break
-
-                    else:
-                        logger.warning(f"Unknown message type: {message_type}")
-
-            except asyncio.TimeoutError:
-                logger.warning(f"WebSocket timeout (call: {call_id})")
-                break
+        # Main message loop under a single idle deadline (one timer per call).
+        # Only the wait in receive() counts as idle: the deadline is lifted
+        # while a frame is handled, since an audio chunk can run a whole
+        # STT -> Orchestrator -> TTS turn, and set again afterwards
+        loop = asyncio.get_running_loop()
+        ws_timeout = _WS_TIMEOUT
+        async with asyncio.timeout(ws_timeout) as idle:
+            while True:
+                data = await websocket.receive()
+                idle.reschedule(None)
+
+                try:
+                    # Audio chunk: the common case, one lookup and no other checks
+                    audio_data = data.get("bytes")
+                    if audio_data is not None:
+                        await call_manager.handle_audio_chunk(audio_data)
+                        continue
+
+                    text = data.get("text")
+                    if text is not None:
+                        # Control message (JSON)
+                        message = parse_message(text)
+                        message_type = message.get("type")
+
+                        if message_type == "ping":
+                            await websocket.send(PONG_MESSAGE)
+
+                        elif message_type == "end_call":
+                            logger.info(f"Client requested call end (call: {call_id})")
+                            break
+
+                        else:
+                            logger.warning(f"Unknown message type: {message_type}")
+
+                    elif data["type"] == "websocket.disconnect":
+                        raise WebSocketDisconnect(data.get("code", 1000))
+                finally:
+                    idle.reschedule(loop.time() + ws_timeout)
+
+    except TimeoutError:
+        logger.warning(f"WebSocket timeout (call: {call_manager.call_id if call_manager else 'unknown'})")
 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected (call: {call_manager.call_id if call_manager else 'unknown'})")
@@ -198,6 +304,9 @@ async def voice_websocket(websocket: WebSocket):
 
     finally:
         # Cleanup
+        if slot_acquired:
+            call_slots.release()
+
         if call_manager:
             call_id = call_manager.call_id
 
@@ -208,6 +317,7 @@ async def voice_websocket(websocket: WebSocket):
                 # Remove from active calls
                 if call_id in active_calls:
                     del active_calls[call_id]
+                await call_registry.remove(call_id)
 
                 logger.info(
                     f"Call {call_id} ended "
@@ -237,10 +347,17 @@ async def root():
 if __name__ == "__main__":
     import uvicorn
 
+    # Reload mode only supports a single worker. "auto" runs on uvloop
+    # (installed by uvicorn[standard]) and falls back to the asyncio loop
+    # where uvloop is unavailable, e.g. Windows dev machines
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
+        loop="auto",
+        http="httptools",
+        ws="websockets",
+        workers=1 if settings.RELOAD else settings.WORKERS,
         log_level=settings.LOG_LEVEL.lower(),
-        reload=True,
+        reload=settings.RELOAD,
     )
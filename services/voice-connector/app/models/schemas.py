@@ -1,7 +1,11 @@
 """
 Data models and schemas for Voice Connector
+Internal models are msgspec Structs (slotted, no validation on
+construction); only the HTTP response models are Pydantic. Structs with
+scalar fields only are not tracked by the garbage collector (gc=False)
 """
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
 from enum import Enum
 from datetime import datetime
@@ -28,16 +32,16 @@ class MessageType(str, Enum):
     STATUS = "status"
 
 
-class VoiceMessage(BaseModel):
+class VoiceMessage(msgspec.Struct, kw_only=True):
     """Voice message structure"""
     type: MessageType
     data: Any
-    timestamp: Optional[datetime] = Field(default_factory=datetime.utcnow)
+    timestamp: Optional[datetime] = msgspec.field(default_factory=datetime.utcnow)
     session_id: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = {}
 
 
-class AudioChunk(BaseModel):
+class AudioChunk(msgspec.Struct, kw_only=True):
     """Audio chunk data"""
     audio_data: bytes
     sample_rate: int = 16000
@@ -45,14 +49,14 @@ class AudioChunk(BaseModel):
     duration_ms: Optional[int] = None
 
 
-class TranscriptionRequest(BaseModel):
+class TranscriptionRequest(msgspec.Struct, kw_only=True):
     """STT transcription request"""
     audio_data: bytes
     language: str = "en"
     session_id: str
 
 
-class TranscriptionResponse(BaseModel):
+class TranscriptionResponse(msgspec.Struct, kw_only=True, gc=False):
     """STT transcription response"""
     text: str
     language: str
@@ -61,7 +65,7 @@ class TranscriptionResponse(BaseModel):
     processing_time_ms: int
 
 
-class SynthesisRequest(BaseModel):
+class SynthesisRequest(msgspec.Struct, kw_only=True):
     """TTS synthesis request"""
     text: str
     voice: str = "default"
@@ -69,7 +73,7 @@ class SynthesisRequest(BaseModel):
     session_id: str
 
 
-class SynthesisResponse(BaseModel):
+class SynthesisResponse(msgspec.Struct, kw_only=True, gc=False):
     """TTS synthesis response"""
     audio_url: str
     duration_ms: int
@@ -78,7 +82,7 @@ class SynthesisResponse(BaseModel):
     format: str = "wav"
 
 
-class ConversationRequest(BaseModel):
+class ConversationRequest(msgspec.Struct, kw_only=True):
     """Orchestrator conversation request"""
     session_id: str
     user_message: str
@@ -86,7 +90,7 @@ class ConversationRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = {}
 
 
-class ConversationResponse(BaseModel):
+class ConversationResponse(msgspec.Struct, kw_only=True):
     """Orchestrator conversation response"""
     response: str
     intent: Optional[str] = None
@@ -95,7 +99,7 @@ class ConversationResponse(BaseModel):
     metadata: Optional[Dict[str, Any]] = {}
 
 
-class CallInfo(BaseModel):
+class CallInfo(msgspec.Struct, kw_only=True, gc=False):
     """Call information"""
     call_id: str
     session_id: str
@@ -0,0 +1,63 @@
+"""
+Voice activity detection kernels
+Sum of squares of 16-bit PCM chunks, compiled with Numba when installed,
+NumPy otherwise
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _chunk_sum_squares_numpy(samples: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Sum of squares of each chunk of samples
+
+    Args:
+        samples: int16 samples of consecutive chunks
+        ends: End sample index of each chunk
+
+    Returns:
+        int64 sum of squares per chunk
+    """
+    # int16 squares fit in int32 (half the bytes of int64); only the sums need int64
+    squares = np.square(samples, dtype=np.int32)
+    totals = np.concatenate(([0], np.cumsum(squares, dtype=np.int64)))
+    return totals[ends] - totals[np.concatenate(([0], ends[:-1]))]
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def chunk_sum_squares(samples, ends):
+        """Sum of squares of each chunk of samples (compiled loop)"""
+        out = np.zeros(ends.size, np.int64)
+        start = 0
+        for c in range(ends.size):
+            total = 0
+            for i in range(start, ends[c]):
+                value = np.int64(samples[i])
+                total += value * value
+            out[c] = total
+            start = ends[c]
+        return out
+
+else:
+    chunk_sum_squares = _chunk_sum_squares_numpy
+
+
+def compile_kernels() -> None:
+    """
+    Compile the kernels before the first call (no-op with NumPy)
+
+    Numba compiles (or loads from its cache) on the first call of each
+    argument type; run at startup so it doesn't stall the event loop on
+    the first chunk of the first call. Chunks arrive as read-only arrays
+    (bytes) and the buffer scan uses writable ones (bytearray), which are
+    separate specializations.
+    """
+    ends = np.array([1], dtype=np.int64)
+    chunk_sum_squares(np.frombuffer(bytes(2), dtype=np.int16), ends)
+    chunk_sum_squares(np.frombuffer(bytearray(2), dtype=np.int16), ends)
@@ -3,15 +3,21 @@ Audio Buffer for Voice Connector
 Handles audio chunk buffering and Voice Activity Detection (VAD)
 """
 import asyncio
+import struct
 import numpy as np
-from typing import Optional, List
-from io import BytesIO
-import wave
+from typing import Optional
 from app.core.config import settings
 from app.core.logging_config import get_logger
+from app.services._vad import chunk_sum_squares
 
 logger = get_logger(__name__)
 
+# Mono 16-bit PCM WAV header size; audio is written right after it
+WAV_HEADER_SIZE = 44
+
+# Silence is decided per window of this length, independent of chunk size
+VAD_WINDOW_MS = 100
+
 
 class AudioBuffer:
     """
@@ -44,17 +50,32 @@ class AudioBuffer:
         self.silence_duration_ms = silence_duration_ms
 
         # Internal state
-        self.chunks: List[bytes] = []
-        self.silence_chunks = 0
+        self._chunk_count = 0
+        self._scanned_off = WAV_HEADER_SIZE  # end of the audio already checked for silence
+        self.silence_ms = 0
         self.total_duration_ms = 0
 
         # Calculate thresholds
         self.max_chunks = int(
             (buffer_duration_ms / 1000) * sample_rate * 2 / chunk_size
         )
-        self.silence_chunk_threshold = int(
-            (silence_duration_ms / 1000) * sample_rate * 2 / chunk_size
+        self._max_audio_bytes = self.max_chunks * chunk_size  # full, whatever the chunk sizes
+        self._drop_silence_bytes = self._max_audio_bytes * 3 // 4
+        self._window_samples = max(1, sample_rate * VAD_WINDOW_MS // 1000)
+        self._ms_per_byte = 1000 / (sample_rate * 2)
+
+        # rms / 32768 < threshold  <=>  sum(x^2) < (threshold * 32768)^2 * n
+        self._silence_ss_per_sample = (silence_threshold * 32768.0) ** 2
+
+        # Preallocated buffer: WAV header followed by the PCM audio, so a
+        # flush is a single copy. Only the two header sizes change per flush.
+        self._buf = bytearray(WAV_HEADER_SIZE + (self.max_chunks + 1) * chunk_size)
+        self._buf[:WAV_HEADER_SIZE] = (
+            b"RIFF\x00\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00"
+            + struct.pack("<II", sample_rate, sample_rate * 2)
+            + b"\x02\x00\x10\x00data\x00\x00\x00\x00"
         )
+        self._off = WAV_HEADER_SIZE
 
         logger.info(
             f"AudioBuffer initialized: sample_rate={sample_rate}, "
@@ -68,17 +89,31 @@ class AudioBuffer:
         Args:
             audio_data: Raw audio bytes
         """
-        self.chunks.append(audio_data)
+        chunk_ms = len(audio_data) * self._ms_per_byte
 
-        # Calculate duration
-        chunk_duration_ms = (len(audio_data) / 2) / self.sample_rate * 1000
-        self.total_duration_ms += chunk_duration_ms
+        # Graceful degradation: once the buffer is mostly full and a pause has
+        # started, silent chunks are only counted (duration, silence, flush
+        # decisions) and not stored, so trailing silence cannot fill it up
+        if (
+            self._off - WAV_HEADER_SIZE >= self._drop_silence_bytes
+            and self.silence_ms * 2 >= self.silence_duration_ms
+            and self._is_silent(audio_data)
+        ):
+            self._chunk_count += 1
+            self.silence_ms += chunk_ms
+            self.total_duration_ms += chunk_ms
+            return
+
+        end = self._off + len(audio_data)
+        if end > len(self._buf):
+            # Larger chunks than chunk_size: grow instead of dropping audio
+            self._buf.extend(bytes(end - len(self._buf)))
+        self._buf[self._off:end] = audio_data
+        self._off = end
+        self._chunk_count += 1
 
-        # Check if chunk contains silence
-        if self._is_silent(audio_data):
-            self.silence_chunks += 1
-        else:
-            self.silence_chunks = 0
+        # Calculate duration
+        self.total_duration_ms += chunk_ms
 
     def should_flush(self) -> bool:
         """
@@ -87,17 +122,20 @@ class AudioBuffer:
         Returns:
             True if buffer should be flushed
         """
+        # Silence check of all whole windows added since the last call in one kernel call
+        self._scan_silence()
+
         # Flush if buffer is full
-        if len(self.chunks) >= self.max_chunks:
+        if self._off - WAV_HEADER_SIZE >= self._max_audio_bytes:
             logger.debug("Buffer full, should flush")
             return True
 
         # Flush if silence detected after speech
         if (
-            len(self.chunks) > 0
-            and self.silence_chunks >= self.silence_chunk_threshold
+            self._chunk_count > 0
+            and self.silence_ms >= self.silence_duration_ms
         ):
-            logger.debug(f"Silence detected ({self.silence_chunks} chunks), should flush")
+            logger.debug(f"Silence detected ({self.silence_ms}ms), should flush")
             return True
 
         return False
@@ -109,18 +147,20 @@ class AudioBuffer:
         Returns:
             WAV audio bytes or None if buffer is empty
         """
-        if not self.chunks:
+        if not self._chunk_count:
             return None
 
         try:
-            # Combine all chunks
-            audio_data = b"".join(self.chunks)
+            # Patch RIFF chunk size (offset 4) and data size (offset 40)
+            data_size = self._off - WAV_HEADER_SIZE
+            struct.pack_into("<I", self._buf, 4, 36 + data_size)
+            struct.pack_into("<I", self._buf, 40, data_size)
 
-            # Convert to WAV format
-            wav_bytes = self._to_wav(audio_data)
+            # Header and PCM in a single copy
+            wav_bytes = bytes(memoryview(self._buf)[:self._off])
 
             logger.info(
-                f"Retrieved {len(self.chunks)} chunks, "
+                f"Retrieved {self._chunk_count} chunks, "
                 f"total {len(wav_bytes)} bytes, "
                 f"duration {self.total_duration_ms:.0f}ms"
             )
@@ -133,14 +173,16 @@ class AudioBuffer:
 
     def clear(self) -> None:
         """Clear the buffer"""
-        logger.debug(f"Clearing buffer ({len(self.chunks)} chunks)")
-        self.chunks.clear()
-        self.silence_chunks = 0
+        logger.debug(f"Clearing buffer ({self._chunk_count} chunks)")
+        self._off = WAV_HEADER_SIZE
+        self._chunk_count = 0
+        self._scanned_off = WAV_HEADER_SIZE
+        self.silence_ms = 0
         self.total_duration_ms = 0
 
     def _is_silent(self, audio_data: bytes) -> bool:
         """
-        Check if audio chunk is silent using RMS
+        Check if a single audio chunk is silent
 
         Args:
             audio_data: Raw audio bytes
@@ -148,48 +190,42 @@ class AudioBuffer:
         Returns:
             True if silent
         """
-        try:
-            # Convert bytes to numpy array
-            audio_array = np.frombuffer(audio_data, dtype=np.int16)
-
-            # Calculate RMS (Root Mean Square)
-            rms = np.sqrt(np.mean(audio_array.astype(np.float32) ** 2))
+        samples = np.frombuffer(audio_data, dtype=np.int16, count=len(audio_data) // 2)
+        if not samples.size:
+            return True
+        sum_squares = chunk_sum_squares(samples, np.array([samples.size], dtype=np.int64))
+        return bool(sum_squares[0] < self._silence_ss_per_sample * samples.size)
 
-            # Normalize to 0-1 range
-            normalized_rms = rms / 32768.0
+    def _scan_silence(self) -> None:
+        """Update the silence run with the whole windows added since the last scan"""
+        windows = (self._off - self._scanned_off) // 2 // self._window_samples
+        if not windows:
+            return
 
-            is_silent = normalized_rms < self.silence_threshold
+        try:
+            samples = np.frombuffer(
+                self._buf,
+                dtype=np.int16,
+                count=windows * self._window_samples,
+                offset=self._scanned_off,
+            )
+            ends = np.arange(1, windows + 1, dtype=np.int64) * self._window_samples
+            sum_squares = chunk_sum_squares(samples, ends)
 
-            return is_silent
+            # rms < threshold per window; any speech resets the silence run
+            for silent in sum_squares < self._silence_ss_per_sample * self._window_samples:
+                self.silence_ms = self.silence_ms + VAD_WINDOW_MS if silent else 0
 
         except Exception as e:
             logger.error(f"Error calculating silence: {e}")
-            return False
-
-    def _to_wav(self, audio_data: bytes) -> bytes:
-        """
-        Convert raw PCM audio to WAV format
-
-        Args:
-            audio_data: Raw PCM audio bytes
-
-        Returns:
-            WAV format audio bytes
-        """
-        wav_buffer = BytesIO()
-
-        with wave.open(wav_buffer, "wb") as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(self.sample_rate)
-            wav_file.writeframes(audio_data)
+            self.silence_ms = 0
 
-        return wav_buffer.getvalue()
+        self._scanned_off += windows * self._window_samples * 2
 
     @property
     def is_empty(self) -> bool:
         """Check if buffer is empty"""
-        return len(self.chunks) == 0
+        return self._chunk_count == 0
 
     @property
     def duration_ms(self) -> float:
@@ -199,4 +235,4 @@ class AudioBuffer:
     @property
     def chunk_count(self) -> int:
         """Get number of chunks in buffer"""
-        return len(self.chunks)
+        return self._chunk_count
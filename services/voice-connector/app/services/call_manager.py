@@ -5,18 +5,26 @@ Orchestrates voice call flow: WebSocket -> STT -> Orchestrator -> TTS -> WebSock
 import asyncio
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import AsyncGenerator, Optional, Dict, Any
 from fastapi import WebSocket
 from app.core.config import settings
+from app.core.deadline import deadline
 from app.core.logging_config import get_logger
 from app.models.schemas import CallState, CallInfo, MessageType
 from app.services.audio_buffer import AudioBuffer
-from app.services.stt_client import STTClient
-from app.services.tts_client import TTSClient
-from app.services.orchestrator_client import OrchestratorClient
+from app.services.stt_client import STTClient, stt_client
+from app.services.tts_client import TTSClient, tts_client
+from app.services.orchestrator_client import OrchestratorClient, orchestrator_client
+from app.utils.messages import AUDIO_END_MESSAGE, AUDIO_START_MESSAGE
 
 logger = get_logger(__name__)
 
+# Played when a call starts; synthesized once at startup and cached
+WELCOME_TEXT = "Hello! I'm your voice assistant. How can I help you today?"
+
+# Audio chunks read from TTS ahead of the WebSocket sends
+AUDIO_QUEUE_SIZE = 4
+
 
 class VoiceCallManager:
     """
@@ -29,6 +37,9 @@ class VoiceCallManager:
         websocket: WebSocket,
         call_id: Optional[str] = None,
         session_id: Optional[str] = None,
+        stt: Optional[STTClient] = None,
+        tts: Optional[TTSClient] = None,
+        orchestrator: Optional[OrchestratorClient] = None,
     ):
         """
         Initialize call manager
@@ -37,16 +48,19 @@ class VoiceCallManager:
             websocket: WebSocket connection
             call_id: Unique call ID (generated if not provided)
             session_id: Conversation session ID (created if not provided)
+            stt: STT client (shared global client if not provided)
+            tts: TTS client (shared global client if not provided)
+            orchestrator: Orchestrator client (shared global client if not provided)
         """
         self.websocket = websocket
         self.call_id = call_id or str(uuid.uuid4())
         self.session_id = session_id
         self.state = CallState.CONNECTING
 
-        # Service clients
-        self.stt_client = STTClient()
-        self.tts_client = TTSClient()
-        self.orchestrator_client = OrchestratorClient()
+        # Service clients (shared across calls; started and stopped by the app)
+        self.stt_client = stt or stt_client
+        self.tts_client = tts or tts_client
+        self.orchestrator_client = orchestrator or orchestrator_client
 
         # Audio buffer
         self.audio_buffer = AudioBuffer(
@@ -65,8 +79,6 @@ class VoiceCallManager:
             turns_count=0,
         )
 
-        # Tasks
-        self.heartbeat_task: Optional[asyncio.Task] = None
         self.running = False
 
         logger.info(f"VoiceCallManager created (call_id: {self.call_id})")
@@ -76,11 +88,6 @@ class VoiceCallManager:
         try:
             logger.info(f"Starting call {self.call_id}")
 
-            # Start service clients
-            await self.stt_client.start()
-            await self.tts_client.start()
-            await self.orchestrator_client.start()
-
             # Create session if not provided
             if not self.session_id:
                 self.session_id = await self.orchestrator_client.create_session(
@@ -94,13 +101,9 @@ class VoiceCallManager:
 
             # Update state
             self.state = CallState.CONNECTED
-            self.call_info.state = self.state
             self.call_info.connected_at = datetime.utcnow()
             self.running = True
 
-            # Start heartbeat
-            self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
-
             # Send welcome message
             await self._send_welcome()
 
@@ -109,7 +112,6 @@ class VoiceCallManager:
         except Exception as e:
             logger.error(f"Error starting call {self.call_id}: {e}")
             self.state = CallState.ERROR
-            self.call_info.state = self.state
             self.call_info.error = str(e)
             raise
 
@@ -119,7 +121,6 @@ class VoiceCallManager:
 
         self.running = False
         self.state = CallState.DISCONNECTED
-        self.call_info.state = self.state
         self.call_info.disconnected_at = datetime.utcnow()
 
         # Calculate duration
@@ -129,15 +130,6 @@ class VoiceCallManager:
             ).total_seconds()
             self.call_info.duration_seconds = int(duration)
 
-        # Cancel heartbeat
-        if self.heartbeat_task:
-            self.heartbeat_task.cancel()
-
-        # Stop service clients
-        await self.stt_client.stop()
-        await self.tts_client.stop()
-        await self.orchestrator_client.stop()
-
         logger.info(
             f"Call {self.call_id} stopped "
             f"(duration: {self.call_info.duration_seconds}s, "
@@ -187,86 +179,88 @@ class VoiceCallManager:
             # Update state
             self.state = CallState.PROCESSING
 
-            # 1. Transcribe audio (STT)
-            transcription = await self.stt_client.transcribe(
-                audio_data=audio_data,
-                language="en",
-                session_id=self.session_id,
+            # One deadline for the whole turn; each upstream request gets the time left
+            async with deadline(settings.TURN_TIMEOUT_S):
+                await self._run_turn(audio_data)
+
+        except TimeoutError:
+            logger.warning(
+                f"Turn exceeded {settings.TURN_TIMEOUT_S}s deadline (call: {self.call_id})"
             )
+            self.state = CallState.LISTENING
+        except Exception as e:
+            logger.error(f"Error processing buffered audio: {e}")
+            self.state = CallState.ERROR
+            self.call_info.error = str(e)
 
-            if not transcription or not transcription.text.strip():
-                logger.warning(f"Empty transcription (call: {self.call_id})")
-                self.state = CallState.LISTENING
-                return
+    async def _run_turn(self, audio_data: bytes) -> None:
+        """
+        Run one conversation turn: STT -> Orchestrator -> TTS
 
-            logger.info(
-                f"Transcribed: '{transcription.text}' (call: {self.call_id})"
-            )
+        Args:
+            audio_data: Buffered utterance in WAV format
+        """
+        # 1. Transcribe audio (STT)
+        transcription = await self.stt_client.transcribe(
+            audio_data=audio_data,
+            language="en",
+            session_id=self.session_id,
+        )
 
-            # 2. Get response from orchestrator
-            conversation_response = await self.orchestrator_client.send_message(
-                session_id=self.session_id,
-                user_message=transcription.text,
-                channel="voice",
-                metadata={"call_id": self.call_id},
-            )
+        if not transcription or not transcription.text.strip():
+            logger.warning(f"Empty transcription (call: {self.call_id})")
+            self.state = CallState.LISTENING
+            return
 
-            if not conversation_response or not conversation_response.response.strip():
-                logger.warning(f"Empty orchestrator response (call: {self.call_id})")
-                self.state = CallState.LISTENING
-                return
+        logger.info(
+            f"Transcribed: '{transcription.text}' (call: {self.call_id})"
+        )
 
-            logger.info(
-                f"Got response: '{conversation_response.response}' "
-                f"(call: {self.call_id}, intent: {conversation_response.intent})"
-            )
+        # 2. Get response from orchestrator
+        conversation_response = await self.orchestrator_client.send_message(
+            session_id=self.session_id,
+            user_message=transcription.text,
+            channel="voice",
+            metadata={"call_id": self.call_id},
+        )
+
+        if not conversation_response or not conversation_response.response.strip():
+            logger.warning(f"Empty orchestrator response (call: {self.call_id})")
+            self.state = CallState.LISTENING
+            return
+
+        logger.info(
+            f"Got response: '{conversation_response.response}' "
+            f"(call: {self.call_id}, intent: {conversation_response.intent})"
+        )
 
-            # 3. Synthesize response (TTS)
-            self.state = CallState.SPEAKING
+        # 3. Synthesize response (TTS), streaming audio to the caller as it arrives
+        self.state = CallState.SPEAKING
 
-            synthesis = await self.tts_client.synthesize(
+        sent_bytes = await self._stream_audio(
+            self.tts_client.synthesize_audio(
                 text=conversation_response.response,
                 voice="default",
                 speed=1.0,
                 session_id=self.session_id,
             )
+        )
 
-            if not synthesis or not synthesis.audio_url:
-                logger.warning(f"Failed to synthesize audio (call: {self.call_id})")
-                self.state = CallState.LISTENING
-                return
-
-            logger.info(
-                f"Synthesized audio URL: {synthesis.audio_url} "
-                f"(call: {self.call_id})"
-            )
-
-            # 4. Download audio
-            audio_bytes = await self.tts_client.download_audio(synthesis.audio_url)
-
-            if not audio_bytes:
-                logger.warning(f"Failed to download audio (call: {self.call_id})")
-                self.state = CallState.LISTENING
-                return
-
-            # 5. Send audio to caller
-            await self._send_audio(audio_bytes)
-
-            # Update turn count
-            self.call_info.turns_count += 1
-
-            # Back to listening
+        if not sent_bytes:
+            logger.warning(f"Failed to synthesize audio (call: {self.call_id})")
             self.state = CallState.LISTENING
+            return
 
-            logger.info(
-                f"Turn {self.call_info.turns_count} completed "
-                f"(call: {self.call_id})"
-            )
+        # Update turn count
+        self.call_info.turns_count += 1
 
-        except Exception as e:
-            logger.error(f"Error processing buffered audio: {e}")
-            self.state = CallState.ERROR
-            self.call_info.error = str(e)
+        # Back to listening
+        self.state = CallState.LISTENING
+
+        logger.info(
+            f"Turn {self.call_info.turns_count} completed "
+            f"(call: {self.call_id})"
+        )
 
     async def _send_audio(self, audio_data: bytes) -> None:
         """
@@ -282,39 +276,86 @@ class VoiceCallManager:
             logger.error(f"Error sending audio: {e}")
             raise
 
-    async def _send_welcome(self) -> None:
-        """Send welcome message"""
-        try:
-            welcome_text = "Hello! I'm your voice assistant. How can I help you today?"
+    async def _stream_audio(self, chunks: AsyncGenerator[bytes, None]) -> int:
+        """
+        Send audio chunks to WebSocket as they arrive
 
-            synthesis = await self.tts_client.synthesize(
-                text=welcome_text,
-                voice="default",
-                speed=1.0,
-                session_id=self.session_id,
-            )
+        A producer task reads the chunks into a bounded queue, so a slow
+        WebSocket send does not stall reading the TTS response and vice versa.
+        The chunks are arbitrary pieces of one MP3 stream, so they are
+        bracketed by audio_start/audio_end control frames for the client to
+        join them.
 
-            if synthesis and synthesis.audio_url:
-                audio_bytes = await self.tts_client.download_audio(synthesis.audio_url)
-                if audio_bytes:
-                    await self._send_audio(audio_bytes)
-                    logger.info(f"Sent welcome message (call: {self.call_id})")
+        Args:
+            chunks: Audio chunks to send
 
-        except Exception as e:
-            logger.error(f"Error sending welcome: {e}")
+        Returns:
+            Number of bytes sent
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=AUDIO_QUEUE_SIZE)
+
+        async def produce() -> None:
+            try:
+                async for chunk in chunks:
+                    await queue.put(chunk)
+            finally:
+                try:
+                    # Runs the generator's cleanup now (response release,
+                    # bulkhead slot) instead of whenever it is collected
+                    await chunks.aclose()
+                finally:
+                    # End of stream, unless the consumer stopped reading and
+                    # cancelled us: a put on the full queue would never return
+                    if not asyncio.current_task().cancelling():
+                        await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        sent_bytes = 0
 
-    async def _heartbeat_loop(self) -> None:
-        """Send periodic heartbeats"""
         try:
-            while self.running:
-                await asyncio.sleep(settings.WS_HEARTBEAT_INTERVAL)
-                await self.websocket.send_json({"type": "heartbeat"})
-                logger.debug(f"Sent heartbeat (call: {self.call_id})")
-        except asyncio.CancelledError:
-            logger.debug(f"Heartbeat cancelled (call: {self.call_id})")
+            while (chunk := await queue.get()) is not None:
+                if not sent_bytes:
+                    await self.websocket.send(AUDIO_START_MESSAGE)
+                await self._send_audio(chunk)
+                sent_bytes += len(chunk)
+            if sent_bytes:
+                await self.websocket.send(AUDIO_END_MESSAGE)
+        except BaseException:
+            # Nobody reads the queue any more: the producer must not wait on
+            # it, so it is cancelled and awaited until its cleanup has run
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            raise
+
+        await producer
+        logger.debug(f"Streamed {sent_bytes} bytes of audio (call: {self.call_id})")
+        return sent_bytes
+
+    async def _send_welcome(self) -> None:
+        """Send welcome message"""
+        try:
+            # Served from the phrase cache; synthesized on demand if prewarming failed
+            audio_bytes = await self.tts_client.synthesize_phrase(WELCOME_TEXT)
+            if audio_bytes:
+                await self.websocket.send(AUDIO_START_MESSAGE)
+                await self._send_audio(audio_bytes)
+                await self.websocket.send(AUDIO_END_MESSAGE)
+                logger.info(f"Sent welcome message (call: {self.call_id})")
+
         except Exception as e:
-            logger.error(f"Heartbeat error: {e}")
+            logger.error(f"Error sending welcome: {e}")
 
     def get_call_info(self) -> CallInfo:
         """Get current call info"""
+        # Only self.state is updated on transitions; call_info follows on read
+        self.call_info.state = self.state
         return self.call_info
+
+    def get_call_summary(self) -> Dict[str, Any]:
+        """Get the call fields reported by /calls"""
+        return {
+            "call_id": self.call_info.call_id,
+            "session_id": self.call_info.session_id,
+            "state": self.state,
+            "turns_count": self.call_info.turns_count,
+        }
@@ -4,9 +4,18 @@ Handles communication with the Orchestrator service
 """
 import aiohttp
 import asyncio
-from typing import Optional, Dict, Any
+import contextvars
+import functools
+import orjson
+from typing import Optional, Dict, Any, List, Set, Tuple
+from yarl import URL
+from app.core.bulkhead import Bulkhead, BulkheadFullError
+from app.core.circuit import CircuitBreaker, CircuitOpenError
 from app.core.config import settings
+from app.core.health_cache import HealthCache
+from app.core.http_session import get_session
 from app.core.logging_config import get_logger
+from app.core.retry import HTTPResult, fetch, with_retry
 from app.models.schemas import ConversationResponse
 
 logger = get_logger(__name__)
@@ -23,23 +32,57 @@ class OrchestratorClient:
             base_url: Orchestrator service base URL
         """
         self.base_url = base_url or settings.ORCHESTRATOR_URL
+        # Endpoint URLs, parsed once instead of per request
+        self._conversation_url = URL(f"{self.base_url}/api/v1/conversation")
+        self._conversation_batch_url = URL(f"{self.base_url}/api/v1/conversation:batch")
+        self._session_url = URL(f"{self.base_url}/api/v1/session")
+        self._health_url = URL(f"{self.base_url}/health")
         self.session: Optional[aiohttp.ClientSession] = None
+        self._health = HealthCache(self._probe_health)
+        self._breaker = CircuitBreaker("Orchestrator")
+        self._bulkhead = Bulkhead("Orchestrator", settings.ORCHESTRATOR_MAX_INFLIGHT)
+        # (session_id, user_message) -> request in flight, shared by duplicates
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+        # Conversation turns waiting for the next batch (disabled when BATCH_MAX <= 1)
+        self._batch_max = settings.ORCHESTRATOR_BATCH_MAX
+        self._batch_wait_s = settings.ORCHESTRATOR_BATCH_MAX_WAIT_MS / 1000
+        self._queue: "asyncio.Queue[Tuple[Dict[str, Any], asyncio.Future]]" = asyncio.Queue()
+        self._batch_task: Optional[asyncio.Task] = None
+        self._batch_sends: Set[asyncio.Task] = set()
         logger.info(f"OrchestratorClient initialized with URL: {self.base_url}")
 
     async def start(self) -> None:
         """Start the client session"""
         if not self.session:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            self.session = await get_session()
             logger.info("Orchestrator client session started")
 
     async def stop(self) -> None:
-        """Stop the client session"""
+        """Stop the client session (the shared session is closed by close_session)"""
+        # Batches being sent cancel their turns' futures when they finish
+        tasks = [task for task in (self._batch_task, *self._batch_sends) if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._batch_task = None
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
         if self.session:
-            await self.session.close()
             self.session = None
             logger.info("Orchestrator client session stopped")
 
+    async def __aenter__(self) -> "OrchestratorClient":
+        """Start the client for an `async with` block"""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Stop the client when the `async with` block exits"""
+        await self.stop()
+
     async def send_message(
         self,
         session_id: str,
@@ -56,6 +99,41 @@ class OrchestratorClient:
             channel: Communication channel (default: "voice")
             metadata: Additional metadata
 
+        Returns:
+            ConversationResponse or None if failed
+        """
+        # A duplicate of a turn still in flight (client retry, duplicated
+        # packet) shares its request instead of running the turn twice
+        key = (session_id, user_message)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._send_message(session_id, user_message, channel, metadata)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info("Joining in-flight orchestrator request (session: %s)", session_id)
+
+        # Shielded so a cancelled caller does not cancel the others' request
+        return await asyncio.shield(task)
+
+    async def _send_message(
+        self,
+        session_id: str,
+        user_message: str,
+        channel: str,
+        metadata: Optional[Dict[str, Any]],
+    ) -> Optional[ConversationResponse]:
+        """
+        Send a conversation turn to the orchestrator
+
+        Args:
+            session_id: Conversation session ID
+            user_message: User's message text
+            channel: Communication channel
+            metadata: Additional metadata
+
         Returns:
             ConversationResponse or None if failed
         """
@@ -63,7 +141,7 @@ class OrchestratorClient:
             await self.start()
 
         try:
-            url = f"{self.base_url}/api/v1/conversation"
+            url = self._conversation_url
 
             payload = {
                 "session_id": session_id,
@@ -73,35 +151,48 @@ class OrchestratorClient:
             }
 
             logger.info(
-                f"Sending message to orchestrator "
-                f"(session: {session_id}, message_len: {len(user_message)})"
+                "Sending message to orchestrator (session: %s, message_len: %d)",
+                session_id, len(user_message),
             )
 
-            async with self.session.post(url, json=payload) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    logger.info(
-                        f"Got orchestrator response "
-                        f"(session: {session_id}, "
-                        f"intent: {result.get('intent')}, "
-                        f"response_len: {len(result.get('response', ''))})"
-                    )
+            if self._batch_max > 1:
+                response = await self._submit(payload)
+            else:
+                response = await self._breaker.call(lambda: self._bulkhead.call(lambda: with_retry(
+                    lambda: fetch(self.session, "POST", url, json=payload),
+                    f"Orchestrator request (session: {session_id})",
+                    idempotent=False,
+                )))
 
-                    return ConversationResponse(
-                        response=result.get("response", ""),
-                        intent=result.get("intent"),
-                        entities=result.get("entities", {}),
-                        session_id=result.get("session_id", session_id),
-                        metadata=result.get("metadata", {}),
-                    )
-                else:
-                    error_text = await response.text()
-                    logger.error(
-                        f"Orchestrator request failed with status {response.status}: "
-                        f"{error_text} (session: {session_id})"
-                    )
-                    return None
+            if response.status == 200:
+                result = response.body
+                response_text = result.get("response", "")
+                intent = result.get("intent")
+                logger.info(
+                    "Got orchestrator response (session: %s, intent: %s, response_len: %d)",
+                    session_id, intent, len(response_text),
+                )
+
+                return ConversationResponse(
+                    response=response_text,
+                    intent=intent,
+                    entities=result.get("entities", {}),
+                    session_id=result.get("session_id", session_id),
+                    metadata=result.get("metadata", {}),
+                )
+            else:
+                logger.error(
+                    f"Orchestrator request failed with status {response.status}: "
+                    f"{response.body} (session: {session_id})"
+                )
+                return None
 
+        except BulkheadFullError as e:
+            logger.warning(f"{e}, request rejected")
+            return None
+        except CircuitOpenError:
+            logger.debug("Orchestrator circuit open, request skipped")
+            return None
         except asyncio.TimeoutError:
             logger.error(f"Orchestrator timeout (session: {session_id})")
             return None
@@ -109,6 +200,112 @@ class OrchestratorClient:
             logger.error(f"Orchestrator error: {e} (session: {session_id})")
             return None
 
+    async def _submit(self, payload: Dict[str, Any]) -> HTTPResult:
+        """
+        Queue a conversation turn for the next batch
+
+        Args:
+            payload: Conversation request payload
+
+        Returns:
+            HTTPResult of this turn, split from the batch response
+        """
+        if self._batch_task is None:
+            # Fresh context: the worker must not inherit the first caller's turn deadline
+            self._batch_task = asyncio.create_task(self._batch_loop(), context=contextvars.Context())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((payload, future))
+        return await future
+
+    async def _batch_loop(self) -> None:
+        """Collect queued turns into batches and send each batch"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+
+            # Flush when the batch is full or BATCH_MAX_WAIT_MS after its first turn
+            flush_at = loop.time() + self._batch_wait_s
+            while len(batch) < self._batch_max:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = flush_at - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    async with asyncio.timeout(remaining):
+                        batch.append(await self._queue.get())
+                except TimeoutError:
+                    break
+
+            # Sent in the background so the next batch is collected meanwhile
+            task = asyncio.create_task(self._send_batch(batch))
+            self._batch_sends.add(task)
+            task.add_done_callback(self._batch_sends.discard)
+            # Also when cancelled by stop() before it started, so _send_batch never ran
+            task.add_done_callback(functools.partial(self._cancel_unresolved, batch))
+
+    async def _send_batch(
+        self,
+        batch: List[Tuple[Dict[str, Any], asyncio.Future]],
+    ) -> None:
+        """
+        Send a batch of turns and resolve each turn's future
+
+        Args:
+            batch: Queued (payload, future) pairs
+        """
+        url = self._conversation_batch_url
+        payload = {"requests": [turn for turn, _ in batch]}
+
+        try:
+            response = await self._breaker.call(lambda: self._bulkhead.call(lambda: with_retry(
+                lambda: fetch(self.session, "POST", url, json=payload),
+                f"Orchestrator batch ({len(batch)} turns)",
+                idempotent=False,
+            )))
+
+            if response.status == 200:
+                items = response.body["responses"]
+                if len(items) != len(batch):
+                    raise ValueError(
+                        f"Orchestrator batch returned {len(items)} responses for {len(batch)} turns"
+                    )
+                results = [
+                    HTTPResult(item["status"], item["result"] if item["status"] == 200 else item.get("detail"))
+                    for item in items
+                ]
+            else:
+                # The whole batch failed; every turn gets the batch status
+                results = [response] * len(batch)
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            # Includes malformed batch responses: no turn may wait for its deadline
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    @staticmethod
+    def _cancel_unresolved(
+        batch: List[Tuple[Dict[str, Any], asyncio.Future]],
+        task: asyncio.Task,
+    ) -> None:
+        """
+        Cancel the turns of a finished batch send that got no result
+
+        Args:
+            batch: Queued (payload, future) pairs
+            task: The finished _send_batch task
+        """
+        for _, future in batch:
+            if not future.done():
+                future.cancel()
+
     async def create_session(self, channel: str = "voice") -> Optional[str]:
         """
         Create a new conversation session
@@ -123,45 +320,59 @@ class OrchestratorClient:
             await self.start()
 
         try:
-            url = f"{self.base_url}/api/v1/session"
+            url = self._session_url
 
             payload = {"channel": channel}
 
             logger.info("Creating new session")
 
-            async with self.session.post(url, json=payload) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    session_id = result.get("session_id")
-                    logger.info(f"Created session: {session_id}")
-                    return session_id
-                else:
-                    error_text = await response.text()
-                    logger.error(
-                        f"Session creation failed with status {response.status}: "
-                        f"{error_text}"
-                    )
-                    return None
+            response = await self._breaker.call(lambda: self._bulkhead.call(lambda: with_retry(
+                lambda: fetch(self.session, "POST", url, json=payload),
+                "Session creation",
+                idempotent=False,
+            )))
 
+            if response.status == 200:
+                result = response.body
+                session_id = result.get("session_id")
+                logger.info(f"Created session: {session_id}")
+                return session_id
+            else:
+                logger.error(
+                    f"Session creation failed with status {response.status}: "
+                    f"{response.body}"
+                )
+                return None
+
+        except BulkheadFullError as e:
+            logger.warning(f"{e}, request rejected")
+            return None
+        except CircuitOpenError:
+            logger.debug("Orchestrator circuit open, request skipped")
+            return None
         except Exception as e:
             logger.error(f"Session creation error: {e}")
             return None
 
     async def health_check(self) -> bool:
         """
-        Check if Orchestrator service is healthy
+        Check if Orchestrator service is healthy (cached for HEALTH_TTL_S)
 
         Returns:
             True if healthy, False otherwise
         """
+        return await self._health.get()
+
+    async def _probe_health(self) -> bool:
+        """Query the Orchestrator service health endpoint"""
         if not self.session:
             await self.start()
 
         try:
-            url = f"{self.base_url}/health"
+            url = self._health_url
             async with self.session.get(url) as response:
                 if response.status == 200:
-                    result = await response.json()
+                    result = orjson.loads(await response.read())
                     logger.debug(f"Orchestrator health check: {result.get('status')}")
                     return result.get("status") == "healthy"
                 return False
@@ -169,7 +380,6 @@ class OrchestratorClient:
             logger.error(f"Orchestrator health check error: {e}")
             return False
 
-    def __del__(self):
-        """Cleanup on deletion"""
-        if self.session:
-            logger.warning("OrchestratorClient deleted with active session")
+
+# Global client instance, shared by all calls
+orchestrator_client = OrchestratorClient()
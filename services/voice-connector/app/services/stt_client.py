@@ -4,14 +4,25 @@ Handles communication with the Speech-to-Text service
 """
 import aiohttp
 import asyncio
-from typing import Optional, Dict, Any
-from io import BytesIO
+import orjson
+import uuid
+from functools import lru_cache
+from typing import AsyncIterator, Optional, Dict, Any, Tuple
+from yarl import URL
+from app.core.bulkhead import Bulkhead, BulkheadFullError
+from app.core.circuit import CircuitBreaker, CircuitOpenError
 from app.core.config import settings
+from app.core.health_cache import HealthCache
+from app.core.http_session import get_session
 from app.core.logging_config import get_logger
+from app.core.retry import fetch, with_retry
 from app.models.schemas import TranscriptionResponse
 
 logger = get_logger(__name__)
 
+# Multipart boundary of pre-encoded transcription requests, random per process
+_BOUNDARY = f"voice-connector-{uuid.uuid4().hex}"
+
 
 class STTClient:
     """Client for STT service communication"""
@@ -24,23 +35,36 @@ class STTClient:
             base_url: STT service base URL
         """
         self.base_url = base_url or settings.STT_SERVICE_URL
+        # Endpoint URLs, parsed once instead of per request
+        self._transcribe_url = URL(f"{self.base_url}/transcribe")
+        self._health_url = URL(f"{self.base_url}/health")
         self.session: Optional[aiohttp.ClientSession] = None
+        self._health = HealthCache(self._probe_health)
+        self._breaker = CircuitBreaker("STT")
+        self._bulkhead = Bulkhead("STT", settings.STT_MAX_INFLIGHT)
         logger.info(f"STTClient initialized with URL: {self.base_url}")
 
     async def start(self) -> None:
         """Start the client session"""
         if not self.session:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            self.session = await get_session()
             logger.info("STT client session started")
 
     async def stop(self) -> None:
-        """Stop the client session"""
+        """Stop the client session (the shared session is closed by close_session)"""
         if self.session:
-            await self.session.close()
             self.session = None
             logger.info("STT client session stopped")
 
+    async def __aenter__(self) -> "STTClient":
+        """Start the client for an `async with` block"""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Stop the client when the `async with` block exits"""
+        await self.stop()
+
     async def transcribe(
         self,
         audio_data: bytes,
@@ -62,48 +86,51 @@ class STTClient:
             await self.start()
 
         try:
-            # Prepare multipart form data
-            data = aiohttp.FormData()
-            data.add_field(
-                "file",
-                BytesIO(audio_data),
-                filename="audio.wav",
-                content_type="audio/wav",
-            )
-            data.add_field("language", language)
-            data.add_field("task", "transcribe")
-
-            url = f"{self.base_url}/transcribe"
+            url = self._transcribe_url
 
             logger.info(
-                f"Sending transcription request to {url} "
-                f"(session: {session_id}, size: {len(audio_data)} bytes)"
+                "Sending transcription request to %s (session: %s, size: %d bytes)",
+                url, session_id, len(audio_data),
             )
 
-            async with self.session.post(url, data=data) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    logger.info(
-                        f"Transcription successful: '{result.get('text')}' "
-                        f"(session: {session_id}, "
-                        f"time: {result.get('processing_time_ms')}ms)"
-                    )
-
-                    return TranscriptionResponse(
-                        text=result.get("text", ""),
-                        language=result.get("language", language),
-                        duration=result.get("duration", 0.0),
-                        confidence=result.get("confidence"),
-                        processing_time_ms=result.get("processing_time_ms", 0),
-                    )
-                else:
-                    error_text = await response.text()
-                    logger.error(
-                        f"Transcription failed with status {response.status}: "
-                        f"{error_text} (session: {session_id})"
-                    )
-                    return None
-
+            # The body is consumed by a request, so each attempt builds its own
+            response = await self._breaker.call(lambda: self._bulkhead.call(lambda: with_retry(
+                lambda: fetch(
+                    self.session, "POST", url,
+                    **self._build_body(audio_data, language),
+                ),
+                f"Transcription (session: {session_id})",
+            )))
+
+            if response.status == 200:
+                result = response.body
+                text = result.get("text", "")
+                processing_time_ms = result.get("processing_time_ms", 0)
+                logger.info(
+                    "Transcription successful: '%s' (session: %s, time: %sms)",
+                    text, session_id, processing_time_ms,
+                )
+
+                return TranscriptionResponse(
+                    text=text,
+                    language=result.get("language", language),
+                    duration=result.get("duration", 0.0),
+                    confidence=result.get("confidence"),
+                    processing_time_ms=processing_time_ms,
+                )
+            else:
+                logger.error(
+                    f"Transcription failed with status {response.status}: "
+                    f"{response.body} (session: {session_id})"
+                )
+                return None
+
+        except BulkheadFullError as e:
+            logger.warning(f"{e}, request rejected")
+            return None
+        except CircuitOpenError:
+            logger.debug("STT circuit open, request skipped")
+            return None
         except asyncio.TimeoutError:
             logger.error(f"Transcription timeout (session: {session_id})")
             return None
@@ -111,21 +138,73 @@ class STTClient:
             logger.error(f"Transcription error: {e} (session: {session_id})")
             return None
 
+    @staticmethod
+    def _build_body(audio_data: bytes, language: str) -> Dict[str, Any]:
+        """
+        Build the multipart body of a transcription request
+
+        Plain language codes use a pre-encoded envelope, so only the audio
+        is written per request; anything else goes through FormData.
+
+        Args:
+            audio_data: Audio data in WAV format
+            language: Language code
+
+        Returns:
+            Keyword arguments for session.request
+        """
+        if not (language.isascii() and language.isalnum()):
+            return {"data": STTClient._build_form(audio_data, language)}
+
+        prologue, epilogue, content_type = _multipart_envelope(language)
+        return {
+            "data": _iter_body(prologue, audio_data, epilogue),
+            "headers": {"Content-Type": content_type},
+        }
+
+    @staticmethod
+    def _build_form(audio_data: bytes, language: str) -> aiohttp.FormData:
+        """
+        Build the multipart form of a transcription request
+
+        Args:
+            audio_data: Audio data in WAV format
+            language: Language code
+
+        Returns:
+            Form data with the audio file, language and task
+        """
+        data = aiohttp.FormData()
+        # Raw bytes become a BytesPayload written straight from the buffer (no BytesIO copy)
+        data.add_field(
+            "file",
+            audio_data,
+            filename="audio.wav",
+            content_type="audio/wav",
+        )
+        data.add_field("language", language)
+        data.add_field("task", "transcribe")
+        return data
+
     async def health_check(self) -> bool:
         """
-        Check if STT service is healthy
+        Check if STT service is healthy (cached for HEALTH_TTL_S)
 
         Returns:
             True if healthy, False otherwise
         """
+        return await self._health.get()
+
+    async def _probe_health(self) -> bool:
+        """Query the STT service health endpoint"""
         if not self.session:
             await self.start()
 
         try:
-            url = f"{self.base_url}/health"
+            url = self._health_url
             async with self.session.get(url) as response:
                 if response.status == 200:
-                    result = await response.json()
+                    result = orjson.loads(await response.read())
                     logger.debug(f"STT health check: {result.get('status')}")
                     return result.get("status") == "healthy"
                 return False
@@ -133,7 +212,38 @@ class STTClient:
             logger.error(f"STT health check error: {e}")
             return False
 
-    def __del__(self):
-        """Cleanup on deletion"""
-        if self.session:
-            logger.warning("STTClient deleted with active session")
+
+@lru_cache(maxsize=32)
+def _multipart_envelope(language: str) -> Tuple[bytes, bytes, str]:
+    """
+    Encode the multipart parts around the audio of a transcription request
+
+    Args:
+        language: Language code (ASCII letters and digits only)
+
+    Returns:
+        Bytes before the audio, bytes after it, and the Content-Type header
+    """
+    prologue = (
+        f"--{_BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="language"\r\n\r\n'
+        f"{language}\r\n"
+        f"--{_BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="task"\r\n\r\n'
+        "transcribe\r\n"
+        f"--{_BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="audio.wav"\r\n'
+        "Content-Type: audio/wav\r\n\r\n"
+    ).encode()
+    epilogue = f"\r\n--{_BOUNDARY}--\r\n".encode()
+    return prologue, epilogue, f"multipart/form-data; boundary={_BOUNDARY}"
+
+
+async def _iter_body(*parts: bytes) -> AsyncIterator[bytes]:
+    """Yield the parts of a body as written, without joining them into one copy"""
+    for part in parts:
+        yield part
+
+
+# Global client instance, shared by all calls
+stt_client = STTClient()
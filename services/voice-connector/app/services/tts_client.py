@@ -4,13 +4,27 @@ Handles communication with the Text-to-Speech service
 """
 import aiohttp
 import asyncio
-from typing import Optional, Dict, Any
+import orjson
+from collections import OrderedDict
+from typing import AsyncIterator, Optional, Dict, Any, Tuple
+from yarl import URL
+from app.core.bulkhead import Bulkhead, BulkheadFullError
+from app.core.circuit import CircuitBreaker, CircuitOpenError
 from app.core.config import settings
+from app.core.health_cache import HealthCache
+from app.core.http_session import JSON_HEADERS, get_session
 from app.core.logging_config import get_logger
+from app.core.retry import fetch, with_retry
 from app.models.schemas import SynthesisResponse
 
 logger = get_logger(__name__)
 
+# Read size when streaming a stored clip, bounding memory per call
+AUDIO_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Pre-serialized synthesis payloads are kept for at most this many (voice, speed) pairs
+MAX_PAYLOAD_PREFIXES = 64
+
 
 class TTSClient:
     """Client for TTS service communication"""
@@ -23,23 +37,44 @@ class TTSClient:
             base_url: TTS service base URL
         """
         self.base_url = base_url or settings.TTS_SERVICE_URL
+        # Endpoint URLs, parsed once instead of per request
+        self._synthesize_url = URL(f"{self.base_url}/synthesize")
+        self._synthesize_stream_url = URL(f"{self.base_url}/synthesize/stream")
+        self._health_url = URL(f"{self.base_url}/health")
         self.session: Optional[aiohttp.ClientSession] = None
+        self._health = HealthCache(self._probe_health)
+        self._breaker = CircuitBreaker("TTS")
+        self._bulkhead = Bulkhead("TTS", settings.TTS_MAX_INFLIGHT)
+        self._storage_breaker = CircuitBreaker("Audio storage")  # presigned URLs point at MinIO
+        self._phrases: "OrderedDict[Tuple[str, str, float], bytes]" = OrderedDict()
+        # (text, voice, speed) -> (expiry, response), LRU ordered
+        self._syntheses: "OrderedDict[Tuple[str, str, float], Tuple[float, SynthesisResponse]]" = OrderedDict()
+        self._synthesis_tasks: Dict[Tuple[str, str, float], asyncio.Task] = {}
+        # (voice, speed) -> serialized payload up to the text value
+        self._payload_prefixes: Dict[Tuple[str, float], bytes] = {}
         logger.info(f"TTSClient initialized with URL: {self.base_url}")
 
     async def start(self) -> None:
         """Start the client session"""
         if not self.session:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            self.session = await get_session()
             logger.info("TTS client session started")
 
     async def stop(self) -> None:
-        """Stop the client session"""
+        """Stop the client session (the shared session is closed by close_session)"""
         if self.session:
-            await self.session.close()
             self.session = None
             logger.info("TTS client session stopped")
 
+    async def __aenter__(self) -> "TTSClient":
+        """Start the client for an `async with` block"""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Stop the client when the `async with` block exits"""
+        await self.stop()
+
     async def synthesize(
         self,
         text: str,
@@ -50,6 +85,55 @@ class TTSClient:
         """
         Synthesize speech from text
 
+        Successful results are cached for TTS_CACHE_TTL_S (LRU of
+        TTS_CACHE_SIZE entries), and concurrent identical requests share
+        one upstream call.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice ID to use
+            speed: Speech speed multiplier (0.5 - 2.0)
+            session_id: Session ID for logging
+
+        Returns:
+            SynthesisResponse or None if failed
+        """
+        key = (text, voice, speed)
+        loop = asyncio.get_running_loop()
+
+        cached = self._syntheses.get(key)
+        if cached is not None:
+            expires_at, synthesis = cached
+            if expires_at > loop.time():
+                self._syntheses.move_to_end(key)
+                logger.debug(f"Synthesis cache hit (session: {session_id})")
+                return synthesis
+            del self._syntheses[key]
+
+        task = self._synthesis_tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(self._synthesize(text, voice, speed, session_id))
+            self._synthesis_tasks[key] = task
+            task.add_done_callback(lambda _: self._synthesis_tasks.pop(key, None))
+
+        # Shielded so a cancelled caller does not cancel the others' request
+        synthesis = await asyncio.shield(task)
+        if synthesis is not None and key not in self._syntheses:
+            self._syntheses[key] = (loop.time() + settings.TTS_CACHE_TTL_S, synthesis)
+            if len(self._syntheses) > settings.TTS_CACHE_SIZE:
+                self._syntheses.popitem(last=False)
+        return synthesis
+
+    async def _synthesize(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        session_id: Optional[str],
+    ) -> Optional[SynthesisResponse]:
+        """
+        Request a synthesis from the TTS service
+
         Args:
             text: Text to synthesize
             voice: Voice ID to use
@@ -63,44 +147,49 @@ class TTSClient:
             await self.start()
 
         try:
-            url = f"{self.base_url}/synthesize"
+            url = self._synthesize_url
 
-            payload = {
-                "text": text,
-                "voice": voice,
-                "speed": speed,
-            }
+            request = self._synthesis_request(text, voice, speed)
 
             logger.info(
-                f"Sending synthesis request to {url} "
-                f"(session: {session_id}, text_len: {len(text)})"
+                "Sending synthesis request to %s (session: %s, text_len: %d)",
+                url, session_id, len(text),
             )
 
-            async with self.session.post(url, json=payload) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    logger.info(
-                        f"Synthesis successful "
-                        f"(session: {session_id}, "
-                        f"duration: {result.get('duration_ms')}ms, "
-                        f"time: {result.get('processing_time_ms')}ms)"
-                    )
-
-                    return SynthesisResponse(
-                        audio_url=result.get("audio_url", ""),
-                        duration_ms=result.get("duration_ms", 0),
-                        processing_time_ms=result.get("processing_time_ms", 0),
-                        text=result.get("text", text),
-                        format=result.get("format", "wav"),
-                    )
-                else:
-                    error_text = await response.text()
-                    logger.error(
-                        f"Synthesis failed with status {response.status}: "
-                        f"{error_text} (session: {session_id})"
-                    )
-                    return None
+            response = await self._breaker.call(lambda: self._bulkhead.call(lambda: with_retry(
+                lambda: fetch(self.session, "POST", url, **request),
+                f"Synthesis (session: {session_id})",
+            )))
+
+            if response.status == 200:
+                result = response.body
+                duration_ms = result.get("duration_ms", 0)
+                processing_time_ms = result.get("processing_time_ms", 0)
+                logger.info(
+                    "Synthesis successful (session: %s, duration: %sms, time: %sms)",
+                    session_id, duration_ms, processing_time_ms,
+                )
 
+                return SynthesisResponse(
+                    audio_url=result.get("audio_url", ""),
+                    duration_ms=duration_ms,
+                    processing_time_ms=processing_time_ms,
+                    text=result.get("text", text),
+                    format=result.get("format", "wav"),
+                )
+            else:
+                logger.error(
+                    f"Synthesis failed with status {response.status}: "
+                    f"{response.body} (session: {session_id})"
+                )
+                return None
+
+        except BulkheadFullError as e:
+            logger.warning(f"{e}, request rejected")
+            return None
+        except CircuitOpenError:
+            logger.debug("TTS circuit open, request skipped")
+            return None
         except asyncio.TimeoutError:
             logger.error(f"Synthesis timeout (session: {session_id})")
             return None
@@ -108,52 +197,290 @@ class TTSClient:
             logger.error(f"Synthesis error: {e} (session: {session_id})")
             return None
 
-    async def download_audio(self, audio_url: str) -> Optional[bytes]:
+    def _synthesis_request(self, text: str, voice: str, speed: float) -> Dict[str, Any]:
         """
-        Download audio from URL
+        Build the body arguments of a synthesis request
+
+        With TTS_PREBUILT_PAYLOAD, the voice and speed part of the JSON body
+        is serialized once per pair and only the text is encoded per call.
 
         Args:
-            audio_url: URL to download audio from
+            text: Text to synthesize
+            voice: Voice ID to use
+            speed: Speech speed multiplier
 
         Returns:
-            Audio bytes or None if failed
+            Keyword arguments for session.request
+        """
+        if not settings.TTS_PREBUILT_PAYLOAD:
+            return {"json": {"text": text, "voice": voice, "speed": speed}}
+
+        prefix = self._payload_prefixes.get((voice, speed))
+        if prefix is None:
+            prefix = orjson.dumps({"voice": voice, "speed": speed})[:-1] + b',"text":'
+            if len(self._payload_prefixes) < MAX_PAYLOAD_PREFIXES:
+                self._payload_prefixes[(voice, speed)] = prefix
+        return {"data": prefix + orjson.dumps(text) + b"}", "headers": JSON_HEADERS}
+
+    async def synthesize_stream(
+        self,
+        text: str,
+        voice: str = "default",
+        speed: float = 1.0,
+        session_id: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize speech and yield the audio as it arrives
+
+        Uses the TTS service's streaming endpoint, so the first chunk can be
+        played while the rest is still being synthesized, without the
+        presigned URL and the separate download.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice ID to use
+            speed: Speech speed multiplier (0.5 - 2.0)
+            session_id: Session ID for logging
+
+        Yields:
+            Audio chunks (MP3); nothing if the request failed
         """
         if not self.session:
             await self.start()
 
         try:
-            logger.debug(f"Downloading audio from {audio_url}")
+            url = self._synthesize_stream_url
 
-            async with self.session.get(audio_url) as response:
-                if response.status == 200:
-                    audio_data = await response.read()
-                    logger.info(f"Downloaded {len(audio_data)} bytes of audio")
-                    return audio_data
-                else:
-                    logger.error(
-                        f"Audio download failed with status {response.status}"
-                    )
-                    return None
+            request = self._synthesis_request(text, voice, speed)
+
+            logger.info(
+                "Sending streaming synthesis request to %s (session: %s, text_len: %d)",
+                url, session_id, len(text),
+            )
+
+            # Retried only until the response starts; the stream itself is not replayed
+            # The slot is held until the stream ends, not just until the headers
+            async with self._bulkhead:
+                response = await self._breaker.call(lambda: with_retry(
+                    lambda: self.session.post(url, **request),
+                    f"Streaming synthesis (session: {session_id})",
+                ))
+
+                async with response:
+                    if response.status != 200:
+                        error_text = (await response.read()).decode("utf-8", "replace")
+                        logger.error(
+                            f"Streaming synthesis failed with status {response.status}: "
+                            f"{error_text} (session: {session_id})"
+                        )
+                        return
+
+                    async for chunk in response.content.iter_any():
+                        yield chunk
+
+        except BulkheadFullError as e:
+            logger.warning(f"{e}, request rejected")
+            return
+        except CircuitOpenError:
+            logger.debug("TTS circuit open, request skipped")
+            return
+        except asyncio.TimeoutError:
+            logger.error(f"Streaming synthesis timeout (session: {session_id})")
+        except Exception as e:
+            logger.error(f"Streaming synthesis error: {e} (session: {session_id})")
+
+    async def synthesize_audio(
+        self,
+        text: str,
+        voice: str = "default",
+        speed: float = 1.0,
+        session_id: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize speech and yield the audio, inline when the service can
+
+        Tries the streaming endpoint first. If it yields nothing (not
+        deployed or failed before the first byte), falls back to a
+        synthesis to storage and a download of the presigned URL over the
+        same pooled connections. A stream that fails part way is not retried,
+        since its audio has already been played.
 
+        Args:
+            text: Text to synthesize
+            voice: Voice ID to use
+            speed: Speech speed multiplier (0.5 - 2.0)
+            session_id: Session ID for logging
+
+        Yields:
+            Audio chunks; nothing if both paths failed
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        first_byte_at = None
+        sent_bytes = 0
+        path = "inline"
+
+        async for chunk in self.synthesize_stream(text, voice, speed, session_id):
+            if first_byte_at is None:
+                first_byte_at = loop.time()
+            sent_bytes += len(chunk)
+            yield chunk
+
+        synthesized_at = loop.time()
+        if not sent_bytes:
+            path = "url"
+            synthesis = await self.synthesize(text, voice, speed, session_id)
+            synthesized_at = loop.time()
+            if synthesis and synthesis.audio_url:
+                async for chunk in self.stream_audio(synthesis.audio_url):
+                    if first_byte_at is None:
+                        first_byte_at = loop.time()
+                    sent_bytes += len(chunk)
+                    yield chunk
+
+        finished = loop.time()
+        logger.info(
+            "Synthesized audio (session: %s, path: %s, bytes: %d, synthesis: %.0fms, "
+            "first byte: %sms, total: %.0fms)",
+            session_id, path, sent_bytes, (synthesized_at - started) * 1000,
+            "-" if first_byte_at is None else f"{(first_byte_at - started) * 1000:.0f}",
+            (finished - started) * 1000,
+        )
+
+    async def download_audio(self, audio_url: str) -> Optional[bytes]:
+        """
+        Download audio from URL
+
+        Args:
+            audio_url: URL to download audio from
+
+        Returns:
+            Audio bytes or None if failed
+        """
+        try:
+            audio = bytearray()
+            async for chunk in self._iter_audio(audio_url):
+                audio += chunk
+
+        except CircuitOpenError:
+            logger.debug("Audio storage circuit open, request skipped")
+            return None
         except Exception as e:
             logger.error(f"Audio download error: {e}")
             return None
 
+        if not audio:
+            return None
+        logger.info(f"Downloaded {len(audio)} bytes of audio")
+        return bytes(audio)
+
+    async def synthesize_phrase(
+        self,
+        text: str,
+        voice: str = "default",
+        speed: float = 1.0,
+    ) -> Optional[bytes]:
+        """
+        Get audio of a fixed phrase, synthesizing it only on a cache miss
+
+        Recently used phrases are kept in an LRU of PHRASE_CACHE_SIZE
+        entries, so prompts repeated on every call skip the TTS round trip
+        and the audio download.
+
+        Args:
+            text: Phrase to synthesize
+            voice: Voice ID to use
+            speed: Speech speed multiplier
+
+        Returns:
+            Audio bytes or None if failed
+        """
+        key = (text, voice, speed)
+        audio = self._phrases.get(key)
+        if audio is not None:
+            self._phrases.move_to_end(key)
+            return audio
+
+        synthesis = await self.synthesize(text=text, voice=voice, speed=speed)
+        if not synthesis or not synthesis.audio_url:
+            return None
+
+        audio = await self.download_audio(synthesis.audio_url)
+        if audio:
+            self._phrases[key] = audio
+            if len(self._phrases) > settings.PHRASE_CACHE_SIZE:
+                self._phrases.popitem(last=False)
+        return audio
+
+    async def stream_audio(self, audio_url: str) -> AsyncIterator[bytes]:
+        """
+        Download audio from URL in chunks
+
+        Args:
+            audio_url: URL to download audio from
+
+        Yields:
+            Audio chunks of up to AUDIO_STREAM_CHUNK_SIZE bytes; nothing if failed
+        """
+        try:
+            async for chunk in self._iter_audio(audio_url):
+                yield chunk
+
+        except CircuitOpenError:
+            logger.debug("Audio storage circuit open, request skipped")
+            return
+        except Exception as e:
+            logger.error(f"Audio download error: {e}")
+
+    async def _iter_audio(self, audio_url: str) -> AsyncIterator[bytes]:
+        """
+        Read stored audio in chunks as they arrive, raising on errors
+
+        Args:
+            audio_url: URL to download audio from
+
+        Yields:
+            Audio chunks of up to AUDIO_STREAM_CHUNK_SIZE bytes; nothing on a non-200 status
+        """
+        if not self.session:
+            await self.start()
+
+        logger.debug(f"Streaming audio from {audio_url}")
+
+        response = await self._storage_breaker.call(lambda: with_retry(
+            lambda: self.session.get(audio_url),
+            "Audio download",
+        ))
+
+        async with response:
+            if response.status != 200:
+                logger.error(
+                    f"Audio download failed with status {response.status}"
+                )
+                return
+
+            async for chunk in response.content.iter_chunked(AUDIO_STREAM_CHUNK_SIZE):
+                yield chunk
+
     async def health_check(self) -> bool:
         """
-        Check if TTS service is healthy
+        Check if TTS service is healthy (cached for HEALTH_TTL_S)
 
         Returns:
             True if healthy, False otherwise
         """
+        return await self._health.get()
+
+    async def _probe_health(self) -> bool:
+        """Query the TTS service health endpoint"""
         if not self.session:
             await self.start()
 
         try:
-            url = f"{self.base_url}/health"
+            url = self._health_url
             async with self.session.get(url) as response:
                 if response.status == 200:
-                    result = await response.json()
+                    result = orjson.loads(await response.read())
                     logger.debug(f"TTS health check: {result.get('status')}")
                     return result.get("status") == "healthy"
                 return False
@@ -161,7 +488,6 @@ class TTSClient:
             logger.error(f"TTS health check error: {e}")
             return False
 
-    def __del__(self):
-        """Cleanup on deletion"""
-        if self.session:
-            logger.warning("TTSClient deleted with active session")
+
+# Global client instance, shared by all calls
+tts_client = TTSClient()
@@ -0,0 +1,48 @@
+"""
+WebSocket control message helpers
+Control messages are JSON text frames (binary frames carry audio),
+serialized with orjson
+"""
+from typing import Any, Dict
+import orjson
+from fastapi import WebSocket
+
+# Fixed control frames, encoded once
+PONG_FRAME = orjson.dumps({"type": "pong"}).decode()
+HEARTBEAT_FRAME = orjson.dumps({"type": "heartbeat"}).decode()
+
+# Bracket the binary frames of one audio reply; the frames in between are
+# consecutive pieces of a single MP3 stream, not standalone files
+AUDIO_START_FRAME = orjson.dumps({"type": "audio_start", "format": "audio/mpeg"}).decode()
+AUDIO_END_FRAME = orjson.dumps({"type": "audio_end"}).decode()
+
+# Complete ASGI send events for the fixed frames, for websocket.send(),
+# so send_text() does not build a new event dict per frame
+PONG_MESSAGE = {"type": "websocket.send", "text": PONG_FRAME}
+HEARTBEAT_MESSAGE = {"type": "websocket.send", "text": HEARTBEAT_FRAME}
+AUDIO_START_MESSAGE = {"type": "websocket.send", "text": AUDIO_START_FRAME}
+AUDIO_END_MESSAGE = {"type": "websocket.send", "text": AUDIO_END_FRAME}
+
+
+def parse_message(text: str) -> Dict[str, Any]:
+    """
+    Parse a JSON control message
+
+    Args:
+        text: Text frame payload
+
+    Returns:
+        Decoded message
+    """
+    return orjson.loads(text)
+
+
+async def send_json(websocket: WebSocket, message: Dict[str, Any]) -> None:
+    """
+    Send a control message as a JSON text frame
+
+    Args:
+        websocket: Client WebSocket
+        message: Message to send
+    """
+    await websocket.send_text(orjson.dumps(message).decode())
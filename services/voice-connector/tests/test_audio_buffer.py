@@ -0,0 +1,131 @@
+"""
+Tests for call audio buffering and silence detection
+"""
+import io
+import wave
+import numpy as np
+import pytest
+from app.services.audio_buffer import AudioBuffer
+
+SAMPLE_RATE = 16000
+
+
+def pcm(ms: int, amplitude: float) -> bytes:
+    """16-bit mono sine at 440 Hz with a peak of amplitude * full scale"""
+    t = np.arange(SAMPLE_RATE * ms // 1000) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * 440 * t) * amplitude * 32767).astype(np.int16).tobytes()
+
+
+def make_buffer(**overrides) -> AudioBuffer:
+    """1 s buffer of 100 ms chunks, flushed after 300 ms of silence"""
+    options = dict(
+        sample_rate=SAMPLE_RATE,
+        chunk_size=3200,
+        buffer_duration_ms=1000,
+        silence_threshold=0.01,
+        silence_duration_ms=300,
+    )
+    options.update(overrides)
+    return AudioBuffer(**options)
+
+
+def test_chunk_silence_matches_rms_threshold():
+    """The integer sum-of-squares check agrees with rms / 32768 < threshold"""
+    buffer = make_buffer()
+    # A sine's RMS is peak / sqrt(2): 0.013 peak is just under the 0.01 threshold, 0.015 just over
+    for amplitude in (0.0, 0.005, 0.013, 0.015, 0.5):
+        chunk = pcm(100, amplitude)
+        samples = np.frombuffer(chunk, dtype=np.int16).astype(np.float64)
+        rms = np.sqrt(np.mean(samples ** 2)) / 32768
+        assert buffer._is_silent(chunk) == (rms < 0.01), amplitude
+
+
+def test_get_audio_is_a_valid_wav():
+    """The patched header template describes exactly the buffered PCM"""
+    buffer = make_buffer()
+    audio = pcm(100, 0.5) + pcm(100, 0.2)
+    buffer.add_chunk(audio[:3200])
+    buffer.add_chunk(audio[3200:])
+
+    with wave.open(io.BytesIO(buffer.get_audio()), "rb") as wav:
+        assert wav.getnchannels() == 1
+        assert wav.getsampwidth() == 2
+        assert wav.getframerate() == SAMPLE_RATE
+        assert wav.getnframes() == len(audio) // 2
+        assert wav.readframes(wav.getnframes()) == audio
+
+
+def test_get_audio_of_empty_buffer_is_none():
+    assert make_buffer().get_audio() is None
+
+
+def test_clear_reuses_the_buffer_for_the_next_utterance():
+    """Audio from before clear() never leaks into the next WAV"""
+    buffer = make_buffer()
+    buffer.add_chunk(pcm(300, 0.5))
+    buffer.get_audio()
+    buffer.clear()
+
+    second = pcm(100, 0.2)
+    buffer.add_chunk(second)
+
+    with wave.open(io.BytesIO(buffer.get_audio()), "rb") as wav:
+        assert wav.readframes(wav.getnframes()) == second
+
+
+def test_oversized_chunks_grow_the_buffer():
+    """Chunks larger than chunk_size past the preallocated size are kept whole"""
+    buffer = make_buffer()
+    audio = pcm(1500, 0.5)
+    for start in range(0, len(audio), 9600):
+        buffer.add_chunk(audio[start:start + 9600])
+
+    assert buffer.should_flush()
+    with wave.open(io.BytesIO(buffer.get_audio()), "rb") as wav:
+        assert wav.readframes(wav.getnframes()) == audio
+
+
+@pytest.mark.parametrize("chunk_ms", [20, 100, 250])
+def test_silence_is_counted_per_window_whatever_the_chunk_size(chunk_ms):
+    """300 ms of silence after speech flushes after 300 ms, not after N chunks"""
+    buffer = make_buffer(chunk_size=SAMPLE_RATE * 2 * chunk_ms // 1000)
+    buffer.add_chunk(pcm(200, 0.5))
+    assert not buffer.should_flush()
+
+    silence = pcm(300, 0.0)
+    step = SAMPLE_RATE * 2 * chunk_ms // 1000
+    for start in range(0, len(silence), step):
+        assert not buffer.should_flush()
+        buffer.add_chunk(silence[start:start + step])
+
+    # The 300 ms run is complete with the last whole window
+    assert buffer.should_flush()
+    assert buffer.silence_ms == 300
+
+
+def test_speech_resets_the_silence_run():
+    buffer = make_buffer(buffer_duration_ms=2000)
+    buffer.add_chunk(pcm(200, 0.0) + pcm(100, 0.5) + pcm(200, 0.0))
+
+    assert not buffer.should_flush()
+    assert buffer.silence_ms == 200
+
+
+def test_trailing_silence_is_not_stored_once_mostly_full():
+    """Past 3/4 full with a pause under way, silent chunks are counted but dropped"""
+    buffer = make_buffer(silence_duration_ms=400)
+    speech = pcm(700, 0.5)
+    buffer.add_chunk(speech)
+    buffer.add_chunk(pcm(100, 0.0))
+    buffer.add_chunk(pcm(100, 0.0))
+    assert not buffer.should_flush()
+    assert buffer.silence_ms == 200
+
+    buffer.add_chunk(pcm(100, 0.0))  # dropped: 900 ms stored, pause at half the flush duration
+    buffer.add_chunk(pcm(100, 0.0))
+
+    assert buffer.should_flush()
+    assert buffer.silence_ms == 400
+    assert buffer.duration_ms == 1100
+    with wave.open(io.BytesIO(buffer.get_audio()), "rb") as wav:
+        assert wav.getnframes() * 1000 // SAMPLE_RATE == 900
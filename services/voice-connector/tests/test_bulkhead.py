@@ -0,0 +1,63 @@
+"""
+Tests for the upstream bulkhead
+"""
+import asyncio
+import pytest
+from app.core.bulkhead import Bulkhead, BulkheadFullError
+
+
+def test_rejects_beyond_max_inflight():
+    async def main():
+        bulkhead = Bulkhead("test", max_inflight=2, queue_wait_s=0.01)
+        release = asyncio.Event()
+
+        async def hold():
+            await release.wait()
+            return "done"
+
+        held = [asyncio.create_task(bulkhead.call(hold)) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(BulkheadFullError):
+            await bulkhead.call(hold)
+
+        release.set()
+        assert await asyncio.gather(*held) == ["done", "done"]
+
+    asyncio.run(main())
+
+
+def test_waiter_gets_slot_freed_within_queue_wait():
+    async def main():
+        bulkhead = Bulkhead("test", max_inflight=1, queue_wait_s=1.0)
+        release = asyncio.Event()
+
+        async def hold():
+            await release.wait()
+
+        held = asyncio.create_task(bulkhead.call(hold))
+        await asyncio.sleep(0)
+        asyncio.get_running_loop().call_later(0.01, release.set)
+
+        async def quick():
+            return "ok"
+
+        assert await bulkhead.call(quick) == "ok"
+        await held
+
+    asyncio.run(main())
+
+
+def test_slot_released_on_error():
+    async def main():
+        bulkhead = Bulkhead("test", max_inflight=1, queue_wait_s=0)
+
+        async def fail():
+            raise ValueError("upstream error")
+
+        with pytest.raises(ValueError):
+            await bulkhead.call(fail)
+
+        async with bulkhead:
+            pass
+
+    asyncio.run(main())
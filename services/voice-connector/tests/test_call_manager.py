@@ -0,0 +1,97 @@
+"""
+Tests for the voice call manager
+"""
+import asyncio
+import pytest
+from app.services.call_manager import AUDIO_QUEUE_SIZE, VoiceCallManager
+from app.utils.messages import AUDIO_END_FRAME, AUDIO_START_FRAME
+
+
+class RecordingWebSocket:
+    """WebSocket recording sent frames: bytes for audio, str for control messages"""
+
+    def __init__(self):
+        self.frames = []
+
+    async def send(self, message: dict) -> None:
+        self.frames.append(message["text"])
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.frames.append(data)
+
+
+class HangUpWebSocket(RecordingWebSocket):
+    """WebSocket whose peer hangs up after the first audio frame"""
+
+    async def send_bytes(self, data: bytes) -> None:
+        if any(isinstance(frame, bytes) for frame in self.frames):
+            raise ConnectionResetError("caller hung up")
+        await super().send_bytes(data)
+
+
+def make_manager(websocket) -> VoiceCallManager:
+    return VoiceCallManager(
+        websocket, call_id="call", session_id="session", stt=object(), tts=object(), orchestrator=object()
+    )
+
+
+def test_stream_audio_releases_upstream_when_send_fails():
+    """A hang-up mid-reply closes the TTS stream and frees its slot"""
+    async def main():
+        slot = asyncio.Semaphore(1)
+        closed = asyncio.Event()
+
+        async def synthesize():
+            # Like TTSClient.synthesize_stream: holds a bulkhead slot while streaming
+            async with slot:
+                try:
+                    # More chunks than the queue holds, so the producer blocks on a full queue
+                    for _ in range(AUDIO_QUEUE_SIZE * 4):
+                        yield b"\x00" * 160
+                finally:
+                    closed.set()
+
+        manager = make_manager(HangUpWebSocket())
+        tasks = asyncio.all_tasks()
+
+        with pytest.raises(ConnectionResetError):
+            await asyncio.wait_for(manager._stream_audio(synthesize()), timeout=1.0)
+
+        assert closed.is_set()
+        assert not slot.locked()
+        assert asyncio.all_tasks() == tasks
+
+    asyncio.run(main())
+
+
+def test_stream_audio_brackets_chunks_with_control_frames():
+    """Every chunk is sent, in order, between audio_start and audio_end"""
+    async def main():
+        async def synthesize():
+            for i in range(AUDIO_QUEUE_SIZE * 2):
+                yield bytes([i]) * 10
+
+        websocket = RecordingWebSocket()
+        sent = await make_manager(websocket)._stream_audio(synthesize())
+        return sent, websocket.frames
+
+    sent, frames = asyncio.run(main())
+    assert sent == AUDIO_QUEUE_SIZE * 2 * 10
+    assert frames == [
+        AUDIO_START_FRAME,
+        *(bytes([i]) * 10 for i in range(AUDIO_QUEUE_SIZE * 2)),
+        AUDIO_END_FRAME,
+    ]
+
+
+def test_stream_audio_sends_nothing_without_audio():
+    async def main():
+        async def synthesize():
+            return
+            yield
+
+        websocket = RecordingWebSocket()
+        sent = await make_manager(websocket)._stream_audio(synthesize())
+        return sent, websocket.frames
+
+    assert asyncio.run(main()) == (0, [])
@@ -0,0 +1,88 @@
+"""
+Tests for the upstream circuit breaker
+"""
+import asyncio
+import pytest
+from app.core.bulkhead import BulkheadFullError
+from app.core.circuit import CircuitBreaker, CircuitOpenError, CircuitState
+from app.core.retry import HTTPResult
+
+
+def call(breaker: CircuitBreaker, outcome):
+    """Run one call through the breaker; returns the result or raised error"""
+    async def operation():
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return HTTPResult(outcome, None)
+
+    async def main():
+        try:
+            return await breaker.call(operation)
+        except Exception as e:
+            return e
+
+    return asyncio.run(main())
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("test", failure_threshold=3, recovery_s=60)
+    for _ in range(2):
+        call(breaker, ConnectionError())
+    assert breaker.state is CircuitState.CLOSED
+
+    call(breaker, 503)
+    assert breaker.state is CircuitState.OPEN
+    assert isinstance(call(breaker, 200), CircuitOpenError)
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_s=60)
+    call(breaker, 500)
+    call(breaker, 200)
+    call(breaker, 500)
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_client_errors_do_not_count():
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_s=60)
+    call(breaker, 404)
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_bulkhead_rejection_does_not_count():
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_s=60)
+    assert isinstance(call(breaker, BulkheadFullError("full")), BulkheadFullError)
+    assert breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.parametrize("probe, state", [(200, CircuitState.CLOSED), (503, CircuitState.OPEN)])
+def test_half_open_probe(probe, state):
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_s=0)
+    call(breaker, 503)
+    assert breaker.state is CircuitState.OPEN
+
+    result = call(breaker, probe)
+    assert result.status == probe
+    assert breaker.state is state
+
+
+def test_half_open_lets_one_probe_through():
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_s=0)
+    call(breaker, 503)
+
+    async def main():
+        release = asyncio.Event()
+
+        async def slow_probe():
+            await release.wait()
+            return HTTPResult(200, None)
+
+        probe = asyncio.create_task(breaker.call(slow_probe))
+        await asyncio.sleep(0)
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(slow_probe)
+        release.set()
+        return await probe
+
+    assert asyncio.run(main()).status == 200
+    assert breaker.state is CircuitState.CLOSED
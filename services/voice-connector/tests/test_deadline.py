@@ -0,0 +1,73 @@
+"""
+Tests for per-turn deadlines
+"""
+import asyncio
+import pytest
+from app.core.deadline import deadline, time_left
+from app.core.retry import HTTPResult, fetch
+
+
+class RecordingSession:
+    """Client session answering 200 {} and recording each request's kwargs"""
+
+    status = 200
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append(kwargs)
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def read(self) -> bytes:
+        return b"{}"
+
+
+def test_block_is_cancelled_at_the_deadline():
+    async def main():
+        async with deadline(0.01):
+            await asyncio.sleep(1)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(main())
+
+
+def test_inner_deadline_cannot_extend_the_outer_one():
+    async def main():
+        async with deadline(0.05):
+            async with deadline(10):
+                assert time_left() <= 0.05
+                await asyncio.sleep(1)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(main())
+
+
+def test_time_left_is_none_outside_a_deadline():
+    async def main():
+        async with deadline(1):
+            pass
+        return time_left()
+
+    assert asyncio.run(main()) is None
+
+
+def test_requests_get_the_time_left_as_timeout():
+    session = RecordingSession()
+
+    async def main():
+        assert await fetch(session, "GET", "http://upstream") == HTTPResult(200, {})
+        async with deadline(5):
+            await fetch(session, "GET", "http://upstream")
+
+    asyncio.run(main())
+
+    outside, inside = session.requests
+    assert "timeout" not in outside
+    assert 4 < inside["timeout"].total <= 5
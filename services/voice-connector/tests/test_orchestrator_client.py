@@ -0,0 +1,137 @@
+"""
+Tests for the orchestrator client's turn batching and duplicate coalescing
+"""
+import asyncio
+import pytest
+from app.core.retry import HTTPResult
+from app.services import orchestrator_client as module
+from app.services.orchestrator_client import OrchestratorClient
+
+
+def make_client(monkeypatch, respond) -> OrchestratorClient:
+    """Client whose batch POSTs are answered by respond(requests) -> HTTPResult"""
+    async def fetch(session, method, url, json=None, **kwargs):
+        return await respond(json["requests"])
+
+    monkeypatch.setattr(module, "fetch", fetch)
+    client = OrchestratorClient("http://orchestrator")
+    client.session = object()
+    return client
+
+
+def turn_result(request):
+    return {"status": 200, "result": {"response": request["user_message"].upper(), "session_id": request["session_id"]}}
+
+
+async def send_all(client, count):
+    return await asyncio.gather(
+        *(client.send_message(f"session-{i}", f"message {i}") for i in range(count))
+    )
+
+
+def test_batch_response_is_split_per_turn(monkeypatch):
+    async def respond(requests):
+        return HTTPResult(200, {"responses": [turn_result(request) for request in requests]})
+
+    async def main():
+        client = make_client(monkeypatch, respond)
+        try:
+            return await send_all(client, 3)
+        finally:
+            await client.stop()
+
+    responses = asyncio.run(main())
+    assert [response.response for response in responses] == ["MESSAGE 0", "MESSAGE 1", "MESSAGE 2"]
+
+
+@pytest.mark.parametrize("responses", [
+    lambda requests: [turn_result(request) for request in requests[:-1]],  # one response short
+    lambda requests: [{"status": 200} for _ in requests],  # no result
+])
+def test_malformed_batch_response_fails_every_turn(monkeypatch, responses):
+    async def respond(requests):
+        return HTTPResult(200, {"responses": responses(requests)})
+
+    async def main():
+        client = make_client(monkeypatch, respond)
+        try:
+            return await asyncio.wait_for(send_all(client, 3), timeout=1.0)
+        finally:
+            await client.stop()
+
+    assert asyncio.run(main()) == [None, None, None]
+
+
+def test_stop_cancels_batches_in_flight(monkeypatch):
+    async def respond(requests):
+        await asyncio.Event().wait()
+
+    async def main():
+        client = make_client(monkeypatch, respond)
+        turn = asyncio.create_task(client._submit({"session_id": "session", "user_message": "hello"}))
+        while not client._batch_sends:
+            await asyncio.sleep(0.001)
+
+        await client.stop()
+
+        assert not client._batch_sends
+        with pytest.raises(asyncio.CancelledError):
+            await turn
+
+    asyncio.run(main())
+
+
+def make_unbatched_client(monkeypatch, release: asyncio.Event, calls: list) -> OrchestratorClient:
+    """Client sending turns one by one; each POST waits for release"""
+    async def fetch(session, method, url, json=None, **kwargs):
+        calls.append(json)
+        await release.wait()
+        return HTTPResult(200, {"response": json["user_message"].upper(), "session_id": json["session_id"]})
+
+    monkeypatch.setattr(module, "fetch", fetch)
+    client = OrchestratorClient("http://orchestrator")
+    client.session = object()
+    client._batch_max = 1
+    return client
+
+
+def test_duplicate_turns_share_one_request(monkeypatch):
+    calls = []
+
+    async def main():
+        release = asyncio.Event()
+        client = make_unbatched_client(monkeypatch, release, calls)
+        first = asyncio.create_task(client.send_message("session", "hello"))
+        second = asyncio.create_task(client.send_message("session", "hello"))
+        other = asyncio.create_task(client.send_message("session", "goodbye"))
+        await asyncio.sleep(0)
+        release.set()
+        responses = await asyncio.gather(first, second, other)
+
+        # Finished turns are forgotten: the same message later is a new turn
+        await client.send_message("session", "hello")
+        return responses
+
+    first, second, other = asyncio.run(main())
+    assert first.response == second.response == "HELLO"
+    assert other.response == "GOODBYE"
+    assert [call["user_message"] for call in calls] == ["hello", "goodbye", "hello"]
+
+
+def test_cancelled_duplicate_does_not_cancel_the_shared_request(monkeypatch):
+    calls = []
+
+    async def main():
+        release = asyncio.Event()
+        client = make_unbatched_client(monkeypatch, release, calls)
+        first = asyncio.create_task(client.send_message("session", "hello"))
+        second = asyncio.create_task(client.send_message("session", "hello"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        release.set()
+        return await second
+
+    assert asyncio.run(main()).response == "HELLO"
+    assert len(calls) == 1
@@ -0,0 +1,90 @@
+"""
+Tests for upstream request retries
+"""
+import asyncio
+from unittest import mock
+import aiohttp
+import pytest
+from app.core.config import settings
+from app.core.retry import HTTPResult, with_retry
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    """Retry immediately, three attempts"""
+    monkeypatch.setattr(settings, "HTTP_RETRY_ATTEMPTS", 3)
+    monkeypatch.setattr(settings, "HTTP_RETRY_BACKOFF_S", 0.0)
+    monkeypatch.setattr(settings, "HTTP_RETRY_MAX_BACKOFF_S", 0.0)
+
+
+def connector_error() -> aiohttp.ClientConnectorError:
+    """Connection refused before the request was sent"""
+    return aiohttp.ClientConnectorError(mock.Mock(), OSError("Connection refused"))
+
+
+def run(outcomes, idempotent=True):
+    """Run with_retry over scripted attempt outcomes; returns (result or error, attempts)"""
+    attempts = []
+
+    async def operation():
+        outcome = outcomes[len(attempts)]
+        attempts.append(outcome)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return HTTPResult(outcome, None)
+
+    async def main():
+        try:
+            return await with_retry(operation, "test request", idempotent=idempotent)
+        except Exception as e:
+            return e
+
+    return asyncio.run(main()), len(attempts)
+
+
+def test_success_is_not_retried():
+    result, attempts = run([200])
+    assert result.status == 200
+    assert attempts == 1
+
+
+def test_transient_status_is_retried():
+    result, attempts = run([503, 502, 200])
+    assert result.status == 200
+    assert attempts == 3
+
+
+def test_client_error_is_not_retried():
+    result, attempts = run([400, 200])
+    assert result.status == 400
+    assert attempts == 1
+
+
+def test_last_result_returned_when_attempts_exhausted():
+    result, attempts = run([503, 503, 503, 200])
+    assert result.status == 503
+    assert attempts == 3
+
+
+def test_transient_exception_is_retried_then_raised():
+    result, attempts = run([asyncio.TimeoutError(), connector_error(), asyncio.TimeoutError()])
+    assert isinstance(result, asyncio.TimeoutError)
+    assert attempts == 3
+
+
+def test_non_idempotent_not_retried_after_timeout():
+    result, attempts = run([asyncio.TimeoutError(), 200], idempotent=False)
+    assert isinstance(result, asyncio.TimeoutError)
+    assert attempts == 1
+
+
+def test_non_idempotent_not_retried_after_server_error():
+    result, attempts = run([503, 200], idempotent=False)
+    assert result.status == 503
+    assert attempts == 1
+
+
+def test_non_idempotent_retried_when_unsent():
+    result, attempts = run([connector_error(), 429, 200], idempotent=False)
+    assert result.status == 200
+    assert attempts == 3
@@ -0,0 +1,48 @@
+"""
+Tests for the STT client's transcription request body
+"""
+import asyncio
+import email.parser
+import email.policy
+import aiohttp
+from app.services.stt_client import STTClient
+
+
+def parse_multipart(content_type: str, body: bytes) -> dict:
+    """Parse a multipart/form-data body into {field name: (filename, content type, bytes)}"""
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    assert message.is_multipart()
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_filename(), part.get_content_type(), part.get_payload(decode=True)
+        )
+        for part in message.iter_parts()
+    }
+
+
+def test_envelope_is_a_valid_multipart_form():
+    # Audio may contain anything, including CRLF and dashes
+    audio = b"RIFF\r\n--\x00\xff" * 100
+
+    async def collect(parts):
+        return b"".join([part async for part in parts])
+
+    request = STTClient._build_body(audio, "en")
+    body = asyncio.run(collect(request["data"]))
+
+    fields = parse_multipart(request["headers"]["Content-Type"], body)
+    assert fields == {
+        "language": (None, "text/plain", b"en"),
+        "task": (None, "text/plain", b"transcribe"),
+        "file": ("audio.wav", "audio/wav", audio),
+    }
+
+
+def test_other_languages_use_form_data():
+    """Values that would need escaping in the envelope go through FormData"""
+    request = STTClient._build_body(b"RIFF", 'en"-US')
+
+    assert isinstance(request["data"], aiohttp.FormData)
+    assert "headers" not in request
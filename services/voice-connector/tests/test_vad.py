@@ -0,0 +1,32 @@
+"""
+Tests for the voice activity detection kernels
+"""
+import numpy as np
+import pytest
+from app.services._vad import _chunk_sum_squares_numpy, chunk_sum_squares
+
+
+def reference(samples: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    starts = np.concatenate(([0], ends[:-1]))
+    return np.array([np.sum(samples[s:e].astype(np.int64) ** 2) for s, e in zip(starts, ends)])
+
+
+@pytest.mark.parametrize("kernel", [chunk_sum_squares, _chunk_sum_squares_numpy])
+def test_kernel_matches_numpy_reference(kernel):
+    rng = np.random.default_rng(0)
+    samples = rng.integers(-32768, 32768, size=16000, dtype=np.int16)
+    samples[:100] = -32768  # largest square; must not overflow
+    ends = np.array([100, 1600, 1601, 8000, 16000], dtype=np.int64)
+
+    np.testing.assert_array_equal(kernel(samples, ends), reference(samples, ends))
+
+
+@pytest.mark.parametrize("kernel", [chunk_sum_squares, _chunk_sum_squares_numpy])
+def test_kernel_accepts_read_only_and_writable_samples(kernel):
+    """Chunks are read-only views of bytes, the buffer scan writable views of a bytearray"""
+    data = np.arange(-50, 50, dtype=np.int16).tobytes()
+    ends = np.array([40, 100], dtype=np.int64)
+
+    expected = reference(np.frombuffer(data, dtype=np.int16), ends)
+    np.testing.assert_array_equal(kernel(np.frombuffer(data, dtype=np.int16), ends), expected)
+    np.testing.assert_array_equal(kernel(np.frombuffer(bytearray(data), dtype=np.int16), ends), expected)